@@ -0,0 +1,28 @@
+"""Import the integration's modules without importing Home Assistant.
+
+The package ``__init__`` pulls in Home Assistant; the benchmarks only need
+the pure parsing / aggregation modules, so the package directory is
+registered as a bare package and its submodules are imported from there.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "custom_components" / "wunderground_pws"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_PACKAGE = "wunderground_pws"
+
+
+def load(module: str) -> ModuleType:
+    """Import ``wunderground_pws.<module>`` without running its ``__init__``."""
+    if _PACKAGE not in sys.modules:
+        package = types.ModuleType(_PACKAGE)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[_PACKAGE] = package
+    return importlib.import_module(f"{_PACKAGE}.{module}")
@@ -0,0 +1,148 @@
+"""Equivalence check and benchmark of the batch observation conversion.
+
+Builds N observations (default 10 000) from ``fixtures/wu_v2_observation.json``
+with randomised readings, plus malformed and rounding-boundary rows, then
+
+1. checks that ``batch.enrich_observations`` (NumPy path and the pure-Python
+   fallback) returns exactly what ``api.enrich_observation`` returns for
+   every row, compared by ``repr`` so that ``-0.0`` / ``0.0`` differences
+   count too;
+2. times the scalar loop against both batch paths.
+
+Exits with status 1 on any mismatch.  The same equivalence is tested, without
+this harness, by ``tests/test_batch.py``.  NumPy is optional; without it only
+the fallback is checked.
+
+Usage::
+
+    python benchmarks/bench_enrich_batch.py [--count N] [--number N] [--seed N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from typing import Any
+
+from _loader import FIXTURES_DIR, load
+
+api = load("api")
+batch_module = load("batch")
+
+# Fahrenheit readings whose Celsius value sits on a 0.05 boundary, pressures
+# and precipitation right at a 0.005 boundary: the rows the vectorised
+# rounding must hand back to the scalar code
+_BOUNDARY_TEMPS = [32.09, 33.17, 41.27, -0.41, 50.0]
+_BOUNDARY_INCHES = [0.0125 / 25.4, 0.0375 / 25.4]
+
+
+def _observations(count: int, seed: int) -> list[dict[str, Any]]:
+    """Return *count* observations with varied, partly malformed readings."""
+    template = json.loads((FIXTURES_DIR / "wu_v2_observation.json").read_text())
+    base = template["observations"][0]
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        imperial = {
+            **base["imperial"],
+            "temp": round(rng.uniform(-20, 105), rng.choice((0, 1, 2))),
+            "dewpt": round(rng.uniform(-30, 80), 1),
+            "heatIndex": round(rng.uniform(-20, 110), 1),
+            "windSpeed": round(rng.uniform(0, 40), 1),
+            "windGust": round(rng.uniform(0, 60), 1),
+            "pressure": round(rng.uniform(28.5, 31.0), 2),
+            "precipRate": rng.choice((0, 0, 0, round(rng.uniform(0, 2), 2))),
+            "precipTotal": round(rng.uniform(0, 3), 2),
+        }
+        row = {
+            **base,
+            "imperial": imperial,
+            "humidity": rng.choice((rng.randint(0, 100), round(rng.uniform(0, 100), 1))),
+            "winddir": rng.randint(-30, 400),
+            "uv": round(rng.uniform(0, 11), 1),
+            "solarRadiation": round(rng.uniform(0, 1000), 1),
+        }
+        kind = i % 50
+        if kind == 0:
+            imperial["temp"] = rng.choice(_BOUNDARY_TEMPS)
+        elif kind == 1:
+            imperial["precipTotal"] = rng.choice(_BOUNDARY_INCHES)
+        elif kind == 2:
+            imperial["temp"] = None
+            row["winddir"] = None
+        elif kind == 3:
+            imperial["windSpeed"] = "n/a"
+            row["humidity"] = "?"
+        elif kind == 4:
+            row["imperial"] = None
+        elif kind == 5:
+            imperial["pressure"] = str(imperial["pressure"])
+        elif kind == 6:
+            imperial["temp"] = float("nan")
+        rows.append(row)
+    return rows
+
+
+def _mismatches(expected: list[Any], actual: list[Any]) -> list[int]:
+    """Return the indices whose results differ (by repr)."""
+    if len(expected) != len(actual):
+        return list(range(max(len(expected), len(actual))))
+    return [
+        i
+        for i, (want, got) in enumerate(zip(expected, actual))
+        if repr(want) != repr(got)
+    ]
+
+
+def main() -> int:
+    """Run the equivalence check, then the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rows = _observations(args.count, args.seed)
+    expected = [api.enrich_observation(obs) for obs in rows]
+    numpy = batch_module.np
+    paths = {"fallback": lambda: _without_numpy(rows)}
+    if numpy is not None:
+        paths["numpy"] = lambda: batch_module.enrich_observations(rows)
+
+    failed = False
+    for name, func in paths.items():
+        bad = _mismatches(expected, func())
+        status = "identical" if not bad else f"{len(bad)} rows differ, e.g. #{bad[0]}"
+        print(f"equivalence [{name}]: {status}")
+        if bad:
+            failed = True
+            print(f"  scalar: {expected[bad[0]]!r}\n  batch:  {func()[bad[0]]!r}")
+    if numpy is None:
+        print("NumPy not installed: columnar path not checked")
+
+    print(f"\n{args.count} observations, best of 5 x {args.number} runs")
+    cases = {
+        "enrich_observation loop": lambda: [api.enrich_observation(obs) for obs in rows],
+        **{f"enrich_observations [{name}]": func for name, func in paths.items()},
+    }
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        baseline = baseline or best
+        print(f"{name:36s} {best * 1e3:9.2f} ms  x{baseline / best:.2f}")
+    return 1 if failed else 0
+
+
+def _without_numpy(rows: list[dict[str, Any]]) -> list[Any]:
+    """Run ``enrich_observations`` as if NumPy were not installed."""
+    numpy, batch_module.np = batch_module.np, None
+    try:
+        return batch_module.enrich_observations(rows)
+    finally:
+        batch_module.np = numpy
+
+
+if __name__ == "__main__":
+    sys.exit(main())
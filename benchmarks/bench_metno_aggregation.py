@@ -0,0 +1,132 @@
+"""Micro-benchmark: MET.no hourly → daily aggregation.
+
+Compares the one-pass ``aggregate_metno_daily`` against the previous
+implementation (datetime parsing + per-day lists, kept below verbatim) on
+the sample payload in ``fixtures/metno_compact.json``.
+
+Usage::
+
+    python benchmarks/bench_metno_aggregation.py [--number N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import Any
+
+from _loader import FIXTURES_DIR, load
+
+aggregation = load("aggregation")
+
+
+def _safe_float(value: Any) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def legacy_aggregate(timeseries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """The pre-1.5 aggregation loop of ``fetch_metno_forecast`` (UTC buckets)."""
+    daily: dict[str, dict[str, Any]] = {}
+    for entry in timeseries:
+        ts_str = entry.get("time", "")
+        try:
+            dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        date_key = dt.strftime("%Y-%m-%d")
+        instant = (entry.get("data") or {}).get("instant", {}).get("details") or {}
+        temp = _safe_float(instant.get("air_temperature"))
+        wind_ms = _safe_float(instant.get("wind_speed"))
+        wind_kmh = round(wind_ms * 3.6, 1) if wind_ms is not None else None
+        next12 = (entry.get("data") or {}).get("next_12_hours") or {}
+        next6 = (entry.get("data") or {}).get("next_6_hours") or {}
+        next1 = (entry.get("data") or {}).get("next_1_hours") or {}
+        symbol = (
+            (next12.get("summary") or {}).get("symbol_code")
+            or (next6.get("summary") or {}).get("symbol_code")
+            or (next1.get("summary") or {}).get("symbol_code")
+        )
+        precip = _safe_float(
+            (next6.get("details") or {}).get("precipitation_amount")
+            or (next1.get("details") or {}).get("precipitation_amount")
+        )
+        if date_key not in daily:
+            daily[date_key] = {"temps": [], "wind_speeds": [], "precip": 0.0, "symbols": {}}
+        if temp is not None:
+            daily[date_key]["temps"].append(temp)
+        if wind_kmh is not None:
+            daily[date_key]["wind_speeds"].append(wind_kmh)
+        if precip is not None:
+            daily[date_key]["precip"] += precip
+        if symbol:
+            daily[date_key]["symbols"][symbol] = daily[date_key]["symbols"].get(symbol, 0) + 1
+
+    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    forecast = []
+    for date_key in sorted(daily.keys()):
+        if date_key < today_str:
+            continue
+        if len(forecast) >= 7:
+            break
+        bucket = daily[date_key]
+        temps = bucket["temps"]
+        winds = bucket["wind_speeds"]
+        symbols = bucket["symbols"]
+        dominant = max(symbols, key=symbols.get) if symbols else None
+        forecast.append(
+            {
+                "datetime": date_key,
+                "temperature": round(max(temps), 1) if temps else None,
+                "templow": round(min(temps), 1) if temps else None,
+                "precipitation": round(bucket["precip"], 1),
+                "condition": aggregation._map_metno_symbol(dominant),
+                "cloud_coverage": None,
+                "wind_speed": round(max(winds), 1) if winds else None,
+            }
+        )
+    return forecast
+
+
+def main() -> None:
+    """Run the comparison and print µs per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = json.loads((FIXTURES_DIR / "metno_compact.json").read_text())
+    timeseries = payload["properties"]["timeseries"]
+    # The fixture is a fixed recording; aggregate every day it contains
+    today = "0000-00-00"
+
+    cases = {
+        "legacy (datetime + lists)": lambda: legacy_aggregate(timeseries),
+        "aggregate_metno_daily (UTC)": lambda: aggregation.aggregate_metno_daily(
+            timeseries, None, today
+        ),
+    }
+    try:
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo("Europe/Budapest")
+        cases["aggregate_metno_daily (Europe/Budapest)"] = (
+            lambda: aggregation.aggregate_metno_daily(timeseries, tz, today)
+        )
+    except Exception:  # noqa: BLE001 - tzdata may be missing
+        pass
+
+    print(f"{len(timeseries)} timesteps, {args.number} runs each")
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        baseline = baseline or best
+        print(f"{name:42s} {best * 1e6:9.1f} µs  x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
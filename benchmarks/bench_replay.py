@@ -0,0 +1,264 @@
+"""End-to-end replay: refresh cycles against the local stand-in server.
+
+Runs the real ``WundergroundPWSCoordinator._async_update_data`` (and the
+forecast coordinator's) thousands of times against ``replay_server`` and
+reports the latency distribution of every path a cycle took: a normal
+fetch, API key re-discovery, each forecast fallback source, failures.
+Needs Home Assistant and aiohttp installed, but no network access.
+
+Usage::
+
+    python benchmarks/bench_replay.py [--cycles N] [--scenario NAME ...]
+        [--client-timeout S] [--hedge-delay S] [--city NAME] [--keep-state]
+        [--json FILE]
+
+Without ``--keep-state`` every cycle starts cold (no forecast / geocoding
+cache, closed circuit breakers, no dedupe fingerprint), so each one walks
+the full path of its scenario.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from _loader import load
+from replay_server import (
+    ENDPOINT_GEOCODING,
+    ENDPOINT_METNO,
+    ENDPOINT_OPENMETEO,
+    ENDPOINT_WU_DASHBOARD,
+    ENDPOINT_WU_FORECAST,
+    ENDPOINT_WU_OBSERVATION,
+    VALID_API_KEY,
+    Fault,
+    RewritingSession,
+    StandInServer,
+)
+
+cache = load("cache")
+const = load("const")
+coordinator_module = load("coordinator")
+
+STALE_API_KEY = "0" * 32
+_EVERY_ENDPOINT = (
+    ENDPOINT_WU_OBSERVATION,
+    ENDPOINT_WU_FORECAST,
+    ENDPOINT_METNO,
+    ENDPOINT_OPENMETEO,
+    ENDPOINT_GEOCODING,
+)
+
+
+@dataclass(slots=True)
+class Scenario:
+    """Faults to inject, plus whether each cycle starts with a stale key."""
+
+    faults: dict[str, Fault] = field(default_factory=dict)
+    stale_key: bool = False
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "happy": Scenario(),
+    "wu_auth_rediscovery": Scenario(stale_key=True),
+    "wu_auth_discovery_fails": Scenario(
+        {ENDPOINT_WU_OBSERVATION: Fault(status=403), ENDPOINT_WU_DASHBOARD: Fault(status=500)}
+    ),
+    "wu_observation_500": Scenario({ENDPOINT_WU_OBSERVATION: Fault(status=500)}),
+    "wu_observation_timeout": Scenario({ENDPOINT_WU_OBSERVATION: Fault(stall=True)}),
+    "wu_forecast_500": Scenario({ENDPOINT_WU_FORECAST: Fault(status=500)}),
+    "wu_forecast_timeout": Scenario({ENDPOINT_WU_FORECAST: Fault(stall=True)}),
+    "wu_and_metno_down": Scenario(
+        {ENDPOINT_WU_FORECAST: Fault(status=500), ENDPOINT_METNO: Fault(stall=True)}
+    ),
+    "all_forecasts_down": Scenario(
+        {
+            ENDPOINT_WU_FORECAST: Fault(status=500),
+            ENDPOINT_METNO: Fault(status=500),
+            ENDPOINT_OPENMETEO: Fault(status=500),
+        }
+    ),
+    "slow_upstreams": Scenario(
+        {endpoint: Fault(latency=0.02, jitter=0.05) for endpoint in _EVERY_ENDPOINT}
+    ),
+    "huge_payloads": Scenario(
+        {endpoint: Fault(pad_bytes=1 << 20) for endpoint in _EVERY_ENDPOINT}
+    ),
+}
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    """Return count and latency percentiles (ms) of one path."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+        "p90_ms": round(_percentile(ordered, 90) * 1000, 2),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+def _build_coordinator(
+    hass: HomeAssistant, session: RewritingSession, args: argparse.Namespace
+) -> Any:
+    """Create the coordinator pair for a stand-in config entry."""
+    entry = SimpleNamespace(
+        entry_id="replay",
+        data={
+            const.CONF_STATION_ID: "IKAPOS12",
+            const.CONF_API_KEY: VALID_API_KEY,
+            const.CONF_CITY: args.city,
+            const.CONF_FORECAST_SOURCE: const.FORECAST_SOURCE_AUTO,
+        },
+        options={const.CONF_FORECAST_HEDGE_DELAY: args.hedge_delay},
+    )
+    coordinator = coordinator_module.WundergroundPWSCoordinator(hass, entry)
+    coordinator._get_session = lambda: session
+    return coordinator
+
+
+def _reset(coordinator: Any) -> None:
+    """Forget everything a previous cycle learned."""
+    forecast = coordinator.forecast_coordinator
+    coordinator._last_fingerprint = None
+    coordinator._auth_failure_count = 0
+    for breaker in coordinator.circuit_breakers.values():
+        breaker.record_success()
+    forecast._shared_cache = cache.SharedForecastCache()
+    forecast._geocoding_cache = cache.GeocodingCache()
+
+
+async def run_scenario(
+    hass: HomeAssistant,
+    server: StandInServer,
+    session: RewritingSession,
+    scenario: Scenario,
+    args: argparse.Namespace,
+) -> dict[str, dict[str, list[float]]]:
+    """Run the cycles of one scenario; return latencies by stage and path."""
+    server.reset()
+    server.faults.update(scenario.faults)
+    coordinator = _build_coordinator(hass, session, args)
+    forecast = coordinator.forecast_coordinator
+    latencies: dict[str, dict[str, list[float]]] = {
+        "observation": defaultdict(list),
+        "forecast": defaultdict(list),
+    }
+
+    for _ in range(args.cycles):
+        if not args.keep_state:
+            _reset(coordinator)
+        if scenario.stale_key:
+            coordinator.api_key = STALE_API_KEY
+        key_before = coordinator.api_key
+
+        start = time.perf_counter()
+        try:
+            coordinator.data = await coordinator._async_update_data()
+            path = "rediscovered" if coordinator.api_key != key_before else "ok"
+        except UpdateFailed:
+            path = "failed"
+        latencies["observation"][path].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        try:
+            path = (await forecast._async_update_data()).source
+        except UpdateFailed:
+            path = "failed"
+        latencies["forecast"][path].append(time.perf_counter() - start)
+    return latencies
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the stand-in and Home Assistant, run every scenario."""
+    server = StandInServer()
+    base_url = await server.start()
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # only async_update_entry is used (persisting a re-discovered key)
+        hass.config_entries = SimpleNamespace(
+            async_update_entry=lambda entry, data: setattr(entry, "data", data)
+        )
+        async with aiohttp.ClientSession() as client:
+            session = RewritingSession(client, base_url, args.client_timeout)
+            for name in args.scenario or SCENARIOS:
+                latencies = await run_scenario(
+                    hass, server, session, SCENARIOS[name], args
+                )
+                results[name] = {
+                    "latency": {
+                        stage: {path: _summarize(samples) for path, samples in paths.items()}
+                        for stage, paths in latencies.items()
+                    },
+                    "requests": {
+                        endpoint: stats.requests
+                        for endpoint, stats in server.stats.items()
+                    },
+                }
+                _print_scenario(name, results[name])
+        await hass.async_stop(force=True)
+    await server.stop()
+    return results
+
+
+def _print_scenario(name: str, result: dict[str, Any]) -> None:
+    """Print the latency table of one scenario."""
+    print(f"\n{name}  (requests: {result['requests']})")
+    for stage, paths in result["latency"].items():
+        for path, summary in paths.items():
+            print(
+                f"  {stage:12s} {path:14s} n={summary['count']:<6d} "
+                f"p50 {summary['p50_ms']:8.2f}  p90 {summary['p90_ms']:8.2f}  "
+                f"p99 {summary['p99_ms']:8.2f}  max {summary['max_ms']:8.2f} ms"
+            )
+
+
+def main() -> int:
+    """Parse the arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), help="repeatable"
+    )
+    parser.add_argument(
+        "--client-timeout",
+        type=float,
+        default=0.5,
+        help="per-request cap, seconds (what a stalled endpoint costs)",
+    )
+    parser.add_argument("--hedge-delay", type=float, default=0.0)
+    parser.add_argument(
+        "--city", default="Kaposvár", help="empty: forecast for the station location"
+    )
+    parser.add_argument("--keep-state", action="store_true")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
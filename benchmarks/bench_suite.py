@@ -0,0 +1,314 @@
+"""Offline benchmark suite for the parsing and enrichment hot paths.
+
+Times every case in isolation on the recorded payloads in ``fixtures/`` (and
+on huge / malformed variants derived from them) and reports ops/sec, p50 /
+p99 latency and tracemalloc allocation figures.  No network access and no
+Home Assistant is needed; ``api.py`` does import ``aiohttp``.
+
+Results can be saved as JSON and compared against a run of another commit,
+so parser regressions show up before a release::
+
+    python benchmarks/bench_suite.py --json before.json
+    git checkout <other commit>
+    python benchmarks/bench_suite.py --compare before.json
+
+``--compare`` exits with status 1 if any case got slower (p50) or allocates
+more (peak) than ``--threshold`` (default 15 %).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+from _loader import FIXTURES_DIR, ROOT, load
+
+aggregation = load("aggregation")
+api = load("api")
+batch = load("batch")
+const = load("const")
+
+# The recorded fixtures are from 2026-04-07; aggregate every day they contain
+_ALL_DAYS = "0000-00-00"
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """Timing and allocation figures of one benchmark case."""
+
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_kib: float  # tracemalloc peak during one call
+    blocks: int  # memory blocks still held by the result of one call
+    error: str | None = None  # exception class if the case raised
+
+
+def _fixture(name: str) -> Any:
+    """Load a JSON fixture."""
+    return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+def _stretch(values: list[Any], length: int) -> list[Any]:
+    """Repeat *values* cyclically up to *length* items."""
+    return list(islice(cycle(values), length))
+
+
+def _huge_wu_daily(payload: dict[str, Any], days: int) -> dict[str, Any]:
+    """Blow a WU v3 daily payload up to *days* calendar days."""
+    huge = {
+        key: _stretch(value, days) if isinstance(value, list) and key != "daypart" else value
+        for key, value in payload.items()
+    }
+    huge["daypart"] = [
+        {key: _stretch(value, 2 * days) for key, value in payload["daypart"][0].items()}
+    ]
+    return huge
+
+
+def _huge_open_meteo(payload: dict[str, Any], days: int) -> dict[str, Any]:
+    """Blow an Open-Meteo daily payload up to *days* days."""
+    return {
+        **payload,
+        "daily": {key: _stretch(value, days) for key, value in payload["daily"].items()},
+    }
+
+
+def _build_cases() -> dict[str, Callable[[], Any]]:
+    """Return the benchmark cases, keyed by a stable name."""
+    observation = _fixture("wu_v2_observation.json")["observations"][0]
+    observation_bad = _fixture("wu_v2_observation_malformed.json")["observations"][0]
+    # one day of 5-minute uploads, as returned by observations/all/1day
+    day_of_observations = [
+        {**observation, "imperial": {**observation["imperial"], "temp": 40 + i % 50}}
+        for i in range(288)
+    ]
+    metno = _fixture("metno_compact.json")["properties"]["timeseries"]
+    metno_bad = _fixture("metno_compact_malformed.json")["properties"]["timeseries"]
+    metno_huge = metno * 30
+    wu_daily = _fixture("wu_v3_daily.json")
+    wu_daily_bad = _fixture("wu_v3_daily_malformed.json")
+    wu_daily_huge = _huge_wu_daily(wu_daily, 365)
+    open_meteo = _fixture("openmeteo_daily.json")
+    open_meteo_bad = _fixture("openmeteo_daily_malformed.json")
+    open_meteo_huge = _huge_open_meteo(open_meteo, 365)
+    ensemble = {
+        const.FORECAST_SOURCE_WUNDERGROUND: api._parse_wunderground_forecast(wu_daily).daily,
+        const.FORECAST_SOURCE_METNO: aggregation.aggregate_metno_daily(
+            metno, None, _ALL_DAYS
+        ),
+        const.FORECAST_SOURCE_OPENMETEO: api._parse_open_meteo_forecast(open_meteo).daily,
+    }
+    ensemble_order = list(const.ENSEMBLE_WEIGHTS)
+
+    cases: dict[str, Callable[[], Any]] = {
+        "enrich_observation": lambda: api.enrich_observation(observation),
+        "enrich_observation[malformed]": lambda: api.enrich_observation(observation_bad),
+        "enrich_observation[288 obs]": lambda: [
+            api.enrich_observation(obs) for obs in day_of_observations
+        ],
+        "enrich_observations[288 obs]": lambda: batch.enrich_observations(
+            day_of_observations
+        ),
+        "determine_condition[sunny]": lambda: api.determine_condition(0.0, 6.0, 750.0),
+        "determine_condition[rainy]": lambda: api.determine_condition(1.2, None, None),
+        "determine_condition[none]": lambda: api.determine_condition(None, None, None),
+        "metno_daily[utc]": lambda: aggregation.aggregate_metno_daily(
+            metno, None, _ALL_DAYS
+        ),
+        "metno_daily[huge]": lambda: aggregation.aggregate_metno_daily(
+            metno_huge, None, _ALL_DAYS
+        ),
+        "metno_daily[malformed]": lambda: aggregation.aggregate_metno_daily(
+            metno_bad, None, _ALL_DAYS
+        ),
+        "metno_hourly": lambda: aggregation.metno_hourly(metno),
+        "metno_hourly[malformed]": lambda: aggregation.metno_hourly(metno_bad),
+        "wu_daypart": lambda: api._parse_wunderground_forecast(wu_daily),
+        "wu_daypart[huge]": lambda: api._parse_wunderground_forecast(wu_daily_huge),
+        "wu_daypart[malformed]": lambda: api._parse_wunderground_forecast(wu_daily_bad),
+        "wu_twice_daily": lambda: api._parse_wunderground_forecast(wu_daily).twice_daily,
+        "wu_twice_daily[huge]": lambda: api._parse_wunderground_forecast(
+            wu_daily_huge
+        ).twice_daily,
+        "open_meteo_daily": lambda: api._parse_open_meteo_forecast(open_meteo),
+        "open_meteo_daily[huge]": lambda: api._parse_open_meteo_forecast(open_meteo_huge),
+        "open_meteo_daily[malformed]": lambda: api._parse_open_meteo_forecast(
+            open_meteo_bad
+        ),
+        "ensemble_merge": lambda: aggregation.merge_ensemble(
+            ensemble, const.ENSEMBLE_WEIGHTS, ensemble_order
+        ),
+    }
+    try:
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo("Europe/Budapest")
+        cases["metno_daily[Europe/Budapest]"] = lambda: aggregation.aggregate_metno_daily(
+            metno, tz, _ALL_DAYS
+        )
+    except Exception:  # noqa: BLE001 - tzdata may be missing
+        pass
+    return cases
+
+
+def _calibrate(func: Callable[[], Any], target: float) -> int:
+    """Return how many calls make one sample last about *target* seconds."""
+    inner = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(inner):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or inner >= 1 << 20:
+            return inner
+        inner *= 2 if elapsed == 0 else max(2, min(10, int(target / elapsed) + 1))
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _measure_allocations(func: Callable[[], Any]) -> tuple[float, int]:
+    """Return (peak KiB, retained blocks) of a single call."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return round((peak - base) / 1024, 2), max(0, blocks)
+
+
+def run_case(func: Callable[[], Any], samples: int, target: float) -> CaseResult:
+    """Benchmark one case."""
+    try:
+        func()
+    except Exception as exc:  # noqa: BLE001 - malformed input must be reported
+        return CaseResult(0.0, 0.0, 0.0, 0.0, 0, error=type(exc).__name__)
+
+    inner = _calibrate(func, target)
+    per_call: list[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(inner):
+            func()
+        per_call.append((time.perf_counter() - start) / inner)
+    per_call.sort()
+    peak_kib, blocks = _measure_allocations(func)
+    return CaseResult(
+        ops_per_sec=round(1 / statistics.fmean(per_call), 1),
+        p50_us=round(_percentile(per_call, 50) * 1e6, 3),
+        p99_us=round(_percentile(per_call, 99) * 1e6, 3),
+        peak_kib=peak_kib,
+        blocks=blocks,
+    )
+
+
+def _git_revision() -> str | None:
+    """Return the current commit, if the tree is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: dict[str, CaseResult], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print the change against *baseline*; return the names of regressed cases."""
+    regressed = []
+    print(f"\nvs. {baseline.get('meta', {}).get('revision') or 'baseline'}")
+    for name, result in results.items():
+        old = baseline.get("cases", {}).get(name)
+        if old is None or result.error or old.get("error"):
+            continue
+        time_change = result.p50_us / old["p50_us"] - 1 if old["p50_us"] else 0.0
+        mem_change = result.peak_kib / old["peak_kib"] - 1 if old["peak_kib"] else 0.0
+        flag = ""
+        if time_change > threshold or mem_change > threshold:
+            regressed.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:34s} p50 {time_change:+7.1%}  peak {mem_change:+7.1%}{flag}")
+    return regressed
+
+
+def main() -> int:
+    """Run the suite; return the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument(
+        "--target", type=float, default=0.002, help="seconds per timing sample"
+    )
+    parser.add_argument("-k", "--filter", default="", help="only cases containing this")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    results: dict[str, CaseResult] = {}
+    print(f"{'case':34s} {'ops/s':>12s} {'p50 µs':>10s} {'p99 µs':>10s} "
+          f"{'peak KiB':>9s} {'blocks':>7s}")
+    for name, func in _build_cases().items():
+        if args.filter not in name:
+            continue
+        result = results[name] = run_case(func, args.samples, args.target)
+        if result.error:
+            print(f"{name:34s} raised {result.error}")
+            continue
+        print(
+            f"{name:34s} {result.ops_per_sec:12,.0f} {result.p50_us:10.2f} "
+            f"{result.p99_us:10.2f} {result.peak_kib:9.2f} {result.blocks:7d}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "meta": {
+                        "revision": _git_revision(),
+                        "python": platform.python_version(),
+                        "implementation": sys.implementation.name,
+                        "machine": platform.machine(),
+                        "numpy": aggregation.np is not None,
+                    },
+                    "cases": {name: asdict(result) for name, result in results.items()},
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
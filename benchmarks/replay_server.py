@@ -0,0 +1,214 @@
+"""Local aiohttp stand-in for every upstream the integration talks to.
+
+Serves ``WU_API_URL``, ``WU_FORECAST_URL``, ``METNO_FORECAST_URL``,
+``OPEN_METEO_FORECAST_URL``, ``OPEN_METEO_GEOCODING_URL`` and the WU
+dashboard page (API key discovery) from the recorded fixtures.  Every
+endpoint has a ``Fault`` that injects latency, an error status, a stall
+(client-side timeout) or padding to grow the payload.
+
+``RewritingSession`` wraps a real ``aiohttp.ClientSession`` and sends the
+integration's absolute upstream URLs to the stand-in instead, so the
+integration code runs unmodified.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp import web
+
+from _loader import FIXTURES_DIR, load
+
+const = load("const")
+
+ENDPOINT_WU_OBSERVATION = "wu_observation"
+ENDPOINT_WU_FORECAST = "wu_forecast"
+ENDPOINT_WU_DASHBOARD = "wu_dashboard"
+ENDPOINT_METNO = "metno"
+ENDPOINT_OPENMETEO = "openmeteo"
+ENDPOINT_GEOCODING = "geocoding"
+
+# The key the stand-in WU API accepts (and the dashboard page "leaks")
+VALID_API_KEY = "e1f10a1e78da46f5b10a1e78da96f525"
+
+
+def _route(url: str) -> str:
+    """Return the stand-in path for an upstream URL: ``/<host><path>``."""
+    parts = urlsplit(url)
+    return f"/{parts.netloc}{parts.path}"
+
+
+_ROUTES = {
+    _route(const.WU_API_URL): ENDPOINT_WU_OBSERVATION,
+    _route(const.WU_FORECAST_URL): ENDPOINT_WU_FORECAST,
+    _route(const.METNO_FORECAST_URL): ENDPOINT_METNO,
+    _route(const.OPEN_METEO_FORECAST_URL): ENDPOINT_OPENMETEO,
+    _route(const.OPEN_METEO_GEOCODING_URL): ENDPOINT_GEOCODING,
+}
+
+
+@dataclass(slots=True)
+class Fault:
+    """What one endpoint does to the next requests."""
+
+    status: int = 200
+    latency: float = 0.0  # seconds before answering
+    jitter: float = 0.0  # extra uniform random latency, seconds
+    stall: bool = False  # never answer; the client runs into its timeout
+    pad_bytes: int = 0  # grow the JSON payload by this much
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Request counters of one endpoint."""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+def _rebase_metno(payload: dict[str, Any]) -> dict[str, Any]:
+    """Shift a recorded MET.no payload so that it starts today (UTC).
+
+    The aggregation drops past days, so a replayed recording would otherwise
+    age into an empty forecast.
+    """
+    timeseries = payload["properties"]["timeseries"]
+    first = datetime.fromisoformat(timeseries[0]["time"].replace("Z", "+00:00"))
+    shift = timedelta(days=(datetime.now(timezone.utc).date() - first.date()).days)
+    for entry in timeseries:
+        stamp = datetime.fromisoformat(entry["time"].replace("Z", "+00:00")) + shift
+        entry["time"] = stamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return payload
+
+
+def _fixture(name: str) -> Any:
+    """Load a JSON fixture."""
+    return json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+class StandInServer:
+    """The stand-in HTTP server; configure ``faults`` between requests."""
+
+    def __init__(self) -> None:
+        """Load the fixtures; the server is started by ``start``."""
+        self.faults: dict[str, Fault] = {}
+        self.stats: dict[str, EndpointStats] = {}
+        self.url: str = ""
+        self._payloads: dict[str, Any] = {
+            ENDPOINT_WU_OBSERVATION: _fixture("wu_v2_observation.json"),
+            ENDPOINT_WU_FORECAST: _fixture("wu_v3_daily.json"),
+            ENDPOINT_METNO: _rebase_metno(_fixture("metno_compact.json")),
+            ENDPOINT_OPENMETEO: _fixture("openmeteo_daily.json"),
+            ENDPOINT_GEOCODING: _fixture("openmeteo_geocoding.json"),
+        }
+        self._bodies: dict[tuple[str, int], bytes] = {}
+        self._runner: web.AppRunner | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening; return the base URL."""
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # noqa: SLF001 - port 0 needs the real port
+        self.url = f"http://{host}:{sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset(self) -> None:
+        """Clear every fault and counter."""
+        self.faults.clear()
+        self.stats.clear()
+
+    def _body(self, endpoint: str, pad_bytes: int) -> bytes:
+        """Return the (padded) JSON body of *endpoint*, built once per size."""
+        key = (endpoint, pad_bytes)
+        if key not in self._bodies:
+            payload = self._payloads[endpoint]
+            if pad_bytes:
+                payload = {**payload, "_padding": "x" * pad_bytes}
+            self._bodies[key] = json.dumps(payload).encode()
+        return self._bodies[key]
+
+    def _endpoint(self, request: web.Request) -> str | None:
+        """Map a request path to an endpoint name."""
+        if request.path.startswith("/www.wunderground.com/dashboard/pws/"):
+            return ENDPOINT_WU_DASHBOARD
+        return _ROUTES.get(request.path)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer one request according to the endpoint's fault."""
+        endpoint = self._endpoint(request)
+        if endpoint is None:
+            return web.Response(status=404)
+        fault = self.faults.get(endpoint) or Fault()
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        stats.requests += 1
+
+        delay = fault.latency + (random.uniform(0, fault.jitter) if fault.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        if fault.stall:
+            await asyncio.sleep(3600)
+
+        status = fault.status
+        if (
+            status == 200
+            and endpoint == ENDPOINT_WU_OBSERVATION
+            and request.query.get("apiKey") != VALID_API_KEY
+        ):
+            status = 401
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if status != 200:
+            return web.Response(status=status)
+
+        if endpoint == ENDPOINT_WU_DASHBOARD:
+            body = (
+                '<html><script>window.__config = {"apiKey":"'
+                + VALID_API_KEY
+                + '"};</script>'
+                + "x" * fault.pad_bytes
+                + "</html>"
+            ).encode()
+            content_type = "text/html"
+        else:
+            body = self._body(endpoint, fault.pad_bytes)
+            content_type = "application/json"
+        stats.bytes_sent += len(body)
+        return web.Response(body=body, content_type=content_type)
+
+
+class RewritingSession:
+    """Duck-typed ``ClientSession`` sending upstream URLs to the stand-in.
+
+    Only ``get`` is used by the integration.  *timeout* caps every request,
+    so a stalled endpoint costs that long instead of the integration's own
+    15-30 s limits.
+    """
+
+    def __init__(
+        self, session: aiohttp.ClientSession, base_url: str, timeout: float
+    ) -> None:
+        """Wrap *session*."""
+        self._session = session
+        self._base_url = base_url
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Issue a GET against the stand-in."""
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.get(self._base_url + _route(url), **kwargs)
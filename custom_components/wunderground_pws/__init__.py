@@ -9,7 +9,8 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
@@ -18,8 +19,14 @@ from .const import (
     CONF_API_KEY,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    STORAGE_VERSION,
+    GEOCODING_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    DAILY_STATISTICS_STORAGE_KEY,
+    DATA_PUSH_STATIONS,
 )
 from .coordinator import WundergroundPWSCoordinator
+from .push import WundergroundUploadView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,16 +52,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.config_entries.async_update_entry(entry, data=new_data)
 
     coordinator = WundergroundPWSCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_setup_daily_statistics()
+    restored = await coordinator.async_restore_snapshot()
+
+    # The forecast is refreshed on its own schedule; don't block setup on it.
+    # A configured city (or a restored observation) locates it without the
+    # first observation, so both are fetched at the same time; only the
+    # fallback to the station's coordinates has to wait for the observation.
+    forecast_early = bool(coordinator.city) or coordinator.data is not None
+    if forecast_early:
+        _async_start_forecast_refresh(hass, entry, coordinator)
+
+    if coordinator.push_only:
+        # Local uploads only: a single cloud poll locates the station (for
+        # the location sensors and the forecast), then the entities follow
+        # the station's uploads
+        if coordinator.data is None or coordinator.data.lat is None:
+            await coordinator.async_locate_station()
+    elif restored:
+        # Warm start: entities come up from the snapshot right away
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh_after_restore(),
+            f"{DOMAIN}_{entry.entry_id}_first_refresh",
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    if not forecast_early:
+        _async_start_forecast_refresh(hass, entry, coordinator)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    if coordinator.local_push:
+        if coordinator.push_password:
+            _async_register_push(hass, coordinator)
+        else:
+            _LOGGER.warning(
+                "Local push of station %s is disabled: set a push password "
+                "in the integration options",
+                coordinator.station_id,
+            )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
+@callback
+def _async_start_forecast_refresh(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WundergroundPWSCoordinator
+) -> None:
+    """Run the first forecast refresh in the background."""
+    entry.async_create_background_task(
+        hass,
+        coordinator.forecast_coordinator.async_refresh(),
+        f"{DOMAIN}_{entry.entry_id}_forecast_first_refresh",
+    )
+
+
+@callback
+def _async_register_push(
+    hass: HomeAssistant, coordinator: WundergroundPWSCoordinator
+) -> None:
+    """Route the station's local uploads to its coordinator.
+
+    The upload view is shared by every config entry and registered once;
+    it finds the coordinator by the uploaded station ID.
+    """
+    domain_data = hass.data[DOMAIN]
+    if DATA_PUSH_STATIONS not in domain_data:
+        hass.http.register_view(WundergroundUploadView(hass))
+    stations = domain_data.setdefault(DATA_PUSH_STATIONS, {})
+    stations[coordinator.station_id.upper()] = coordinator
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update - reload the integration with new settings."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -64,5 +136,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        stations = hass.data[DOMAIN].get(DATA_PUSH_STATIONS, {})
+        if stations.get(coordinator.station_id.upper()) is coordinator:
+            del stations[coordinator.station_id.upper()]
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    for key in (
+        GEOCODING_STORAGE_KEY,
+        SNAPSHOT_STORAGE_KEY,
+        DAILY_STATISTICS_STORAGE_KEY,
+    ):
+        await Store(
+            hass, STORAGE_VERSION, key.format(entry_id=entry.entry_id)
+        ).async_remove()
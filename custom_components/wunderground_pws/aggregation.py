@@ -0,0 +1,444 @@
+"""Hourly → daily aggregation of the MET.no forecast, and the source ensemble.
+
+Egyetlen menetben dolgozza fel a ``timeseries`` listat: a napokat a
+datum-sztring szeletelesevel kepzi (datetime objektumok nelkul), naponta
+futo min / max / osszeg / modusz szamlalokat tart, es a helyi (nem UTC)
+datum szerint csoportosit.  Nagy adatmennyisegnel NumPy-t hasznal, ha
+elerheto.  Az orankenti elorejelzes ugyanebbol a listabol keszul, kulon
+letoltes nelkul.  Ensemble modban a harom forras napi listajat
+napokra bontott oszlopokba gyujti es oszloponkent egyszer osszegzi.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from statistics import median
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up only
+    np = None
+
+# Below this many timesteps the pure-Python pass is faster than NumPy
+_NUMPY_MIN_ROWS = 2000
+
+_EMPTY: dict[str, Any] = {}
+
+# Map MET.no symbol_code prefix to HA condition
+_METNO_SYMBOL_MAP: dict[str, str] = {
+    "clearsky": "sunny",
+    "fair": "sunny",
+    "partlycloudy": "partlycloudy",
+    "mostlycloudy": "cloudy",
+    "cloudy": "cloudy",
+    "fog": "fog",
+    "lightrain": "rainy",
+    "rain": "rainy",
+    "heavyrain": "pouring",
+    "lightrainshowers": "rainy",
+    "rainshowers": "rainy",
+    "heavyrainshowers": "pouring",
+    "lightsleet": "snowy-rainy",
+    "sleet": "snowy-rainy",
+    "heavysleet": "snowy-rainy",
+    "lightsleetshowers": "snowy-rainy",
+    "sleetshowers": "snowy-rainy",
+    "heavysleetshowers": "snowy-rainy",
+    "lightsnow": "snowy",
+    "snow": "snowy",
+    "heavysnow": "snowy",
+    "lightsnowshowers": "snowy",
+    "snowshowers": "snowy",
+    "heavysnowshowers": "snowy",
+    "thunder": "lightning",
+    "lightrainandthunder": "lightning-rainy",
+    "rainandthunder": "lightning-rainy",
+    "heavyrainandthunder": "lightning-rainy",
+    "lightsleetandthunder": "lightning-rainy",
+    "sleetandthunder": "lightning-rainy",
+    "lightsnowandthunder": "lightning-rainy",
+    "snowandthunder": "lightning-rainy",
+    "lightrainshowersandthunder": "lightning-rainy",
+    "rainshowersandthunder": "lightning-rainy",
+    "heavyrainshowersandthunder": "lightning-rainy",
+    "lightsleetshowersandthunder": "lightning-rainy",
+    "sleetshowersandthunder": "lightning-rainy",
+    "lightsnowshowersandthunder": "lightning-rainy",
+    "snowshowersandthunder": "lightning-rainy",
+}
+
+
+def _map_metno_symbol(symbol_code: str | None) -> str:
+    """Map a MET.no symbol_code to a Home Assistant condition."""
+    if not symbol_code:
+        return "unknown"
+    # strip _day / _night / _polartwilight suffix: "clearsky_day" → "clearsky"
+    base = symbol_code.split("_")[0]
+    return _METNO_SYMBOL_MAP.get(base, "partlycloudy")
+
+
+class _DayBucket:
+    """Running counters of one (local) day."""
+
+    __slots__ = ("temp_min", "temp_max", "wind_max", "precip", "symbols")
+
+    def __init__(self) -> None:
+        self.temp_min: float | None = None
+        self.temp_max: float | None = None
+        self.wind_max: float | None = None
+        self.precip = 0.0
+        self.symbols: dict[str, int] = {}
+
+
+def _num(value: Any) -> float | None:
+    """Return *value* as float (fast path for JSON floats), None if invalid."""
+    if value is None or value.__class__ is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=64)
+def _shift_date(date_str: str, days: int) -> str:
+    """Return the ISO date *days* away from *date_str*."""
+    return (date.fromisoformat(date_str) + timedelta(days=days)).isoformat()
+
+
+def _utc_offset_minutes(date_str: str, tz: tzinfo) -> int:
+    """Return the UTC offset of *tz* on a given UTC date (sampled at noon)."""
+    noon = datetime.fromisoformat(f"{date_str}T12:00:00+00:00")
+    offset = noon.astimezone(tz).utcoffset()
+    return int(offset.total_seconds() // 60) if offset else 0
+
+
+def _date_resolver(tz: tzinfo | None) -> Callable[[str], str]:
+    """Return a function mapping a MET.no ``YYYY-MM-DDTHH:MM:SSZ`` timestamp
+    to its local ISO date in *tz*.
+
+    The offset is looked up once per UTC date; after that a timestamp is
+    classified by comparing its ``HH:MM`` slice against the day boundary, so
+    no integers or datetime objects are built per timestep.  The returned
+    function raises ValueError / TypeError for malformed timestamps.
+    """
+    # date_str → (offset minutes, "HH:MM" where the local date changes)
+    boundaries: dict[str, tuple[int, str]] = {}
+
+    def resolve(ts: str) -> str:
+        date_str = ts[:10]
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError(ts)
+        if tz is None:
+            return date_str
+        boundary = boundaries.get(date_str)
+        if boundary is None:
+            offset = _utc_offset_minutes(date_str, tz)
+            edge = 1440 - offset if offset > 0 else -offset
+            boundary = boundaries[date_str] = (offset, f"{edge // 60:02d}:{edge % 60:02d}")
+        offset, edge = boundary
+        if offset > 0 and ts[11:16] >= edge:
+            return _shift_date(date_str, 1)
+        if offset < 0 and ts[11:16] < edge:
+            return _shift_date(date_str, -1)
+        return date_str
+
+    return resolve
+
+
+def aggregate_metno_daily(
+    timeseries: list[dict[str, Any]],
+    tz: tzinfo | None = None,
+    today: str | None = None,
+    max_days: int = 7,
+) -> list[dict[str, Any]]:
+    """Aggregate MET.no timesteps to at most *max_days* daily forecasts.
+
+    Days are bucketed by the local date in *tz* (UTC if None); days before
+    *today* (local ISO date, default: now) are skipped.  Per day: max / min
+    temperature, max wind speed (km/h), total precipitation and the most
+    frequent symbol.  Precipitation comes from ``next_1_hours`` in the
+    hourly part of the series and from ``next_6_hours`` in the 6-hourly
+    tail, so overlapping periods are not summed twice.
+    """
+    if np is not None and len(timeseries) >= _NUMPY_MIN_ROWS:
+        buckets = _bucket_numpy(timeseries, tz)
+    else:
+        buckets = _bucket(timeseries, tz)
+
+    if today is None:
+        today = datetime.now(tz or timezone.utc).strftime("%Y-%m-%d")
+    forecast: list[dict[str, Any]] = []
+    for date_key in sorted(buckets):
+        if date_key < today:
+            continue
+        if len(forecast) >= max_days:
+            break
+        bucket = buckets[date_key]
+        symbols = bucket.symbols
+        dominant = max(symbols, key=symbols.get) if symbols else None
+        forecast.append(
+            {
+                "datetime": date_key,
+                "temperature": (
+                    round(bucket.temp_max, 1) if bucket.temp_max is not None else None
+                ),
+                "templow": (
+                    round(bucket.temp_min, 1) if bucket.temp_min is not None else None
+                ),
+                "precipitation": round(bucket.precip, 1),
+                "condition": _map_metno_symbol(dominant),
+                "cloud_coverage": None,
+                # MET.no wind speed is m/s → km/h
+                "wind_speed": (
+                    round(bucket.wind_max * 3.6, 1) if bucket.wind_max is not None else None
+                ),
+            }
+        )
+    return forecast
+
+
+def metno_hourly(timeseries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the hourly steps of a MET.no series in the common hourly format.
+
+    Only steps with a ``next_1_hours`` period are used (the first ~2.5 days;
+    the 6-hourly tail is too coarse for an hourly forecast).  Timestamps stay
+    in UTC (``+00:00``), wind speed is converted from m/s to km/h.
+    """
+    hourly: list[dict[str, Any]] = []
+    for entry in timeseries:
+        if not isinstance(entry, dict):
+            continue
+        ts = entry.get("time")
+        data = entry.get("data") or _EMPTY
+        next1 = data.get("next_1_hours")
+        if not next1 or not isinstance(ts, str) or len(ts) < 19:
+            continue
+        details = (data.get("instant") or _EMPTY).get("details") or _EMPTY
+        symbol = (next1.get("summary") or _EMPTY).get("symbol_code")
+        condition = _map_metno_symbol(symbol)
+        if condition == "sunny" and symbol.endswith("_night"):
+            condition = "clear-night"
+        wind = _num(details.get("wind_speed"))
+        hourly.append(
+            {
+                "datetime": ts[:19] + "+00:00",
+                "temperature": _num(details.get("air_temperature")),
+                "precipitation": _num(
+                    (next1.get("details") or _EMPTY).get("precipitation_amount")
+                ),
+                "condition": condition,
+                "cloud_coverage": _num(details.get("cloud_area_fraction")),
+                "humidity": _num(details.get("relative_humidity")),
+                "wind_bearing": _num(details.get("wind_from_direction")),
+                # MET.no wind speed is m/s → km/h
+                "wind_speed": round(wind * 3.6, 1) if wind is not None else None,
+            }
+        )
+    return hourly
+
+
+def _extract(entry: dict[str, Any]) -> tuple[Any, Any, Any, str | None]:
+    """Return (temperature, wind m/s, precipitation, symbol) of one timestep."""
+    data = entry.get("data") or _EMPTY
+    details = (data.get("instant") or _EMPTY).get("details") or _EMPTY
+    next1 = data.get("next_1_hours") or _EMPTY
+    next6 = data.get("next_6_hours") or _EMPTY
+    # Prefer next_12_hours symbol for daytime, fall back to next_6_hours / next_1_hour
+    symbol = (
+        ((data.get("next_12_hours") or _EMPTY).get("summary") or _EMPTY).get("symbol_code")
+        or (next6.get("summary") or _EMPTY).get("symbol_code")
+        or (next1.get("summary") or _EMPTY).get("symbol_code")
+    )
+    period = next1 or next6
+    precip = (period.get("details") or _EMPTY).get("precipitation_amount")
+    return details.get("air_temperature"), details.get("wind_speed"), precip, symbol
+
+
+def _bucket(
+    timeseries: list[dict[str, Any]], tz: tzinfo | None
+) -> dict[str, _DayBucket]:
+    """One pure-Python pass over the timesteps."""
+    local_date = _date_resolver(tz)
+    buckets: dict[str, _DayBucket] = {}
+    for entry in timeseries:
+        try:
+            date_key = local_date(entry["time"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        bucket = buckets.get(date_key)
+        if bucket is None:
+            bucket = buckets[date_key] = _DayBucket()
+
+        temp, wind, precip, symbol = _extract(entry)
+        temp = _num(temp)
+        if temp is not None:
+            if bucket.temp_max is None or temp > bucket.temp_max:
+                bucket.temp_max = temp
+            if bucket.temp_min is None or temp < bucket.temp_min:
+                bucket.temp_min = temp
+        wind = _num(wind)
+        if wind is not None and (bucket.wind_max is None or wind > bucket.wind_max):
+            bucket.wind_max = wind
+        precip = _num(precip)
+        if precip is not None:
+            bucket.precip += precip
+        if symbol:
+            bucket.symbols[symbol] = bucket.symbols.get(symbol, 0) + 1
+    return buckets
+
+
+def _bucket_numpy(
+    timeseries: list[dict[str, Any]], tz: tzinfo | None
+) -> dict[str, _DayBucket]:
+    """Columnar variant of ``_bucket`` for very long series (needs NumPy)."""
+    local_date = _date_resolver(tz)
+    day_index: dict[str, int] = {}
+    rows: list[int] = []
+    temps: list[float] = []
+    winds: list[float] = []
+    precips: list[float] = []
+    symbols: list[dict[str, int]] = []
+    nan = float("nan")
+    for entry in timeseries:
+        try:
+            date_key = local_date(entry["time"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        idx = day_index.get(date_key)
+        if idx is None:
+            idx = day_index[date_key] = len(day_index)
+            symbols.append({})
+        temp, wind, precip, symbol = _extract(entry)
+        rows.append(idx)
+        temp, wind, precip = _num(temp), _num(wind), _num(precip)
+        temps.append(nan if temp is None else temp)
+        winds.append(nan if wind is None else wind)
+        precips.append(nan if precip is None else precip)
+        if symbol:
+            symbols[idx][symbol] = symbols[idx].get(symbol, 0) + 1
+
+    n_days = len(day_index)
+    idx_arr = np.asarray(rows, dtype=np.intp)
+    temp_arr = np.asarray(temps, dtype=float)
+    wind_arr = np.asarray(winds, dtype=float)
+    precip_arr = np.asarray(precips, dtype=float)
+    t_max = np.full(n_days, -np.inf)
+    t_min = np.full(n_days, np.inf)
+    w_max = np.full(n_days, -np.inf)
+    p_sum = np.zeros(n_days)
+    np.fmax.at(t_max, idx_arr, temp_arr)
+    np.fmin.at(t_min, idx_arr, temp_arr)
+    np.fmax.at(w_max, idx_arr, wind_arr)
+    np.add.at(p_sum, idx_arr, np.nan_to_num(precip_arr, nan=0.0))
+
+    buckets: dict[str, _DayBucket] = {}
+    for date_key, idx in day_index.items():
+        bucket = buckets[date_key] = _DayBucket()
+        if np.isfinite(t_max[idx]):
+            bucket.temp_max = float(t_max[idx])
+            bucket.temp_min = float(t_min[idx])
+        if np.isfinite(w_max[idx]):
+            bucket.wind_max = float(w_max[idx])
+        bucket.precip = float(p_sum[idx])
+        bucket.symbols = symbols[idx]
+    return buckets
+
+
+# Fields of the common daily format merged by ``merge_ensemble``
+_ENSEMBLE_MEAN_FIELDS = ("temperature", "templow", "wind_speed", "cloud_coverage")
+
+
+def merge_ensemble(
+    members: dict[str, list[dict[str, Any]]],
+    weights: dict[str, float],
+    priority: list[str],
+    max_days: int = 7,
+) -> list[dict[str, Any]]:
+    """Merge the daily forecasts of several sources into one, day by day.
+
+    One pass over the member lists collects every field into per-day
+    columns of ``(source, value)``; each column is then reduced once:
+    temperatures, wind and cloud cover to the mean weighted by *weights*,
+    precipitation to the median, the condition to a majority vote (ties go
+    to the source that comes first in *priority*).  Every reduced number
+    gets a ``<field>_spread`` (max - min of the members) as its uncertainty,
+    and ``sources`` counts the members that had the day.  Any member may be
+    missing or empty.
+    """
+    columns: dict[str, dict[str, list[tuple[str, Any]]]] = {}
+    for source, days in members.items():
+        for day in days:
+            date_key = day.get("datetime")
+            if not date_key:
+                continue
+            column = columns.get(date_key)
+            if column is None:
+                column = columns[date_key] = {}
+            for name, value in day.items():
+                if value is not None and name != "datetime":
+                    column.setdefault(name, []).append((source, value))
+
+    rank = {source: i for i, source in enumerate(priority)}
+    forecast: list[dict[str, Any]] = []
+    for date_key in sorted(columns)[:max_days]:
+        column = columns[date_key]
+        merged: dict[str, Any] = {
+            "datetime": date_key,
+            "sources": len({source for values in column.values() for source, _ in values}),
+        }
+        for name in _ENSEMBLE_MEAN_FIELDS:
+            values = _numbers(column.get(name))
+            if not values:
+                merged[name] = None
+                continue
+            total = sum(weights.get(source, 1.0) for source, _ in values)
+            merged[name] = round(
+                sum(weights.get(source, 1.0) * value for source, value in values) / total,
+                1,
+            )
+            merged[f"{name}_spread"] = _spread(values)
+        precip = _numbers(column.get("precipitation"))
+        merged["precipitation"] = (
+            round(median(value for _, value in precip), 1) if precip else None
+        )
+        if precip:
+            merged["precipitation_spread"] = _spread(precip)
+        merged["condition"] = _vote(column.get("condition") or [], rank)
+        forecast.append(merged)
+    return forecast
+
+
+def _numbers(values: list[tuple[str, Any]] | None) -> list[tuple[str, float]]:
+    """Return the numeric ``(source, value)`` pairs of a column."""
+    numbers = []
+    for source, value in values or ():
+        value = _num(value)
+        if value is not None and value == value:  # NaN != NaN
+            numbers.append((source, value))
+    return numbers
+
+
+def _spread(values: list[tuple[str, float]]) -> float:
+    """Return max - min of the member values."""
+    numbers = [value for _, value in values]
+    return round(max(numbers) - min(numbers), 1)
+
+
+def _vote(values: list[tuple[str, Any]], rank: dict[str, int]) -> str:
+    """Return the most frequent condition; ties go to the higher priority source."""
+    votes: dict[str, int] = {}
+    first: dict[str, int] = {}
+    for source, condition in values:
+        if condition == "unknown":
+            continue
+        votes[condition] = votes.get(condition, 0) + 1
+        first[condition] = min(first.get(condition, len(rank)), rank.get(source, len(rank)))
+    if not votes:
+        return "unknown"
+    return min(votes, key=lambda condition: (-votes[condition], first[condition]))
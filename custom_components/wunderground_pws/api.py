@@ -21,19 +21,27 @@ Verzio: 1.4.1
 from __future__ import annotations
 
 import asyncio
+import json
 import math
 import re
-from datetime import datetime, timezone
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from functools import cached_property, partial
 from typing import Any, Dict
 
 import aiohttp
 
+from .aggregation import aggregate_metno_daily, metno_hourly
+from .cache import HttpCache
 from .const import (
     OPEN_METEO_GEOCODING_URL,
     OPEN_METEO_FORECAST_URL,
     WU_FORECAST_URL,
     METNO_FORECAST_URL,
 )
+from .metrics import EndpointMetrics, RequestSample, track
 
 
 def f_to_c(f: float) -> float:
@@ -132,24 +140,77 @@ def _safe_float(value: Any) -> float | None:
         return None
 
 
-def enrich_observation(obs: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert a single WU PWS observation to metric units and enrich it."""
-    out: Dict[str, Any] = {}
-    out["station_id"] = obs.get("stationID")
-    out["obsTimeUtc"] = obs.get("obsTimeUtc")
-    out["obsTimeLocal"] = obs.get("obsTimeLocal")
-    out["location"] = obs.get("neighborhood") or obs.get("stationID")
-    out["country"] = obs.get("country")
-    out["lat"] = _safe_float(obs.get("lat"))
-    out["lon"] = _safe_float(obs.get("lon"))
-    out["uv"] = _safe_float(obs.get("uv"))
-    out["solar_radiation"] = _safe_float(obs.get("solarRadiation"))
-    out["humidity"] = _safe_float(obs.get("humidity"))
+@dataclass(frozen=True, slots=True)
+class Observation:
+    """One enriched PWS observation in metric units.
+
+    Field names match the ``ATTR_*`` constants, so entity descriptions can
+    address a value by its ``data_key``.
+    """
+
+    station_id: str | None = None
+    obs_time_utc: str | None = None
+    last_updated: str | None = None  # obsTimeLocal, falling back to obsTimeUtc
+    location_name: str | None = None
+    country: str | None = None
+    lat: float | None = None
+    lon: float | None = None
+    elevation_m: float | None = None
+    temperature: float | None = None
+    feels_like: float | None = None
+    dew_point: float | None = None
+    heat_index: float | None = None
+    wind_chill: float | None = None
+    humidity: float | None = None
+    absolute_humidity: float | None = None
+    pressure: float | None = None
+    wind_speed: float | None = None
+    wind_gust: float | None = None
+    wind_bearing: float | None = None
+    wind_compass: str | None = None
+    wind_compass_hu: str | None = None
+    precipitation: float | None = None
+    precipitation_rate: float | None = None
+    solar_radiation: float | None = None
+    uv_index: float | None = None
+    cloud_base: float | None = None
+    condition: str | None = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the observation as a plain (JSON-serialisable) dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Observation:
+        """Rebuild an observation from ``as_dict`` output (unknown keys ignored)."""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+def determine_condition(
+    precip_rate: float | None, uv: float | None, solar: float | None
+) -> str:
+    """Determine HA weather condition from observation data."""
+    precip_rate = float(precip_rate or 0)
+    uv = float(uv or 0)
+    solar = float(solar or 0)
+
+    if precip_rate > 0:
+        return "rainy"
+    if solar > 600 and uv > 5:
+        return "sunny"
+    if solar > 200:
+        return "partlycloudy"
+    if solar < 50:
+        return "cloudy"
+    return "partlycloudy"
 
+
+def enrich_observation(obs: Dict[str, Any]) -> Observation:
+    """Convert a single WU PWS observation to metric units and enrich it."""
     winddir = _safe_float(obs.get("winddir"))
-    out["wind_dir_deg"] = winddir
-    out["wind_dir_compass"] = deg_to_compass(winddir) if winddir is not None else None
-    out["wind_dir_compass_hu"] = deg_to_compass_hu(winddir) if winddir is not None else None
+    humidity = _safe_float(obs.get("humidity"))
+    uv = _safe_float(obs.get("uv"))
+    solar = _safe_float(obs.get("solarRadiation"))
 
     imp = obs.get("imperial") or {}
     temp_f = _safe_float(imp.get("temp"))
@@ -164,31 +225,43 @@ def enrich_observation(obs: Dict[str, Any]) -> Dict[str, Any]:
 
     temp_c = round(f_to_c(temp_f), 1) if temp_f is not None else None
     dewpt_c = round(f_to_c(dewpt_f), 1) if dewpt_f is not None else None
+    heat_c = round(f_to_c(heat_f), 1) if heat_f is not None else None
     wind_kmh = round(mph_to_kmh(wind_mph), 1) if wind_mph is not None else None
-
-    out["temperature"] = temp_c
-    out["dew_point"] = dewpt_c
-    out["feels_like"] = round(f_to_c(heat_f), 1) if heat_f is not None else None
-    out["heat_index"] = round(f_to_c(heat_f), 1) if heat_f is not None else None
-    out["wind_speed"] = wind_kmh
-    out["wind_gust"] = round(mph_to_kmh(gust_mph), 1) if gust_mph is not None else None
-    out["pressure"] = round(inhg_to_hpa(press_inhg), 2) if press_inhg is not None else None
-    out["precipitation_rate"] = (
+    precip_rate = (
         round(inch_to_mm(precip_rate_in), 2) if precip_rate_in is not None else None
     )
-    out["precipitation"] = (
-        round(inch_to_mm(precip_total_in), 2) if precip_total_in is not None else None
-    )
-    out["elevation_m"] = round(ft_to_m(elev_ft), 1) if elev_ft is not None else None
 
-    # Calculated values
-    out["cloud_base"] = calculate_cloud_base(temp_c, dewpt_c)
-    out["absolute_humidity"] = calculate_absolute_humidity(
-        temp_c, out["humidity"]
+    return Observation(
+        station_id=obs.get("stationID"),
+        obs_time_utc=obs.get("obsTimeUtc"),
+        last_updated=obs.get("obsTimeLocal") or obs.get("obsTimeUtc"),
+        location_name=obs.get("neighborhood") or obs.get("stationID"),
+        country=obs.get("country"),
+        lat=_safe_float(obs.get("lat")),
+        lon=_safe_float(obs.get("lon")),
+        elevation_m=round(ft_to_m(elev_ft), 1) if elev_ft is not None else None,
+        temperature=temp_c,
+        feels_like=heat_c,
+        dew_point=dewpt_c,
+        heat_index=heat_c,
+        wind_chill=calculate_wind_chill(temp_c, wind_kmh),
+        humidity=humidity,
+        absolute_humidity=calculate_absolute_humidity(temp_c, humidity),
+        pressure=round(inhg_to_hpa(press_inhg), 2) if press_inhg is not None else None,
+        wind_speed=wind_kmh,
+        wind_gust=round(mph_to_kmh(gust_mph), 1) if gust_mph is not None else None,
+        wind_bearing=winddir,
+        wind_compass=deg_to_compass(winddir) if winddir is not None else None,
+        wind_compass_hu=deg_to_compass_hu(winddir) if winddir is not None else None,
+        precipitation=(
+            round(inch_to_mm(precip_total_in), 2) if precip_total_in is not None else None
+        ),
+        precipitation_rate=precip_rate,
+        solar_radiation=solar,
+        uv_index=uv,
+        cloud_base=calculate_cloud_base(temp_c, dewpt_c),
+        condition=determine_condition(precip_rate, uv, solar),
     )
-    out["wind_chill"] = calculate_wind_chill(temp_c, wind_kmh)
-
-    return out
 
 
 _WU_DASHBOARD_URL = "https://www.wunderground.com/dashboard/pws/{station_id}"
@@ -221,7 +294,10 @@ _WU_SCRAPE_HEADERS = {
 
 
 async def discover_api_key(
-    station_id: str, session: aiohttp.ClientSession
+    station_id: str,
+    session: aiohttp.ClientSession,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 25,
 ) -> str | None:
     """Demo/teszt módhoz: nyilvánosan elérhető WU API kulcs automatikus beszerzése.
 
@@ -236,13 +312,17 @@ async def discover_api_key(
     """
     url = _WU_DASHBOARD_URL.format(station_id=station_id)
     try:
-        async with asyncio.timeout(25):
-            async with session.get(
-                url, headers=_WU_SCRAPE_HEADERS, allow_redirects=True
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                html = await resp.text(errors="replace")
+        with track(metrics) as sample:
+            async with asyncio.timeout(timeout):
+                async with session.get(
+                    url, headers=_WU_SCRAPE_HEADERS, allow_redirects=True
+                ) as resp:
+                    sample.status = resp.status
+                    if resp.status != 200:
+                        return None
+                    body = await resp.read()
+                    sample.size = len(body)
+                    html = body.decode(resp.get_encoding(), errors="replace")
     except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
         return None
 
@@ -254,21 +334,25 @@ async def discover_api_key(
 
 
 async def fetch_geocoding(
-    city: str, session: aiohttp.ClientSession
+    city: str,
+    session: aiohttp.ClientSession,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 10,
 ) -> tuple[float, float] | None:
     """Fetch lat/lon for a city name using Open-Meteo Geocoding API (free).
 
-    Returns (lat, lon) or None if not found.
+    Returns (lat, lon) or None if the city is not found.  Transport errors
+    (timeout, HTTP error, invalid JSON) are raised instead of returning None,
+    so that callers caching the answer can tell "no such city" from "try
+    again later".
     """
     params = {"name": city, "count": 1, "language": "hu", "format": "json"}
-    try:
-        async with asyncio.timeout(10):
+    with track(metrics) as sample:
+        async with asyncio.timeout(timeout):
             async with session.get(OPEN_METEO_GEOCODING_URL, params=params) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-    except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
-        return None
+                sample.status = resp.status
+                resp.raise_for_status()
+                data = await read_json(resp, sample)
 
     results = data.get("results") or []
     if not results:
@@ -276,26 +360,194 @@ async def fetch_geocoding(
     return float(results[0]["latitude"]), float(results[0]["longitude"])
 
 
-async def fetch_open_meteo_forecast(
-    lat: float, lon: float, session: aiohttp.ClientSession
+async def fetch_wu_history(
+    url: str,
+    station_id: str,
+    api_key: str,
+    session: aiohttp.ClientSession,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 30,
 ) -> list[Dict[str, Any]]:
-    """Fetch 7-day forecast from Open-Meteo API."""
+    """Fetch the records of a WU PWS history endpoint in one request.
+
+    *url* is ``WU_HISTORY_DAY_URL`` (5-minute records) or
+    ``WU_HISTORY_WEEK_URL`` (hourly records); both answer with the
+    ``observations`` list of avg / high / low values in imperial units.
+    Returns [] on a non-200 answer; transport errors are raised.
+    """
+    params = {
+        "stationId": station_id,
+        "format": "json",
+        "units": "e",
+        "numericPrecision": "decimal",
+        "apiKey": api_key,
+    }
+    with track(metrics) as sample:
+        async with asyncio.timeout(timeout):
+            async with session.get(url, params=params) as resp:
+                sample.status = resp.status
+                if resp.status != 200:
+                    return []
+                data = await read_json(resp, sample)
+    return (data or {}).get("observations") or []
+
+
+async def read_json(resp: aiohttp.ClientResponse, sample: RequestSample) -> Any:
+    """Read and decode a JSON body, reporting its size and decode time."""
+    body = await resp.read()
+    sample.size = len(body)
+    start = time.perf_counter()
+    data = json.loads(body)
+    sample.decode_ms = (time.perf_counter() - start) * 1000
+    return data
+
+
+async def _get_json_cached(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Mapping[str, Any],
+    parse: Callable[[Any], Any],
+    *,
+    timeout: float,
+    headers: Mapping[str, str] | None = None,
+    http_cache: HttpCache | None = None,
+    metrics: EndpointMetrics | None = None,
+) -> Any | None:
+    """GET a JSON document and return ``parse(payload)``, or None on non-200.
+
+    With an ``http_cache`` the request is skipped entirely while the previous
+    answer is fresh (Expires / max-age), and sent conditionally
+    (If-Modified-Since / If-None-Match) afterwards; a 304 returns the
+    previously parsed value without parsing anything.  Transport errors are
+    raised to the caller.  Requests actually sent are recorded in *metrics*.
+    """
+    key = HttpCache.key(url, params) if http_cache is not None else None
+    req_headers = dict(headers or {})
+    if http_cache is not None:
+        cached = http_cache.get_fresh(key)
+        if cached is not None:
+            return cached
+        req_headers.update(http_cache.conditional_headers(key))
+
+    with track(metrics) as sample:
+        async with asyncio.timeout(timeout):
+            async with session.get(url, params=params, headers=req_headers) as resp:
+                sample.status = resp.status
+                if resp.status == 304 and http_cache is not None:
+                    cached = http_cache.revalidated(key, resp.headers)
+                    if cached is not None:
+                        return cached
+                if resp.status != 200:
+                    return None
+                data = await read_json(resp, sample)
+                resp_headers = resp.headers
+
+    result = parse(data)
+    if http_cache is not None and result:
+        http_cache.store(key, result, resp_headers)
+    return result
+
+
+class ForecastResult:
+    """A parsed forecast: the daily list plus the finer lists of the same payload.
+
+    The hourly / twice-daily lists are built from the retained part of the
+    payload on first access only, then kept, so they cost nothing unless a
+    card or automation subscribes to them.  Truthiness and ``len`` are those
+    of the daily list, which is what the caches and fallbacks look at.
+    """
+
+    def __init__(
+        self,
+        daily: list[Dict[str, Any]] | None = None,
+        hourly: Callable[[], list[Dict[str, Any]]] | None = None,
+        twice_daily: Callable[[], list[Dict[str, Any]]] | None = None,
+        sources: tuple[str, ...] = (),
+    ) -> None:
+        """Initialise from the daily list and the builders of the finer lists.
+
+        *sources* names the members of a merged (ensemble) forecast.
+        """
+        self.daily = daily or []
+        self.sources = sources
+        self._build_hourly = hourly
+        self._build_twice_daily = twice_daily
+
+    def __bool__(self) -> bool:
+        """Return True if there is a daily forecast."""
+        return bool(self.daily)
+
+    def __len__(self) -> int:
+        """Return the number of days."""
+        return len(self.daily)
+
+    @property
+    def has_hourly(self) -> bool:
+        """Return True if the payload carries an hourly forecast."""
+        return self._build_hourly is not None
+
+    @property
+    def has_twice_daily(self) -> bool:
+        """Return True if the payload carries a day / night forecast."""
+        return self._build_twice_daily is not None
+
+    @cached_property
+    def hourly(self) -> list[Dict[str, Any]]:
+        """Return the hourly forecast (timestamps in UTC), built once."""
+        return self._build_hourly() if self._build_hourly else []
+
+    @cached_property
+    def twice_daily(self) -> list[Dict[str, Any]]:
+        """Return the day / night forecast, built once."""
+        return self._build_twice_daily() if self._build_twice_daily else []
+
+
+async def fetch_open_meteo_forecast(
+    lat: float,
+    lon: float,
+    session: aiohttp.ClientSession,
+    http_cache: HttpCache | None = None,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 15,
+) -> ForecastResult:
+    """Fetch 7-day daily (and, from the same request, hourly) forecast from Open-Meteo API."""
     params = {
         "latitude": lat,
         "longitude": lon,
         "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode,cloudcover_mean,wind_speed_10m_max",
+        "hourly": "temperature_2m,precipitation,weathercode,cloudcover,relative_humidity_2m,wind_speed_10m,wind_direction_10m,is_day",
         "timezone": "auto",
         "forecast_days": 7,
     }
     try:
-        async with asyncio.timeout(15):
-            async with session.get(OPEN_METEO_FORECAST_URL, params=params) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        return await _get_json_cached(
+            session,
+            OPEN_METEO_FORECAST_URL,
+            params,
+            _parse_open_meteo_forecast,
+            timeout=timeout,
+            http_cache=http_cache,
+            metrics=metrics,
+        ) or ForecastResult()
     except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
-        return []
+        return ForecastResult()
+
+
+def _parse_open_meteo_forecast(data: Dict[str, Any]) -> ForecastResult:
+    """Convert an Open-Meteo forecast payload to the common formats."""
+    hourly = data.get("hourly")
+    return ForecastResult(
+        _parse_open_meteo_daily(data),
+        hourly=(
+            partial(_parse_open_meteo_hourly, hourly, data.get("utc_offset_seconds"))
+            if hourly
+            else None
+        ),
+    )
+
 
+def _parse_open_meteo_daily(data: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Convert an Open-Meteo daily forecast payload to the common daily format."""
     daily = data.get("daily", {})
     dates = daily.get("time", [])
     temp_max = daily.get("temperature_2m_max", [])
@@ -323,6 +575,59 @@ async def fetch_open_meteo_forecast(
     return forecast
 
 
+def _parse_open_meteo_hourly(
+    hourly: Dict[str, Any], utc_offset: Any
+) -> list[Dict[str, Any]]:
+    """Convert the ``hourly`` block of an Open-Meteo payload to the common hourly format.
+
+    With ``timezone=auto`` the times are local and offset-less; they are
+    shifted back by ``utc_offset_seconds`` to UTC.
+    """
+    offset = timedelta(seconds=_safe_float(utc_offset) or 0)
+    times = hourly.get("time") or []
+    columns = {
+        name: hourly.get(name) or []
+        for name in (
+            "temperature_2m",
+            "precipitation",
+            "weathercode",
+            "cloudcover",
+            "relative_humidity_2m",
+            "wind_speed_10m",
+            "wind_direction_10m",
+            "is_day",
+        )
+    }
+
+    def value(name: str, i: int) -> Any:
+        column = columns[name]
+        return column[i] if i < len(column) else None
+
+    forecast = []
+    for i, ts in enumerate(times):
+        try:
+            stamp = datetime.fromisoformat(ts) - offset
+        except (TypeError, ValueError):
+            continue
+        condition = _map_weathercode_to_condition(value("weathercode", i))
+        if condition == "sunny" and value("is_day", i) == 0:
+            condition = "clear-night"
+        wind_speed = _safe_float(value("wind_speed_10m", i))
+        forecast.append(
+            {
+                "datetime": stamp.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+                "temperature": value("temperature_2m", i),
+                "precipitation": value("precipitation", i),
+                "condition": condition,
+                "cloud_coverage": value("cloudcover", i),
+                "humidity": value("relative_humidity_2m", i),
+                "wind_bearing": value("wind_direction_10m", i),
+                "wind_speed": round(wind_speed, 1) if wind_speed is not None else None,
+            }
+        )
+    return forecast
+
+
 def _map_weathercode_to_condition(code: int | None) -> str:
     """Map Open-Meteo WMO weather code to Home Assistant condition."""
     if code is None:
@@ -385,11 +690,15 @@ async def fetch_wunderground_forecast(
     lon: float,
     api_key: str,
     session: aiohttp.ClientSession,
-) -> list[Dict[str, Any]]:
+    http_cache: HttpCache | None = None,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 15,
+) -> ForecastResult:
     """Fetch 7-day daily forecast from Weather.com (WU) v3 API.
 
-    Returns a list of daily dicts compatible with Open-Meteo output, or []
-    on any error / missing data.
+    Returns the daily dicts compatible with Open-Meteo output (plus the
+    day / night forecast of the ``daypart`` arrays), or an empty result on
+    any error / missing data.
     """
     params = {
         "geocode": f"{lat},{lon}",
@@ -399,14 +708,34 @@ async def fetch_wunderground_forecast(
         "apiKey": api_key,
     }
     try:
-        async with asyncio.timeout(15):
-            async with session.get(WU_FORECAST_URL, params=params) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        return await _get_json_cached(
+            session,
+            WU_FORECAST_URL,
+            params,
+            _parse_wunderground_forecast,
+            timeout=timeout,
+            http_cache=http_cache,
+            metrics=metrics,
+        ) or ForecastResult()
     except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
-        return []
+        return ForecastResult()
+
 
+def _parse_wunderground_forecast(data: Dict[str, Any]) -> ForecastResult:
+    """Convert a Weather.com v3 daily forecast payload to the common formats."""
+    daypart = (data.get("daypart") or [{}])[0]
+    return ForecastResult(
+        _parse_wunderground_daily(data),
+        twice_daily=(
+            partial(_parse_wunderground_twice_daily, data.get("validTimeLocal"), daypart)
+            if isinstance(daypart, dict) and daypart.get("dayOrNight")
+            else None
+        ),
+    )
+
+
+def _parse_wunderground_daily(data: Dict[str, Any]) -> list[Dict[str, Any]]:
+    """Convert a Weather.com v3 daily forecast payload to the common daily format."""
     dates = data.get("validTimeLocal") or []
     temp_max = data.get("calendarDayTemperatureMax") or []
     temp_min = data.get("calendarDayTemperatureMin") or []
@@ -450,6 +779,52 @@ async def fetch_wunderground_forecast(
     return forecast
 
 
+def _parse_wunderground_twice_daily(
+    dates: Any, daypart: Dict[str, Any]
+) -> list[Dict[str, Any]]:
+    """Convert the v3 ``daypart`` arrays to the common day / night format.
+
+    Index 2*i is the day and 2*i+1 the night of ``validTimeLocal[i]``; they
+    are stamped 07:00 and 19:00 local time.  Parts that have already passed
+    are null upstream and skipped.
+    """
+    dates = dates or []
+    day_or_night = daypart.get("dayOrNight") or []
+
+    def value(name: str, i: int) -> Any:
+        column = daypart.get(name) or []
+        return column[i] if i < len(column) else None
+
+    forecast = []
+    for i, part in enumerate(day_or_night):
+        ts = dates[i // 2] if i // 2 < len(dates) else None
+        if part not in ("D", "N") or not isinstance(ts, str) or len(ts) < 10:
+            continue
+        # "+0200" → "+02:00"
+        offset = ts[19:]
+        if len(offset) == 5:
+            offset = f"{offset[:3]}:{offset[3:]}"
+        is_daytime = part == "D"
+        condition = _map_wu_iconcode_to_condition(value("iconCode", i))
+        if condition == "sunny" and not is_daytime:
+            condition = "clear-night"
+        forecast.append(
+            {
+                "datetime": f"{ts[:10]}T{'07' if is_daytime else '19'}:00:00{offset}",
+                "is_daytime": is_daytime,
+                "temperature": value("temperature", i),
+                "precipitation": value("qpf", i),
+                "precipitation_probability": value("precipChance", i),
+                "condition": condition,
+                "cloud_coverage": value("cloudCover", i),
+                "humidity": value("relativeHumidity", i),
+                "wind_bearing": value("windDirection", i),
+                "wind_speed": value("windSpeed", i),
+            }
+        )
+    return forecast
+
+
 # ---------------------------------------------------------------------------
 # MET.no forecast
 # ---------------------------------------------------------------------------
@@ -459,164 +834,52 @@ _METNO_HEADERS = {
     "User-Agent": "ha-wunderground-pws/1.4.1 github.com/aiasz/ha-wunderground-pws",
 }
 
-# Map MET.no symbol_code prefix to HA condition
-_METNO_SYMBOL_MAP: dict[str, str] = {
-    "clearsky": "sunny",
-    "fair": "sunny",
-    "partlycloudy": "partlycloudy",
-    "mostlycloudy": "cloudy",
-    "cloudy": "cloudy",
-    "fog": "fog",
-    "lightrain": "rainy",
-    "rain": "rainy",
-    "heavyrain": "pouring",
-    "lightrainshowers": "rainy",
-    "rainshowers": "rainy",
-    "heavyrainshowers": "pouring",
-    "lightsleet": "snowy-rainy",
-    "sleet": "snowy-rainy",
-    "heavysleet": "snowy-rainy",
-    "lightsleetshowers": "snowy-rainy",
-    "sleetshowers": "snowy-rainy",
-    "heavysleetshowers": "snowy-rainy",
-    "lightsnow": "snowy",
-    "snow": "snowy",
-    "heavysnow": "snowy",
-    "lightsnowshowers": "snowy",
-    "snowshowers": "snowy",
-    "heavysnowshowers": "snowy",
-    "thunder": "lightning",
-    "lightrainandthunder": "lightning-rainy",
-    "rainandthunder": "lightning-rainy",
-    "heavyrainandthunder": "lightning-rainy",
-    "lightsleetandthunder": "lightning-rainy",
-    "sleetandthunder": "lightning-rainy",
-    "lightsnowandthunder": "lightning-rainy",
-    "snowandthunder": "lightning-rainy",
-    "lightrainshowersandthunder": "lightning-rainy",
-    "rainshowersandthunder": "lightning-rainy",
-    "heavyrainshowersandthunder": "lightning-rainy",
-    "lightsleetshowersandthunder": "lightning-rainy",
-    "sleetshowersandthunder": "lightning-rainy",
-    "lightsnowshowersandthunder": "lightning-rainy",
-    "snowshowersandthunder": "lightning-rainy",
-}
-
-
-def _map_metno_symbol(symbol_code: str | None) -> str:
-    """Map a MET.no symbol_code to a Home Assistant condition."""
-    if not symbol_code:
-        return "unknown"
-    # strip _day / _night / _polartwilight suffix: "clearsky_day" → "clearsky"
-    base = symbol_code.split("_")[0]
-    return _METNO_SYMBOL_MAP.get(base, "partlycloudy")
 
 
 async def fetch_metno_forecast(
     lat: float,
     lon: float,
     session: aiohttp.ClientSession,
-) -> list[Dict[str, Any]]:
+    http_cache: HttpCache | None = None,
+    tz: tzinfo | None = None,
+    metrics: EndpointMetrics | None = None,
+    timeout: float = 20,
+) -> ForecastResult:
     """Fetch 7-day daily forecast from MET.no (free, no key needed).
 
-    Aggregates hourly data to daily: uses max temp, min temp, total
-    precipitation, and the most-frequent daytime symbol code.
-    Returns a list of daily dicts, or [] on error.
+    Aggregates hourly data to daily (see ``aggregation.aggregate_metno_daily``):
+    uses max temp, min temp, total precipitation, and the most-frequent
+    daytime symbol code, bucketed by the local date in *tz* (UTC if None).
+    The hourly part of the same timeseries backs the hourly forecast.
+    Returns the daily dicts, or an empty result on error.
+
+    MET.no's terms of service require honouring ``Expires`` and sending
+    ``If-Modified-Since``; pass an ``http_cache`` to do so.
     """
     params = {"lat": round(lat, 4), "lon": round(lon, 4)}
     try:
-        async with asyncio.timeout(20):
-            async with session.get(
-                METNO_FORECAST_URL, params=params, headers=_METNO_HEADERS
-            ) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
+        return await _get_json_cached(
+            session,
+            METNO_FORECAST_URL,
+            params,
+            partial(_parse_metno_forecast, tz=tz),
+            timeout=timeout,
+            headers=_METNO_HEADERS,
+            http_cache=http_cache,
+            metrics=metrics,
+        ) or ForecastResult()
     except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
-        return []
+        return ForecastResult()
+
 
+def _parse_metno_forecast(
+    data: Dict[str, Any], tz: tzinfo | None = None
+) -> ForecastResult:
+    """Aggregate a MET.no compact payload to the common daily / hourly formats."""
     timeseries = (data.get("properties") or {}).get("timeseries") or []
     if not timeseries:
-        return []
-
-    # Aggregate hourly → daily buckets
-    daily: dict[str, dict[str, Any]] = {}
-
-    for entry in timeseries:
-        ts_str = entry.get("time", "")
-        try:
-            dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        except ValueError:
-            continue
-
-        date_key = dt.strftime("%Y-%m-%d")
-        instant = (entry.get("data") or {}).get("instant", {}).get("details") or {}
-        temp = _safe_float(instant.get("air_temperature"))
-        # wind_speed from MET.no is in m/s → convert to km/h
-        wind_ms = _safe_float(instant.get("wind_speed"))
-        wind_kmh = round(wind_ms * 3.6, 1) if wind_ms is not None else None
-
-        # Prefer next_12_hours symbol for daytime, fall back to next_6_hours / next_1_hour
-        next12 = (entry.get("data") or {}).get("next_12_hours") or {}
-        next6 = (entry.get("data") or {}).get("next_6_hours") or {}
-        next1 = (entry.get("data") or {}).get("next_1_hours") or {}
-
-        symbol = (
-            (next12.get("summary") or {}).get("symbol_code")
-            or (next6.get("summary") or {}).get("symbol_code")
-            or (next1.get("summary") or {}).get("symbol_code")
-        )
-        precip = _safe_float(
-            (next6.get("details") or {}).get("precipitation_amount")
-            or (next1.get("details") or {}).get("precipitation_amount")
-        )
-
-        if date_key not in daily:
-            daily[date_key] = {
-                "temps": [],
-                "wind_speeds": [],
-                "precip": 0.0,
-                "symbols": {},
-            }
-        if temp is not None:
-            daily[date_key]["temps"].append(temp)
-        if wind_kmh is not None:
-            daily[date_key]["wind_speeds"].append(wind_kmh)
-        if precip is not None:
-            daily[date_key]["precip"] += precip
-        if symbol:
-            daily[date_key]["symbols"][symbol] = (
-                daily[date_key]["symbols"].get(symbol, 0) + 1
-            )
-
-    # Build output list (7 days max, skip past dates)
-    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    forecast = []
-    for date_key in sorted(daily.keys()):
-        if date_key < today_str:
-            continue
-        if len(forecast) >= 7:
-            break
-        bucket = daily[date_key]
-        temps = bucket["temps"]
-        temp_max = round(max(temps), 1) if temps else None
-        temp_min = round(min(temps), 1) if temps else None
-        # Max wind speed of the day
-        winds = bucket["wind_speeds"]
-        wind_max = round(max(winds), 1) if winds else None
-        # Most frequent symbol
-        symbols = bucket["symbols"]
-        dominant = max(symbols, key=symbols.get) if symbols else None
-        forecast.append(
-            {
-                "datetime": date_key,
-                "temperature": temp_max,
-                "templow": temp_min,
-                "precipitation": round(bucket["precip"], 1),
-                "condition": _map_metno_symbol(dominant),
-                "cloud_coverage": None,
-                "wind_speed": wind_max,
-            }
-        )
-
-    return forecast
+        return ForecastResult()
+    return ForecastResult(
+        aggregate_metno_daily(timeseries, tz),
+        hourly=partial(metno_hourly, timeseries),
+    )
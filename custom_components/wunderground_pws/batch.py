@@ -0,0 +1,319 @@
+"""Columnar conversion of many WU PWS observations at once.
+
+Sok megfigyeles (elozmeny-potlas, tobb allomas) atalakitasa oszloponkent:
+a mezoket egyszer gyujti ki, az egysegvaltasokat es a szamitott ertekeket
+(felhoalap, abszolut paratartalom, szelhutes, egtaj, idojaras-allapot)
+NumPy-val egyszerre szamolja, ha elerheto, kulonben (es kis kotegeknel)
+oszloponkenti tiszta Python listakkal.  Az eredmeny bitre megegyezik az
+``enrich_observation`` soronkenti eredmenyevel: a tiszta Python ut ugyanazt
+a muveleti sorrendet koveti, a NumPy utnal pedig a kerekitesi hatarhoz tul
+kozeli (vagy nem veges) ertekeket tartalmazo sorokat a skalar kod szamolja
+ujra.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import fields
+from typing import Any
+
+from .api import Observation, _safe_float, determine_condition, enrich_observation
+
+try:
+    import numpy as np
+except ImportError:  # optional speed-up only
+    np = None
+
+# Below this many observations the scalar path is faster than NumPy
+_NUMPY_MIN_BATCH = 64
+# A vectorised result this close to a rounding boundary (in units of the
+# last kept digit) is recomputed by the scalar code
+_ROUNDING_GUARD = 1e-6
+
+_COMPASS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW",
+)
+_COMPASS_HU = (
+    "É", "ÉÉK", "ÉK", "KÉK", "K", "KDK", "DK", "DDK",
+    "D", "DDNy", "DNy", "NyDNy", "Ny", "NyÉNy", "ÉNy", "ÉÉNy",
+)
+_FIELDS = tuple(field.name for field in fields(Observation))
+
+
+def enrich_observations(batch: Iterable[dict[str, Any]]) -> list[Observation]:
+    """Convert many WU PWS observations; same results as ``enrich_observation``.
+
+    Uses the columnar NumPy path for large batches and the pure-Python
+    columnar path otherwise (or without NumPy).
+    """
+    batch = list(batch)
+    if np is None or len(batch) < _NUMPY_MIN_BATCH:
+        return _enrich_columns(batch)
+    return _enrich_numpy(batch)
+
+
+def _floats(values: Iterable[Any]) -> list[float | None]:
+    """``_safe_float`` of a column, skipping the call for plain numbers."""
+    return [
+        value
+        if type(value) is float
+        else float(value)
+        if type(value) is int
+        else _safe_float(value)
+        for value in values
+    ]
+
+
+def _text_columns(batch: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Return the columns copied from the observations (ids, times, place)."""
+    return {
+        "station_id": [obs.get("stationID") for obs in batch],
+        "obs_time_utc": [obs.get("obsTimeUtc") for obs in batch],
+        "last_updated": [
+            obs.get("obsTimeLocal") or obs.get("obsTimeUtc") for obs in batch
+        ],
+        "location_name": [
+            obs.get("neighborhood") or obs.get("stationID") for obs in batch
+        ],
+        "country": [obs.get("country") for obs in batch],
+        "lat": _floats(obs.get("lat") for obs in batch),
+        "lon": _floats(obs.get("lon") for obs in batch),
+    }
+
+
+def _enrich_columns(batch: list[dict[str, Any]]) -> list[Observation]:
+    """The pure-Python columnar path of ``enrich_observations``.
+
+    Each formula is the one of ``enrich_observation``, with the same
+    operation order, applied to a whole column in one comprehension.
+    """
+    exp = math.exp
+    imperial = [obs.get("imperial") or {} for obs in batch]
+
+    def raw(key: str) -> list[float | None]:
+        return _floats(imp.get(key) for imp in imperial)
+
+    def f_to_c(key: str) -> list[float | None]:
+        return [
+            None if f is None else round((f - 32.0) * 5.0 / 9.0, 1) for f in raw(key)
+        ]
+
+    def converted(key: str, factor: float, digits: int) -> list[float | None]:
+        return [None if v is None else round(v * factor, digits) for v in raw(key)]
+
+    winddir = _floats(obs.get("winddir") for obs in batch)
+    humidity = _floats(obs.get("humidity") for obs in batch)
+    uv = _floats(obs.get("uv") for obs in batch)
+    solar = _floats(obs.get("solarRadiation") for obs in batch)
+    temp_c = f_to_c("temp")
+    dewpt_c = f_to_c("dewpt")
+    heat_c = f_to_c("heatIndex")
+    wind_kmh = converted("windSpeed", 1.609344, 1)
+    precip_rate = converted("precipRate", 25.4, 2)
+    sectors = [
+        None if d is None else int((d % 360 + 11.25) / 22.5) % 16 for d in winddir
+    ]
+
+    columns: dict[str, list[Any]] = {
+        **_text_columns(batch),
+        "elevation_m": converted("elev", 0.3048, 1),
+        "temperature": temp_c,
+        "feels_like": heat_c,
+        "dew_point": dewpt_c,
+        "heat_index": heat_c,
+        "wind_chill": [
+            None
+            if t is None or w is None or t >= 10.0 or w <= 4.8
+            else round(
+                13.12 + 0.6215 * t - 11.37 * (w**0.16) + 0.3965 * t * (w**0.16), 1
+            )
+            for t, w in zip(temp_c, wind_kmh)
+        ],
+        "humidity": humidity,
+        "absolute_humidity": [
+            None
+            if t is None or h is None
+            else round(
+                ((h / 100.0) * (6.112 * exp((17.67 * t) / (t + 243.5))) * 100 * 2.1674)
+                / (t + 273.15),
+                2,
+            )
+            for t, h in zip(temp_c, humidity)
+        ],
+        "pressure": converted("pressure", 33.8638866667, 2),
+        "wind_speed": wind_kmh,
+        "wind_gust": converted("windGust", 1.609344, 1),
+        "wind_bearing": winddir,
+        "wind_compass": [None if i is None else _COMPASS[i] for i in sectors],
+        "wind_compass_hu": [None if i is None else _COMPASS_HU[i] for i in sectors],
+        "precipitation": converted("precipTotal", 25.4, 2),
+        "precipitation_rate": precip_rate,
+        "solar_radiation": solar,
+        "uv_index": uv,
+        "cloud_base": [
+            None
+            if t is None or d is None
+            else 0.0
+            if t - d <= 0
+            else round(((t - d) / 2.5) * 305, 1)
+            for t, d in zip(temp_c, dewpt_c)
+        ],
+        "condition": list(map(determine_condition, precip_rate, uv, solar)),
+    }
+    return list(map(Observation, *(columns[name] for name in _FIELDS)))
+
+
+def _column(values: list[float | None]) -> tuple[Any, Any]:
+    """Return *values* as a float array (NaN = missing) and a mask of the
+    rows holding a real non-finite number (NaN / inf from upstream)."""
+    missing = np.fromiter((v is None for v in values), bool, len(values))
+    array = np.fromiter(
+        (np.nan if v is None else v for v in values), float, len(values)
+    )
+    return array, ~missing & ~np.isfinite(array)
+
+
+def _round(values: Any, digits: int) -> tuple[Any, Any]:
+    """Vectorised ``round(values, digits)``, plus a mask of the doubtful results.
+
+    Away from a rounding boundary ``rint(x * 10**d) / 10**d`` is the double
+    nearest to the correctly rounded decimal, i.e. exactly what ``round``
+    returns; values within ``_ROUNDING_GUARD`` of a boundary are flagged.
+    """
+    scale = 10.0**digits
+    with np.errstate(invalid="ignore"):
+        scaled = values * scale
+        doubtful = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < _ROUNDING_GUARD
+    return np.rint(scaled) / scale, doubtful
+
+
+def _as_list(values: Any) -> list[float | None]:
+    """Return an array as Python floats, NaN as None."""
+    return [None if v != v else v for v in values.tolist()]
+
+
+def _enrich_numpy(batch: list[dict[str, Any]]) -> list[Observation]:
+    """The columnar path of ``enrich_observations``."""
+    imperial = [obs.get("imperial") or {} for obs in batch]
+    top = {
+        key: [_safe_float(obs.get(key)) for obs in batch]
+        for key in ("winddir", "humidity", "uv", "solarRadiation")
+    }
+    raw = {
+        key: _column([_safe_float(imp.get(key)) for imp in imperial])
+        for key in (
+            "temp",
+            "dewpt",
+            "heatIndex",
+            "windSpeed",
+            "windGust",
+            "pressure",
+            "precipRate",
+            "precipTotal",
+            "elev",
+        )
+    }
+    winddir, bad_winddir = _column(top["winddir"])
+    humidity, bad_humidity = _column(top["humidity"])
+    uv, bad_uv = _column(top["uv"])
+    solar, bad_solar = _column(top["solarRadiation"])
+    doubtful = bad_winddir | bad_humidity | bad_uv | bad_solar
+    for _, bad in raw.values():
+        doubtful |= bad
+
+    def converted(key: str, factor: float, digits: int) -> Any:
+        nonlocal doubtful
+        rounded, unsure = _round(raw[key][0] * factor, digits)
+        doubtful |= unsure
+        return rounded
+
+    def f_to_c(key: str) -> Any:
+        nonlocal doubtful
+        rounded, unsure = _round((raw[key][0] - 32.0) * 5.0 / 9.0, 1)
+        doubtful |= unsure
+        return rounded
+
+    temp_c = f_to_c("temp")
+    dewpt_c = f_to_c("dewpt")
+    heat_c = f_to_c("heatIndex")
+    wind_kmh = converted("windSpeed", 1.609344, 1)
+    gust_kmh = converted("windGust", 1.609344, 1)
+    pressure = converted("pressure", 33.8638866667, 2)
+    precip_rate = converted("precipRate", 25.4, 2)
+    precip_total = converted("precipTotal", 25.4, 2)
+    elevation = converted("elev", 0.3048, 1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # wind chill only below 10 °C and above 4.8 km/h
+        chill_rows = (temp_c < 10.0) & (wind_kmh > 4.8)
+        power = wind_kmh**0.16
+        wind_chill, unsure = _round(
+            13.12 + 0.6215 * temp_c - 11.37 * power + 0.3965 * temp_c * power, 1
+        )
+        wind_chill[~chill_rows] = np.nan
+        doubtful |= unsure & chill_rows
+
+        # Magnus formula; the scalar code raises on a zero denominator
+        doubtful |= (temp_c + 243.5 == 0) | (temp_c + 273.15 == 0)
+        saturation = 6.112 * np.exp((17.67 * temp_c) / (temp_c + 243.5))
+        vapour = (humidity / 100.0) * saturation
+        absolute_humidity, unsure = _round(
+            (vapour * 100 * 2.1674) / (temp_c + 273.15), 2
+        )
+        doubtful |= unsure & np.isfinite(absolute_humidity)
+
+        spread = temp_c - dewpt_c
+        cloud_base, unsure = _round((spread / 2.5) * 305, 1)
+        doubtful |= unsure & (spread > 0)
+        cloud_base[spread <= 0] = 0.0
+
+    has_dir = np.isfinite(winddir)
+    sector = np.zeros(len(batch), dtype=np.intp)
+    sector[has_dir] = ((winddir[has_dir] % 360 + 11.25) / 22.5).astype(np.intp) % 16
+
+    rate = np.nan_to_num(precip_rate, nan=0.0)
+    solar0 = np.nan_to_num(solar, nan=0.0)
+    uv0 = np.nan_to_num(uv, nan=0.0)
+    condition = np.select(
+        [rate > 0, (solar0 > 600) & (uv0 > 5), solar0 > 200, solar0 < 50],
+        ["rainy", "sunny", "partlycloudy", "cloudy"],
+        "partlycloudy",
+    ).tolist()
+
+    directions = sector.tolist()
+    has_dir_list = has_dir.tolist()
+    columns: dict[str, list[Any]] = {
+        **_text_columns(batch),
+        "elevation_m": _as_list(elevation),
+        "temperature": _as_list(temp_c),
+        "feels_like": _as_list(heat_c),
+        "dew_point": _as_list(dewpt_c),
+        "heat_index": _as_list(heat_c),
+        "wind_chill": _as_list(wind_chill),
+        "humidity": top["humidity"],
+        "absolute_humidity": _as_list(absolute_humidity),
+        "pressure": _as_list(pressure),
+        "wind_speed": _as_list(wind_kmh),
+        "wind_gust": _as_list(gust_kmh),
+        "wind_bearing": top["winddir"],
+        "wind_compass": [
+            _COMPASS[i] if ok else None for i, ok in zip(directions, has_dir_list)
+        ],
+        "wind_compass_hu": [
+            _COMPASS_HU[i] if ok else None for i, ok in zip(directions, has_dir_list)
+        ],
+        "precipitation": _as_list(precip_total),
+        "precipitation_rate": _as_list(precip_rate),
+        "solar_radiation": top["solarRadiation"],
+        "uv_index": top["uv"],
+        "cloud_base": _as_list(cloud_base),
+        "condition": condition,
+    }
+    result = list(map(Observation, *(columns[name] for name in _FIELDS)))
+    for i in np.flatnonzero(doubtful).tolist():
+        result[i] = enrich_observation(batch[i])
+    return result
@@ -0,0 +1,100 @@
+"""Circuit breaker for the upstream APIs (WU observation, forecast sources).
+
+N egymast koveto hiba utan a forras "nyitott" allapotba kerul: a hivasok
+azonnal kimaradnak (nem kell kivarni a timeoutot), es exponencialisan novo,
+veletlenszeruen szort (jitter) idokozonkent egy-egy probahivas tortenik.
+Sikeres probanal a breaker ujra zar.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+from .const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_DELAY,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Skip a failing upstream instead of waiting out its timeout every time."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_delay: float = BREAKER_BASE_DELAY,
+        max_delay: float = BREAKER_MAX_DELAY,
+    ) -> None:
+        """Initialise a closed breaker."""
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._trips = 0  # failed probes since the breaker opened
+        self._retry_at = 0.0  # time.monotonic() of the next probe
+        self.last_error: str | None = None
+
+    def allow(self) -> bool:
+        """Return True if a call may go through now.
+
+        Once the retry time of an open breaker has passed, exactly one probe
+        call is let through (half-open) until its outcome is recorded.  A probe
+        whose outcome never arrives (e.g. a cancelled hedge) is replaced by a
+        new one after ``base_delay``.
+        """
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        self.state = STATE_HALF_OPEN
+        self._retry_at = now + self._base_delay
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._trips = 0
+        self.last_error = None
+
+    def record_failure(self, error: str | None = None) -> None:
+        """Count a failed call; open (or re-open) the breaker when due."""
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.state == STATE_HALF_OPEN or (
+            self.consecutive_failures >= self._failure_threshold
+        ):
+            self._trips += 1
+            delay = min(self._max_delay, self._base_delay * 2 ** (self._trips - 1))
+            # "Equal jitter": spread the probes of many entries / restarts
+            self._retry_at = time.monotonic() + random.uniform(delay / 2, delay)
+            self.state = STATE_OPEN
+
+    @property
+    def retry_in(self) -> float | None:
+        """Return seconds until the next probe (None unless open)."""
+        if self.state != STATE_OPEN:
+            return None
+        return max(0.0, round(self._retry_at - time.monotonic(), 1))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": self.retry_in,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,65 @@
+"""Time budget of one coordinator refresh cycle.
+
+Egy frissitesi ciklus osszes hivasa (megfigyeles, kulcs-felderites,
+geokodolas, elorejelzes-forrasok) egy kozos hataridon osztozik: minden
+hivas legfeljebb a meg hatralevo idot kapja timeoutnak, az opcionalis
+lepesek pedig kimaradnak, ha mar nem fernek bele.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .const import BUDGET_MIN_STAGE
+
+
+class RefreshBudget:
+    """A deadline shared by the calls of one refresh, with per-stage usage."""
+
+    def __init__(self, total: float) -> None:
+        """Start the budget: *total* seconds from now."""
+        self.total = total
+        self._deadline = time.monotonic() + total
+        self.usage: dict[str, float] = {}
+        self.skipped: list[str] = []
+
+    @property
+    def remaining(self) -> float:
+        """Return the seconds left (never negative)."""
+        return max(0.0, self._deadline - time.monotonic())
+
+    def allows(self, stage: str) -> bool:
+        """Return True if an optional *stage* still fits; record it if not."""
+        if self.remaining >= BUDGET_MIN_STAGE:
+            return True
+        self.skipped.append(stage)
+        return False
+
+    def timeout(self, limit: float) -> float:
+        """Return the timeout for a call normally limited to *limit* seconds."""
+        return min(limit, self.remaining)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Account the time spent in the ``with`` block to *name*."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.usage[name] = round(
+                self.usage.get(name, 0.0) + time.monotonic() - start, 3
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the budget, its usage by stage and the skipped stages."""
+        return {
+            "total": self.total,
+            "used": round(self.total - self.remaining, 3),
+            "stages": dict(self.usage),
+            "skipped": list(self.skipped),
+        }
@@ -0,0 +1,254 @@
+"""Cache layers for the Wunderground PWS integration.
+
+A cache-ek tisztan memoriaban elnek; a perzisztenciat (HA ``Store``) a
+koordinator intezi az ``as_dict`` / ``from_dict`` parokon keresztul.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any
+
+from .const import (
+    FORECAST_GRID_STEP,
+    GEOCODING_NEGATIVE_TTL,
+    HTTP_CACHE_MAX_ENTRIES,
+)
+
+
+def normalize_city(city: str) -> str:
+    """Normalise a city name for use as a cache key."""
+    return " ".join(city.split()).casefold()
+
+
+class GeocodingCache:
+    """City name → (lat, lon) results, serialisable to a HA ``Store``.
+
+    Positive results never expire; they are only dropped when the configured
+    city changes (see ``retain_only``).  "No result" answers are cached as
+    well, but are retried after ``negative_ttl`` seconds.
+    """
+
+    def __init__(self, negative_ttl: float = GEOCODING_NEGATIVE_TTL) -> None:
+        """Initialise an empty cache."""
+        self._negative_ttl = negative_ttl
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def lookup(self, city: str) -> tuple[bool, tuple[float, float] | None]:
+        """Return ``(hit, result)``.
+
+        ``(True, None)`` is a cached "no result" answer, ``(False, None)`` a
+        miss (or an expired negative entry) that must be geocoded.
+        """
+        entry = self._entries.get(normalize_city(city))
+        if entry is None:
+            return False, None
+        if entry.get("lat") is None or entry.get("lon") is None:
+            if time.time() - entry.get("resolved_at", 0) > self._negative_ttl:
+                return False, None
+            return True, None
+        return True, (entry["lat"], entry["lon"])
+
+    def store(self, city: str, result: tuple[float, float] | None) -> None:
+        """Remember a geocoding answer (``None`` = city not found)."""
+        lat, lon = result if result is not None else (None, None)
+        self._entries[normalize_city(city)] = {
+            "lat": lat,
+            "lon": lon,
+            "resolved_at": time.time(),
+        }
+
+    def retain_only(self, city: str) -> bool:
+        """Drop every entry except *city*. Returns True if anything was removed."""
+        key = normalize_city(city)
+        stale = [k for k in self._entries if k != key]
+        for k in stale:
+            del self._entries[k]
+        return bool(stale)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation for the Store."""
+        return {"entries": self._entries}
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any] | None, negative_ttl: float = GEOCODING_NEGATIVE_TTL
+    ) -> GeocodingCache:
+        """Rebuild a cache from ``as_dict`` output (``None`` = empty cache)."""
+        cache = cls(negative_ttl)
+        for key, entry in ((data or {}).get("entries") or {}).items():
+            if isinstance(entry, dict):
+                cache._entries[key] = entry
+        return cache
+
+
+@dataclass(slots=True)
+class _HttpCacheEntry:
+    """One cached response: its validators plus the already-parsed value."""
+
+    value: Any
+    expires: float = 0.0  # time.time() until which no request is needed
+    last_modified: str | None = None
+    etag: str | None = None
+
+
+class HttpCache:
+    """Minimal HTTP cache honouring Expires / Cache-Control and validators.
+
+    Only the *parsed* result is kept, so a fresh hit or a 304 answer costs
+    neither a download nor a JSON parse.
+    """
+
+    def __init__(self, max_entries: int = HTTP_CACHE_MAX_ENTRIES) -> None:
+        """Initialise an empty cache."""
+        self._max_entries = max_entries
+        self._entries: dict[tuple, _HttpCacheEntry] = {}
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None) -> tuple:
+        """Build a cache key from the request URL and query parameters."""
+        return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+    def get_fresh(self, key: tuple) -> Any | None:
+        """Return the cached value if it may be used without a request."""
+        entry = self._entries.get(key)
+        if entry is not None and time.time() < entry.expires:
+            return entry.value
+        return None
+
+    def conditional_headers(self, key: tuple) -> dict[str, str]:
+        """Return If-Modified-Since / If-None-Match headers for a revalidation."""
+        entry = self._entries.get(key)
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        return headers
+
+    def revalidated(self, key: tuple, headers: Mapping[str, str]) -> Any | None:
+        """Handle a 304 answer: extend freshness and return the cached value."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.expires = _expiry_from_headers(headers)
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.etag = headers.get("ETag") or entry.etag
+        return entry.value
+
+    def store(self, key: tuple, value: Any, headers: Mapping[str, str]) -> None:
+        """Remember a parsed 200 answer if its headers make it cacheable."""
+        if "no-store" in headers.get("Cache-Control", ""):
+            self._entries.pop(key, None)
+            return
+        entry = _HttpCacheEntry(
+            value=value,
+            expires=_expiry_from_headers(headers),
+            last_modified=headers.get("Last-Modified"),
+            etag=headers.get("ETag"),
+        )
+        if not (entry.expires or entry.last_modified or entry.etag):
+            self._entries.pop(key, None)
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
+
+
+def _expiry_from_headers(headers: Mapping[str, str]) -> float:
+    """Return the time.time() at which a response goes stale (0 = already stale).
+
+    ``Cache-Control: max-age`` wins over ``Expires``; ``Expires`` is taken
+    relative to the server's ``Date`` header to be immune to clock skew.
+    """
+    cache_control = headers.get("Cache-Control", "")
+    if "no-cache" in cache_control:
+        return 0.0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return time.time() + max(0, int(value))
+            except ValueError:
+                break
+
+    expires = _parse_http_date(headers.get("Expires"))
+    if expires is None:
+        return 0.0
+    server_now = _parse_http_date(headers.get("Date"))
+    if server_now is None:
+        return expires
+    return time.time() + max(0.0, expires - server_now)
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    """Parse an RFC 7231 HTTP date into a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def snap_to_grid(
+    lat: float, lon: float, step: float = FORECAST_GRID_STEP
+) -> tuple[float, float]:
+    """Round coordinates to the shared forecast grid."""
+    return round(round(lat / step) * step, 4), round(round(lon / step) * step, 4)
+
+
+class SharedForecastCache:
+    """Forecast results shared by every config entry of the integration.
+
+    Keyed by source + grid cell, so nearby stations reuse one download.
+    Concurrent requests for the same key await a single in-flight fetch; the
+    fetch is shielded, so a cancelled caller (e.g. a hedged loser) does not
+    abort it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self.http_cache = HttpCache()
+        self._entries: dict[tuple, tuple[float, Any]] = {}
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    async def async_get(
+        self,
+        key: tuple,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for *key*, fetching it at most once per TTL."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._fetch_done, key, ttl))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: tuple, ttl: float, task: asyncio.Task) -> None:
+        """Store a finished fetch; empty results and errors are not cached."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if not result:
+            return
+        now = time.monotonic()
+        for stale in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[stale]
+        self._entries[key] = (now + ttl, result)
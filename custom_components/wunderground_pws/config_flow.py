@@ -36,6 +36,25 @@ from .const import (
     DEFAULT_CITY,
     DEFAULT_FORECAST_SOURCE,
     FORECAST_SOURCES,
+    CONF_FORECAST_INTERVAL,
+    DEFAULT_FORECAST_INTERVAL,
+    MAX_FORECAST_INTERVAL,
+    CONF_FORECAST_HEDGE_DELAY,
+    DEFAULT_FORECAST_HEDGE_DELAY,
+    MAX_FORECAST_HEDGE_DELAY,
+    CONF_ADAPTIVE_POLLING,
+    CONF_STALE_WINDOW,
+    CONF_SENSOR_STATISTICS,
+    CONF_LOCAL_PUSH,
+    CONF_PUSH_PASSWORD,
+    CONF_PUSH_POLL_FALLBACK,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_STALE_WINDOW,
+    MAX_STALE_WINDOW,
+    DEFAULT_SENSOR_STATISTICS,
+    DEFAULT_LOCAL_PUSH,
+    DEFAULT_PUSH_PASSWORD,
+    DEFAULT_PUSH_POLL_FALLBACK,
     MIN_SCAN_INTERVAL,
     MAX_SCAN_INTERVAL,
 )
@@ -245,6 +264,22 @@ class WundergroundPWSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 # ---------------------------------------------------------------------------
 
 
+def _push_errors(user_input: dict[str, Any]) -> dict[str, str]:
+    """Return the form errors of the local push options (empty if valid)."""
+    if not user_input.get(CONF_LOCAL_PUSH):
+        return {}
+    if not user_input.get(CONF_PUSH_PASSWORD):
+        return {CONF_PUSH_PASSWORD: "push_password_required"}
+    if (
+        not user_input.get(CONF_PUSH_POLL_FALLBACK, DEFAULT_PUSH_POLL_FALLBACK)
+        and not user_input.get(CONF_CITY)
+        and not user_input.get(CONF_API_KEY)
+    ):
+        # uploads carry no location: nothing would locate the forecast
+        return {"base": "push_only_location"}
+    return {}
+
+
 class WundergroundPWSOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Wunderground PWS."""
 
@@ -254,10 +289,15 @@ class WundergroundPWSOptionsFlow(config_entries.OptionsFlow):
         """Manage the options.
 
         Saving with an empty api_key triggers background re-discovery on the
-        next integration reload (handled by the coordinator).
+        next integration reload (handled by the coordinator).  Local push
+        needs a password, and without the polling fallback a city or an API
+        key (for the one cloud poll that locates the station).
         """
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            errors = _push_errors(user_input)
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
         current_station = self.config_entry.options.get(
             CONF_STATION_ID,
@@ -277,6 +317,45 @@ class WundergroundPWSOptionsFlow(config_entries.OptionsFlow):
             CONF_FORECAST_SOURCE,
             self.config_entry.data.get(CONF_FORECAST_SOURCE, DEFAULT_FORECAST_SOURCE),
         )
+        current_forecast_interval = self.config_entry.options.get(
+            CONF_FORECAST_INTERVAL,
+            self.config_entry.data.get(CONF_FORECAST_INTERVAL, DEFAULT_FORECAST_INTERVAL),
+        )
+        current_hedge_delay = self.config_entry.options.get(
+            CONF_FORECAST_HEDGE_DELAY,
+            self.config_entry.data.get(
+                CONF_FORECAST_HEDGE_DELAY, DEFAULT_FORECAST_HEDGE_DELAY
+            ),
+        )
+
+        current_adaptive = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING,
+            self.config_entry.data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        )
+        current_stale_window = self.config_entry.options.get(
+            CONF_STALE_WINDOW,
+            self.config_entry.data.get(CONF_STALE_WINDOW, DEFAULT_STALE_WINDOW),
+        )
+        current_sensor_statistics = self.config_entry.options.get(
+            CONF_SENSOR_STATISTICS,
+            self.config_entry.data.get(
+                CONF_SENSOR_STATISTICS, DEFAULT_SENSOR_STATISTICS
+            ),
+        )
+        current_local_push = self.config_entry.options.get(
+            CONF_LOCAL_PUSH,
+            self.config_entry.data.get(CONF_LOCAL_PUSH, DEFAULT_LOCAL_PUSH),
+        )
+        current_push_password = self.config_entry.options.get(
+            CONF_PUSH_PASSWORD,
+            self.config_entry.data.get(CONF_PUSH_PASSWORD, DEFAULT_PUSH_PASSWORD),
+        )
+        current_push_poll_fallback = self.config_entry.options.get(
+            CONF_PUSH_POLL_FALLBACK,
+            self.config_entry.data.get(
+                CONF_PUSH_POLL_FALLBACK, DEFAULT_PUSH_POLL_FALLBACK
+            ),
+        )
 
         options_schema = vol.Schema(
             {
@@ -287,11 +366,53 @@ class WundergroundPWSOptionsFlow(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                # Learn the station's upload cadence; scan_interval is then unused
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=current_adaptive): bool,
+                # minutes to keep serving the last observation on errors; 0 = off
+                vol.Optional(
+                    CONF_STALE_WINDOW, default=current_stale_window
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_STALE_WINDOW),
+                ),
+                # off: no state_class, history only from the imported statistics
+                vol.Optional(
+                    CONF_SENSOR_STATISTICS, default=current_sensor_statistics
+                ): bool,
+                # accept the station's WU protocol uploads on the HA server
+                vol.Optional(CONF_LOCAL_PUSH, default=current_local_push): bool,
+                # required with local push: the upload view takes no HA auth
+                vol.Optional(CONF_PUSH_PASSWORD, default=current_push_password): str,
+                # push mode: poll the cloud while no upload arrives
+                vol.Optional(
+                    CONF_PUSH_POLL_FALLBACK, default=current_push_poll_fallback
+                ): bool,
                 vol.Optional(CONF_CITY, default=current_city): str,
                 vol.Optional(
                     CONF_FORECAST_SOURCE, default=current_forecast_source
                 ): vol.In(FORECAST_SOURCES),
+                # 0 = per-source default (WU / MET.no: 30 min, Open-Meteo: 60 min)
+                vol.Optional(
+                    CONF_FORECAST_INTERVAL, default=current_forecast_interval
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_FORECAST_INTERVAL),
+                ),
+                # auto mode only; 0 = strictly sequential fallback
+                vol.Optional(
+                    CONF_FORECAST_HEDGE_DELAY, default=current_hedge_delay
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=MAX_FORECAST_HEDGE_DELAY),
+                ),
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=options_schema)
+        if user_input is not None:
+            # keep what the user entered when the form comes back with errors
+            options_schema = self.add_suggested_values_to_schema(
+                options_schema, user_input
+            )
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema, errors=errors
+        )
@@ -10,6 +10,17 @@ DEFAULT_STATION_ID = "IKAPOS27"
 DEFAULT_SCAN_INTERVAL = 5  # minutes
 MIN_SCAN_INTERVAL = 1
 MAX_SCAN_INTERVAL = 60
+# Adaptive polling: poll this many seconds after the expected upload, and
+# weight of the newest upload gap in the period estimate
+ADAPTIVE_POLL_MARGIN = 20
+ADAPTIVE_PERIOD_SMOOTHING = 0.3
+# ... and every this many uploads, probe at half the period for a faster cadence
+ADAPTIVE_PROBE_EVERY = 10
+DEFAULT_ADAPTIVE_POLLING = False
+# Keep serving the last good observation for this long (minutes) while the
+# API fails, instead of turning every entity unavailable; 0 = off
+DEFAULT_STALE_WINDOW = 30
+MAX_STALE_WINDOW = 720
 DEFAULT_CITY = ""
 
 # Forecast sources
@@ -17,25 +28,131 @@ FORECAST_SOURCE_AUTO = "auto"          # WU → MET.no → Open-Meteo (fallback
 FORECAST_SOURCE_WUNDERGROUND = "wunderground"
 FORECAST_SOURCE_METNO = "metno"
 FORECAST_SOURCE_OPENMETEO = "openmeteo"
+FORECAST_SOURCE_ENSEMBLE = "ensemble"  # all three at once, merged per day
 FORECAST_SOURCES = [
     FORECAST_SOURCE_AUTO,
     FORECAST_SOURCE_WUNDERGROUND,
     FORECAST_SOURCE_METNO,
     FORECAST_SOURCE_OPENMETEO,
+    FORECAST_SOURCE_ENSEMBLE,
 ]
 DEFAULT_FORECAST_SOURCE = FORECAST_SOURCE_AUTO
 
+# Forecast refresh interval (minutes); 0 = per-source default below
+DEFAULT_FORECAST_INTERVAL = 0
+MAX_FORECAST_INTERVAL = 360
+FORECAST_SOURCE_INTERVALS = {
+    FORECAST_SOURCE_WUNDERGROUND: 30,
+    FORECAST_SOURCE_METNO: 30,
+    FORECAST_SOURCE_OPENMETEO: 60,
+    FORECAST_SOURCE_ENSEMBLE: 30,
+}
+# Per-call timeout (seconds) of each forecast source, within the refresh budget
+FORECAST_SOURCE_TIMEOUTS = {
+    FORECAST_SOURCE_WUNDERGROUND: 15,
+    FORECAST_SOURCE_METNO: 20,
+    FORECAST_SOURCE_OPENMETEO: 15,
+}
+# Ensemble mode: weight of each source in the temperature / wind means; the
+# same order (WU → MET.no → Open-Meteo) breaks ties of the condition vote
+ENSEMBLE_WEIGHTS = {
+    FORECAST_SOURCE_WUNDERGROUND: 0.4,
+    FORECAST_SOURCE_METNO: 0.35,
+    FORECAST_SOURCE_OPENMETEO: 0.25,
+}
+# Auto mode: seconds before the next source is raced against a silent one
+# (0 = strictly sequential fallback)
+DEFAULT_FORECAST_HEDGE_DELAY = 3
+MAX_FORECAST_HEDGE_DELAY = 30
+
 WU_API_URL = "https://api.weather.com/v2/pws/observations/current"
 WU_FORECAST_URL = "https://api.weather.com/v3/wx/forecast/daily/7day"
+# PWS history: 5-minute records of the last day, hourly records of the last week
+WU_HISTORY_DAY_URL = "https://api.weather.com/v2/pws/observations/all/1day"
+WU_HISTORY_WEEK_URL = "https://api.weather.com/v2/pws/observations/hourly/7day"
 OPEN_METEO_GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
 OPEN_METEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 METNO_FORECAST_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
 
+# Local push: stations upload with the WU PWS protocol to these HA paths
+# (the WU path, for stations whose upload host is redirected to HA, and one
+# for firmwares with a configurable server path)
+PUSH_URL = "/weatherstation/updateweatherstation.php"
+PUSH_URL_ALT = "/api/wunderground_pws/updateweatherstation.php"
+# "No reading" marker of the upload protocol
+PUSH_MISSING_VALUE = -9999
+# hass.data[DOMAIN] key of the push-enabled coordinators, by station ID
+DATA_PUSH_STATIONS = "push_stations"
+DEFAULT_LOCAL_PUSH = False
+# Required with local push: the upload view takes no HA authentication
+DEFAULT_PUSH_PASSWORD = ""
+# Keep polling the cloud API while pushing (it only runs when no upload
+# arrived for a scan interval); off = local uploads only
+DEFAULT_PUSH_POLL_FALLBACK = True
+
+# Persistent storage (homeassistant.helpers.storage.Store)
+STORAGE_VERSION = 1
+GEOCODING_STORAGE_KEY = DOMAIN + ".{entry_id}.geocoding"
+# "No result" geocoding answers are retried after this many seconds
+GEOCODING_NEGATIVE_TTL = 6 * 3600
+# Last good observation + forecast, restored at startup (warm start)
+SNAPSHOT_STORAGE_KEY = DOMAIN + ".{entry_id}.snapshot"
+# Seconds to coalesce snapshot writes; older snapshots are not restored
+SNAPSHOT_SAVE_DELAY = 30
+SNAPSHOT_MAX_AGE = 6 * 3600
+# Daily min / max / mean accumulators, kept across restarts within the day
+DAILY_STATISTICS_STORAGE_KEY = DOMAIN + ".{entry_id}.daily"
+# Upper bound on cached forecast responses (one per source and location)
+HTTP_CACHE_MAX_ENTRIES = 64
+# hass.data[DOMAIN] key of the forecast cache shared by all config entries
+DATA_FORECAST_CACHE = "forecast_cache"
+# Forecast locations are snapped to this grid (degrees, ~5 km) so that nearby
+# stations share one forecast download per source
+FORECAST_GRID_STEP = 0.05
+
+# History backfill: missing hours are imported into the long-term statistics
+# once at least this many seconds are missing, reaching back at most MAX_AGE
+BACKFILL_MIN_GAP = 3600
+BACKFILL_MAX_AGE = 7 * 86400
+# Seconds the backfill's (background) history requests may take
+BACKFILL_TIMEOUT = 30
+# Closed hours of the live observation stream are imported into the
+# long-term statistics in batches of this many hours (the rest at unload;
+# hours lost at a shutdown are filled in by the backfill)
+STATISTICS_IMPORT_HOURS = 6
+# Keep state_class on the measurement sensors (recorder-compiled statistics
+# next to the imported ones); off = less recorder I/O
+DEFAULT_SENSOR_STATISTICS = True
+
+# Circuit breaker: open after this many consecutive failures, then probe
+# after BASE * 2^n seconds (jittered, capped at MAX)
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_DELAY = 60
+BREAKER_MAX_DELAY = 3600
+
+# Requests kept per upstream endpoint for the latency / size statistics
+METRICS_WINDOW = 200
+
+# Time budget (seconds) of one refresh cycle, shared by all of its calls;
+# kept below the 1-minute minimum scan interval so refreshes never overlap
+OBSERVATION_REFRESH_BUDGET = 45
+FORECAST_REFRESH_BUDGET = 45
+# Optional stages (geocoding, further forecast sources) need at least this
+BUDGET_MIN_STAGE = 2
+
 CONF_STATION_ID = "station_id"
 CONF_API_KEY = "api_key"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_CITY = "city"
 CONF_FORECAST_SOURCE = "forecast_source"
+CONF_FORECAST_INTERVAL = "forecast_interval"
+CONF_FORECAST_HEDGE_DELAY = "forecast_hedge_delay"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_STALE_WINDOW = "stale_window"
+CONF_SENSOR_STATISTICS = "sensor_statistics"
+CONF_LOCAL_PUSH = "local_push"
+CONF_PUSH_PASSWORD = "push_password"
+CONF_PUSH_POLL_FALLBACK = "push_poll_fallback"
 
 ATTR_TEMPERATURE = "temperature"
 ATTR_FEELS_LIKE = "feels_like"
@@ -12,34 +12,81 @@ Előrejelzés-források (forecast_source beállítás):
   wunderground  → csak WU forecast (ha nem sikerül: üres)
   metno         → csak MET.no (ha nem sikerül: üres)
   openmeteo     → csak Open-Meteo (ha nem sikerül: üres)
+  ensemble      → mindhárom egyszerre, naponként összevonva (súlyozott átlag,
+                  medián csapadék, többségi időjárás-állapot, szórás)
+
+Az előrejelzést külön koordinátor frissíti, saját (forrásonkénti) időközzel,
+így a megfigyelés-szenzorok sosem várnak az előrejelzés lekérésére.
+
+Helyi push módban (local_push) az állomás a WU feltöltési protokollal
+közvetlenül a HA-nak küldi a méréseit; a felhő lekérdezés ilyenkor csak
+akkor fut, ha egy frissítési időközön át nem érkezett feltöltés (vagy ki is
+kapcsolható: push_poll_fallback).
+
+Az utolsó jó megfigyelés és előrejelzés egy ``Store``-ba mentődik; indításkor
+az entitások ebből azonnal létrejönnek (meleg indítás), az első valódi
+frissítés pedig a háttérben fut.
 
 Keszito: Aiasz
 Verzio: 1.4.1"""
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from datetime import timedelta
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+from operator import itemgetter
 from typing import Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    ForecastResult,
+    Observation,
     enrich_observation,
     fetch_open_meteo_forecast,
     fetch_geocoding,
     discover_api_key,
     fetch_wunderground_forecast,
     fetch_metno_forecast,
+    fetch_wu_history,
+    read_json,
 )
+from .aggregation import merge_ensemble
+from .breaker import CircuitBreaker
+from .budget import RefreshBudget
+from .cache import GeocodingCache, SharedForecastCache, snap_to_grid
 from .const import (
     DOMAIN,
+    STORAGE_VERSION,
+    GEOCODING_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_MAX_AGE,
+    DAILY_STATISTICS_STORAGE_KEY,
+    OBSERVATION_REFRESH_BUDGET,
+    FORECAST_REFRESH_BUDGET,
+    FORECAST_SOURCE_TIMEOUTS,
+    DATA_FORECAST_CACHE,
     WU_API_URL,
+    WU_HISTORY_DAY_URL,
+    WU_HISTORY_WEEK_URL,
+    BACKFILL_MIN_GAP,
+    BACKFILL_MAX_AGE,
+    BACKFILL_TIMEOUT,
+    STATISTICS_IMPORT_HOURS,
     CONF_STATION_ID,
     CONF_API_KEY,
     CONF_SCAN_INTERVAL,
@@ -49,43 +96,65 @@ from .const import (
     DEFAULT_STATION_ID,
     DEFAULT_CITY,
     DEFAULT_FORECAST_SOURCE,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_STALE_WINDOW,
+    DEFAULT_STALE_WINDOW,
+    CONF_SENSOR_STATISTICS,
+    DEFAULT_SENSOR_STATISTICS,
+    CONF_LOCAL_PUSH,
+    DEFAULT_LOCAL_PUSH,
+    CONF_PUSH_PASSWORD,
+    DEFAULT_PUSH_PASSWORD,
+    CONF_PUSH_POLL_FALLBACK,
+    DEFAULT_PUSH_POLL_FALLBACK,
+    MAX_SCAN_INTERVAL,
+    CONF_FORECAST_INTERVAL,
+    DEFAULT_FORECAST_INTERVAL,
+    FORECAST_SOURCE_INTERVALS,
+    CONF_FORECAST_HEDGE_DELAY,
+    DEFAULT_FORECAST_HEDGE_DELAY,
     FORECAST_SOURCE_AUTO,
     FORECAST_SOURCE_WUNDERGROUND,
     FORECAST_SOURCE_METNO,
     FORECAST_SOURCE_OPENMETEO,
-    ATTR_TEMPERATURE,
-    ATTR_FEELS_LIKE,
-    ATTR_DEW_POINT,
-    ATTR_HUMIDITY,
-    ATTR_PRESSURE,
-    ATTR_WIND_SPEED,
-    ATTR_WIND_GUST,
-    ATTR_WIND_BEARING,
-    ATTR_WIND_COMPASS,
-    ATTR_WIND_COMPASS_HU,
-    ATTR_PRECIPITATION,
-    ATTR_PRECIPITATION_RATE,
-    ATTR_SOLAR_RADIATION,
-    ATTR_UV_INDEX,
-    ATTR_STATION_ID,
-    ATTR_LAST_UPDATED,
-    ATTR_LAT,
-    ATTR_LON,
-    ATTR_LOCATION_NAME,
-    ATTR_COUNTRY,
-    ATTR_ELEVATION_M,
-    ATTR_CONDITION,
-    ATTR_CLOUD_BASE,
-    ATTR_ABSOLUTE_HUMIDITY,
-    ATTR_WIND_CHILL,
-    ATTR_HEAT_INDEX,
+    FORECAST_SOURCE_ENSEMBLE,
+    ENSEMBLE_WEIGHTS,
+)
+from .history import (
+    HourlyStatistics,
+    async_import_statistics,
+    async_last_imported_hour,
+    hourly_statistics,
+)
+from .metrics import (
+    METRIC_FORECAST,
+    METRIC_GEOCODING,
+    METRIC_WU_HISTORY,
+    METRIC_WU_KEY_DISCOVERY,
+    METRIC_WU_OBSERVATION,
+    EndpointMetrics,
+    RequestMetrics,
 )
+from .push import upload_to_observation
+from .rolling import DailyStatistics
+from .scheduler import AdaptivePollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class ForecastData:
+    """Result of one forecast refresh."""
+
+    forecast: list[dict[str, Any]] = field(default_factory=list)
+    source: str = ""  # which source actually delivered data
+    # the parsed payload (hourly / twice-daily); None after a warm start
+    result: ForecastResult | None = None
+
+
 class WundergroundPWSCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch data from Wunderground PWS API + multi-source forecast."""
+    """Coordinator to fetch observation data from the Wunderground PWS API."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         # Use .get() on entry.data to avoid KeyError for older entries
@@ -107,29 +176,206 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
             CONF_SCAN_INTERVAL,
             entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         )
-        self.forecast_data: list[dict[str, Any]] = []
-        self.forecast_city: str = self.city  # resolved display name
-        self.forecast_source_used: str = ""  # which source actually delivered data
         # Track consecutive auth failures to avoid infinite rediscovery loops
         self._auth_failure_count: int = 0
         self._MAX_REDISCOVERY_ATTEMPTS: int = 3
+        # obsTimeUtc (or payload hash) of the last enriched observation
+        self._last_fingerprint: str | int | None = None
+        self.observation_breaker = CircuitBreaker("wunderground_observation")
+        self.request_metrics = RequestMetrics()
+        # Last good observation + forecast, for a warm start after a restart
+        self._snapshot_store: Store = Store(
+            hass,
+            STORAGE_VERSION,
+            SNAPSHOT_STORAGE_KEY.format(entry_id=entry.entry_id),
+        )
+        self.restored = False  # data comes from the snapshot, not the API yet
+        # Stale-while-revalidate: serve the last good observation on failures
+        self._stale_window = timedelta(
+            minutes=entry.options.get(
+                CONF_STALE_WINDOW,
+                entry.data.get(CONF_STALE_WINDOW, DEFAULT_STALE_WINDOW),
+            )
+        )
+        self._base_interval = timedelta(minutes=scan_interval)
+        self.last_success_at: datetime | None = None
+        self.stale = False
+        self._consecutive_failures = 0
+        self.last_budget: RefreshBudget | None = None
+        self.duplicate_polls_suppressed: int = 0
+        # Look for a gap in the statistics after the first poll, after every
+        # recovery from failed polls and when a partial hour is dropped
+        self._backfill_due = True
+        self._backfill_task: asyncio.Task | None = None
+        self.last_backfill: dict[str, Any] | None = None
+        # Hourly mean / min / max of the live observations, imported as
+        # external statistics; the sensors' state_class is then optional
+        self._hourly_statistics = HourlyStatistics()
+        self.statistics_hours_imported = 0
+        self._newest_imported_hour: datetime | None = None
+        entry.async_on_unload(self.async_import_completed_hours)
+        self.sensor_statistics: bool = entry.options.get(
+            CONF_SENSOR_STATISTICS,
+            entry.data.get(CONF_SENSOR_STATISTICS, DEFAULT_SENSOR_STATISTICS),
+        )
+        # Today's min / max / mean, updated in O(1) per new observation
+        self.daily_statistics = DailyStatistics()
+        self._daily_store: Store = Store(
+            hass,
+            STORAGE_VERSION,
+            DAILY_STATISTICS_STORAGE_KEY.format(entry_id=entry.entry_id),
+        )
+        # Local push: uploads of the station replace the cloud poll, which
+        # only runs when no upload arrived for a scan interval (if at all)
+        self.local_push: bool = entry.options.get(
+            CONF_LOCAL_PUSH, entry.data.get(CONF_LOCAL_PUSH, DEFAULT_LOCAL_PUSH)
+        )
+        self.push_password: str = entry.options.get(
+            CONF_PUSH_PASSWORD,
+            entry.data.get(CONF_PUSH_PASSWORD, DEFAULT_PUSH_PASSWORD),
+        )
+        self.push_only: bool = self.local_push and not entry.options.get(
+            CONF_PUSH_POLL_FALLBACK,
+            entry.data.get(CONF_PUSH_POLL_FALLBACK, DEFAULT_PUSH_POLL_FALLBACK),
+        )
+        self.pushes_received: int = 0
+        self.last_push_at: datetime | None = None
+        adaptive: bool = entry.options.get(
+            CONF_ADAPTIVE_POLLING,
+            entry.data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        )
+        self._scheduler: AdaptivePollScheduler | None = (
+            # push-only: nothing may re-enable the (disabled) poll schedule
+            AdaptivePollScheduler() if adaptive and not self.push_only else None
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{self.station_id}",
-            update_interval=timedelta(minutes=scan_interval),
+            update_interval=(
+                None if self.push_only else timedelta(minutes=scan_interval)
+            ),
+            # Returning the previous record for a repeated observation must
+            # not wake the entities up
+            always_update=False,
         )
+        self.forecast_coordinator = WundergroundForecastCoordinator(hass, entry, self)
+
+    @property
+    def upload_period(self) -> float | None:
+        """Return the learned station upload period in seconds (adaptive polling)."""
+        if self._scheduler is None or self._scheduler.period is None:
+            return None
+        return round(self._scheduler.period.total_seconds())
+
+    @property
+    def circuit_breakers(self) -> dict[str, CircuitBreaker]:
+        """Return every upstream circuit breaker of this entry, by name."""
+        return {
+            self.observation_breaker.name: self.observation_breaker,
+            **{
+                f"forecast_{source}": breaker
+                for source, breaker in self.forecast_coordinator.breakers.items()
+            },
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session used for every upstream request."""
+        return async_get_clientsession(self.hass)
+
+    @property
+    def snapshot_age(self) -> int | None:
+        """Return the age (s) of the restored observation; None once live."""
+        if not self.restored or self.data is None:
+            return None
+        obs_time = dt_util.parse_datetime(self.data.obs_time_utc or "")
+        if obs_time is None:
+            return None
+        return max(0, round((dt_util.utcnow() - obs_time).total_seconds()))
+
+    # ------------------------------------------------------------------
+    # Warm start
+    # ------------------------------------------------------------------
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved observation / forecast as the current data.
+
+        Returns False (nothing restored) if there is no snapshot, it belongs
+        to another station or it is older than ``SNAPSHOT_MAX_AGE``.
+        """
+        snapshot = await self._snapshot_store.async_load()
+        if not snapshot or not snapshot.get("observation"):
+            return False
+        observation = Observation.from_dict(snapshot["observation"])
+        fetched_at = dt_util.parse_datetime(snapshot.get("fetched_at") or "")
+        if (
+            observation.station_id != self.station_id
+            or fetched_at is None
+            or (dt_util.utcnow() - fetched_at).total_seconds() > SNAPSHOT_MAX_AGE
+        ):
+            return False
+
+        self.data = observation
+        self.restored = True
+        self.last_success_at = fetched_at
+        if snapshot.get("forecast"):
+            self.forecast_coordinator.data = ForecastData(
+                forecast=snapshot["forecast"],
+                source=snapshot.get("forecast_source") or "",
+            )
+        _LOGGER.debug(
+            "Restored the observation of %s for station %s from the snapshot",
+            observation.obs_time_utc,
+            self.station_id,
+        )
+        return True
+
+    async def async_refresh_after_restore(self) -> None:
+        """Run the first real refresh after a warm start.
+
+        The live observation may equal the restored one, which would not
+        notify the entities (``always_update=False``); notify explicitly so
+        the snapshot marker goes away.  After a failed first refresh the
+        coordinator notifies on the next success by itself.
+        """
+        await self.async_refresh()
+        if self.last_update_success:
+            self.async_update_listeners()
+
+    @callback
+    def async_schedule_snapshot_save(self) -> None:
+        """Persist the current data soon (writes are coalesced)."""
+        self._snapshot_store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the snapshot to persist."""
+        forecast = self.forecast_coordinator
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            # when the observation was last fetched successfully
+            "fetched_at": (
+                self.last_success_at.isoformat() if self.last_success_at else None
+            ),
+            "observation": self.data.as_dict() if self.data else None,
+            "forecast": forecast.forecast,
+            "forecast_source": forecast.source_used,
+        }
 
     # ------------------------------------------------------------------
     # API key auto-discovery helpers
     # ------------------------------------------------------------------
 
-    async def _try_rediscover_api_key(self, session: aiohttp.ClientSession) -> bool:
+    async def _try_rediscover_api_key(
+        self, session: aiohttp.ClientSession, budget: RefreshBudget
+    ) -> bool:
         """Attempt to auto-discover a new WU API key and persist it.
 
         Returns True and updates ``self.api_key`` + the config entry when a
-        key is found; returns False otherwise.
+        key is found; returns False otherwise (also when the refresh budget
+        has no time left for it).
         """
+        if not budget.allows("key_discovery"):
+            return False
         if self._auth_failure_count >= self._MAX_REDISCOVERY_ATTEMPTS:
             _LOGGER.error(
                 "Giving up WU API key auto-discovery after %d attempts for station %s.",
@@ -148,7 +394,13 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            new_key = await discover_api_key(self.station_id, session)
+            with budget.stage("key_discovery"):
+                new_key = await discover_api_key(
+                    self.station_id,
+                    session,
+                    self.request_metrics.get(METRIC_WU_KEY_DISCOVERY),
+                    budget.timeout(25),
+                )
         except Exception as exc:  # noqa: BLE001
             _LOGGER.warning("WU API key discovery raised an error: %s", exc)
             new_key = None
@@ -179,58 +431,68 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
     # Main update loop
     # ------------------------------------------------------------------
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch and normalize observation data from WU API + forecast from Open-Meteo."""
-        session = async_get_clientsession(self.hass)
+    async def _async_get_observation(
+        self,
+        session: aiohttp.ClientSession,
+        params: dict[str, Any],
+        metrics: EndpointMetrics,
+        budget: RefreshBudget,
+    ) -> tuple[int, Any]:
+        """GET the current observation; return (status, payload or None)."""
+        with budget.stage("observation"), metrics.track() as sample:
+            async with asyncio.timeout(budget.timeout(30)):
+                async with session.get(WU_API_URL, params=params) as resp:
+                    sample.status = resp.status
+                    if resp.status != 200:
+                        return resp.status, None
+                    return resp.status, await read_json(resp, sample)
 
-        # If api_key is missing (e.g. first run or cleared options), attempt discovery
-        if not self.api_key:
-            _LOGGER.info(
-                "No WU API key set for station %s – running auto-discovery before first fetch.",
-                self.station_id,
-            )
-            if not await self._try_rediscover_api_key(session):
-                raise UpdateFailed(
-                    f"No API key available for station {self.station_id} and "
-                    "auto-discovery failed. Please enter the key manually in the "
-                    "integration options."
-                )
+    async def _async_fetch_observations(
+        self, session: aiohttp.ClientSession, budget: RefreshBudget
+    ) -> list[dict[str, Any]]:
+        """Fetch the current observation list, re-discovering the key on 401/403.
 
+        Raises UpdateFailed on any error or an empty answer.
+        """
         params = {
             "stationId": self.station_id,
             "format": "json",
             "units": "e",
             "apiKey": self.api_key,
         }
+        metrics = self.request_metrics.get(METRIC_WU_OBSERVATION)
         try:
-            async with asyncio.timeout(30):
-                async with session.get(WU_API_URL, params=params) as resp:
-                    if resp.status in (401, 403):
-                        _LOGGER.warning(
-                            "WU API returned HTTP %s (auth error) for station %s – "
-                            "attempting key re-discovery …",
-                            resp.status,
-                            self.station_id,
-                        )
-                        if await self._try_rediscover_api_key(session):
-                            # Retry with the new key
-                            params["apiKey"] = self.api_key
-                            async with asyncio.timeout(30):
-                                async with session.get(WU_API_URL, params=params) as resp2:
-                                    if resp2.status != 200:
-                                        raise UpdateFailed(
-                                            f"API error after key re-discovery: HTTP {resp2.status}"
-                                        )
-                                    payload = await resp2.json()
-                        else:
-                            raise UpdateFailed(
-                                f"WU API auth error (HTTP {resp.status}) and key "
-                                "re-discovery failed. Please enter the key manually."
-                            )
-                    elif resp.status != 200:
-                        raise UpdateFailed(f"API error: HTTP {resp.status}")
-                    else:
-                        payload = await resp.json()
+            status, payload = await self._async_get_observation(
+                session, params, metrics, budget
+            )
+            if status in (401, 403):
+                _LOGGER.warning(
+                    "WU API returned HTTP %s (auth error) for station %s – "
+                    "attempting key re-discovery …",
+                    status,
+                    self.station_id,
+                )
+                if not await self._try_rediscover_api_key(session, budget):
+                    raise UpdateFailed(
+                        f"WU API auth error (HTTP {status}) and key "
+                        "re-discovery failed. Please enter the key manually."
+                    )
+                if not budget.allows("observation_retry"):
+                    raise UpdateFailed(
+                        "Refresh time budget used up before retrying with the "
+                        "re-discovered key"
+                    )
+                # Retry with the new key
+                params["apiKey"] = self.api_key
+                status, payload = await self._async_get_observation(
+                    session, params, metrics, budget
+                )
+                if status != 200:
+                    raise UpdateFailed(
+                        f"API error after key re-discovery: HTTP {status}"
+                    )
+            elif status != 200:
+                raise UpdateFailed(f"API error: HTTP {status}")
         except asyncio.TimeoutError as exc:
             raise UpdateFailed("Timeout fetching Wunderground API") from exc
         except (aiohttp.ClientError, ValueError) as exc:
@@ -239,38 +501,483 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
         observations = payload.get("observations") or []
         if not observations:
             raise UpdateFailed("No observations in API response")
+        return observations
+
+    async def _async_update_data(self) -> Observation:
+        """Fetch a new observation, or keep serving the last one on failure.
+
+        Within the stale window a failed poll returns the previous record
+        (flagged ``stale``) instead of making every entity unavailable; each
+        consecutive failure doubles the retry interval.
+        """
+        if self.push_only:
+            # Local uploads only: a manual refresh keeps the last upload
+            if self.data is None:
+                raise UpdateFailed(
+                    f"No upload received from station {self.station_id} yet"
+                )
+            return self.data
+        budget = self.last_budget = RefreshBudget(OBSERVATION_REFRESH_BUDGET)
+        try:
+            observation = await self._async_poll_observation(budget)
+        except UpdateFailed as exc:
+            self._consecutive_failures += 1
+            # the open hour misses this poll: the backfill imports it later
+            self._hourly_statistics.interrupt()
+            self.update_interval = min(
+                timedelta(minutes=MAX_SCAN_INTERVAL),
+                self._base_interval * 2 ** min(self._consecutive_failures, 6),
+            )
+            age = self.data_age_seconds
+            if (
+                self.data is None
+                or age is None
+                or age > self._stale_window.total_seconds()
+            ):
+                raise
+            _LOGGER.warning(
+                "Serving the %d s old observation of station %s (retry in %s): %s",
+                age,
+                self.station_id,
+                self.update_interval,
+                exc,
+            )
+            self._set_stale(True)
+            return self.data
+        finally:
+            _LOGGER.debug(
+                "Observation refresh of station %s: %s", self.station_id, budget.as_dict()
+            )
+
+        self.last_success_at = dt_util.utcnow()
+        if self._consecutive_failures:
+            self._consecutive_failures = 0
+            self._backfill_due = True
+            if self._scheduler is None:
+                self.update_interval = self._base_interval
+        if self._backfill_due:
+            self._async_schedule_backfill()
+        self._set_stale(False)
+        return observation
+
+    @callback
+    def _set_stale(self, stale: bool) -> None:
+        """Flip the stale flag, telling the entities.
+
+        The data itself does not change when the flag flips, so with
+        ``always_update=False`` the coordinator would not notify them.
+        """
+        if stale != self.stale:
+            self.stale = stale
+            self.async_update_listeners()
+
+    # ------------------------------------------------------------------
+    # Local push
+    # ------------------------------------------------------------------
+
+    @callback
+    def async_push_observation(self, params: Mapping[str, str]) -> None:
+        """Take an upload of the station (WU PWS protocol) as the new observation.
+
+        Setting the data also postpones the next cloud poll by a full scan
+        interval, so polling only runs while the station stays silent.
+        """
+        raw = upload_to_observation(params, self.station_id, self.data)
+        observation = enrich_observation(raw)
+        self.pushes_received += 1
+        self.last_push_at = self.last_success_at = dt_util.utcnow()
+        self._last_fingerprint = raw["obsTimeUtc"]
+        self.restored = False
+        self.stale = False
+        if self._consecutive_failures:
+            self._consecutive_failures = 0
+            self._backfill_due = True
+            if self._scheduler is None and not self.push_only:
+                self.update_interval = self._base_interval
+        self._async_record_statistics(observation)
+        if self._backfill_due and self.api_key:
+            self._async_schedule_backfill()
+        self._async_update_daily_statistics(observation)
+        self.async_schedule_snapshot_save()
+        self.async_set_updated_data(observation)
+        if self.forecast_coordinator.waiting_for_location:
+            # the forecast is not scheduled by the (disabled) poll; the
+            # refresh requests are debounced
+            self._entry.async_create_background_task(
+                self.hass,
+                self.forecast_coordinator.async_request_refresh(),
+                f"{DOMAIN}_{self._entry.entry_id}_forecast_after_push",
+            )
+
+    async def async_locate_station(self) -> None:
+        """Push-only mode: fetch one cloud observation to locate the station.
+
+        Uploads carry no location; every later upload keeps the name,
+        country, coordinates and elevation of this poll.  Without an API key
+        (or if the poll fails) the entities wait for the first upload and
+        the forecast needs the configured city.
+        """
+        if not self.api_key:
+            return
+        budget = RefreshBudget(OBSERVATION_REFRESH_BUDGET)
+        try:
+            observation = await self._async_poll_observation(budget)
+        except UpdateFailed as exc:
+            _LOGGER.warning(
+                "Could not locate station %s with a cloud poll: %s",
+                self.station_id,
+                exc,
+            )
+            return
+        self.last_success_at = dt_util.utcnow()
+        self.async_set_updated_data(observation)
+
+    # ------------------------------------------------------------------
+    # Daily statistics
+    # ------------------------------------------------------------------
+
+    async def async_setup_daily_statistics(self) -> None:
+        """Restore today's statistics and reset them at every local midnight."""
+        saved = await self._daily_store.async_load()
+        today = dt_util.now().date().isoformat()
+        if saved and saved.get("day") == today:
+            self.daily_statistics = DailyStatistics.from_dict(saved)
+        else:
+            self.daily_statistics.reset(today)
+        self._entry.async_on_unload(
+            async_track_time_change(
+                self.hass, self._async_midnight_reset, hour=0, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_midnight_reset(self, now: datetime) -> None:
+        """Start the new day's statistics (even if no observation arrives)."""
+        self.daily_statistics.reset(now.date().isoformat())
+        self._daily_store.async_delay_save(
+            self.daily_statistics.as_dict, SNAPSHOT_SAVE_DELAY
+        )
+        self.async_update_listeners()
+
+    @callback
+    def _async_update_daily_statistics(self, observation: Observation) -> None:
+        """Add a new observation to the statistics of its local day."""
+        obs_time = dt_util.parse_datetime(observation.obs_time_utc or "")
+        day = dt_util.as_local(obs_time or dt_util.utcnow()).date().isoformat()
+        if self.daily_statistics.add(observation, day):
+            self._daily_store.async_delay_save(
+                self.daily_statistics.as_dict, SNAPSHOT_SAVE_DELAY
+            )
+
+    # ------------------------------------------------------------------
+    # Long-term statistics and history backfill
+    # ------------------------------------------------------------------
+
+    @callback
+    def _async_record_statistics(self, observation: Observation) -> None:
+        """Add a new observation to the hourly statistics; import closed hours.
+
+        A closed partial hour is not imported; the backfill covers it.
+        """
+        if "recorder" not in self.hass.config.components:
+            return
+        if self._hourly_statistics.add(observation):
+            self._backfill_due = True
+        if len(self._hourly_statistics.completed) >= STATISTICS_IMPORT_HOURS:
+            self.async_import_completed_hours()
+
+    @callback
+    def async_import_completed_hours(self) -> None:
+        """Import the queued closed hours in one batch (also at unload)."""
+        hours = self._hourly_statistics.pop_completed()
+        if hours and "recorder" in self.hass.config.components:
+            async_import_statistics(self.hass, self.station_id, hours)
+            self.statistics_hours_imported += len(hours)
+            newest = max(hours)
+            if self._newest_imported_hour is not None:
+                newest = max(newest, self._newest_imported_hour)
+            self._newest_imported_hour = newest
 
-        enriched = enrich_observation(observations[0])
-
-        data: dict[str, Any] = {
-            ATTR_STATION_ID: enriched.get("station_id") or self.station_id,
-            ATTR_LAST_UPDATED: enriched.get("obsTimeLocal") or enriched.get("obsTimeUtc"),
-            ATTR_LOCATION_NAME: enriched.get("location"),
-            ATTR_COUNTRY: enriched.get("country"),
-            ATTR_LAT: enriched.get("lat"),
-            ATTR_LON: enriched.get("lon"),
-            ATTR_ELEVATION_M: enriched.get("elevation_m"),
-            ATTR_TEMPERATURE: enriched.get("temperature"),
-            ATTR_FEELS_LIKE: enriched.get("feels_like"),
-            ATTR_DEW_POINT: enriched.get("dew_point"),
-            ATTR_HUMIDITY: enriched.get("humidity"),
-            ATTR_PRESSURE: enriched.get("pressure"),
-            ATTR_WIND_SPEED: enriched.get("wind_speed"),
-            ATTR_WIND_GUST: enriched.get("wind_gust"),
-            ATTR_WIND_BEARING: enriched.get("wind_dir_deg"),
-            ATTR_WIND_COMPASS: enriched.get("wind_dir_compass"),
-            ATTR_WIND_COMPASS_HU: enriched.get("wind_dir_compass_hu"),
-            ATTR_PRECIPITATION: enriched.get("precipitation"),
-            ATTR_PRECIPITATION_RATE: enriched.get("precipitation_rate"),
-            ATTR_SOLAR_RADIATION: enriched.get("solar_radiation"),
-            ATTR_UV_INDEX: enriched.get("uv"),
-            ATTR_CLOUD_BASE: enriched.get("cloud_base"),
-            ATTR_ABSOLUTE_HUMIDITY: enriched.get("absolute_humidity"),
-            ATTR_WIND_CHILL: enriched.get("wind_chill"),
-            ATTR_HEAT_INDEX: enriched.get("heat_index"),
+    @callback
+    def _async_schedule_backfill(self) -> None:
+        """Start the history backfill in the background (if the recorder runs).
+
+        While a backfill runs the request stays due for the next observation.
+        """
+        if "recorder" not in self.hass.config.components:
+            return
+        if self._backfill_task is not None and not self._backfill_task.done():
+            return
+        self._backfill_due = False
+        self._backfill_task = self._entry.async_create_background_task(
+            self.hass,
+            self.async_backfill(),
+            f"{DOMAIN}_{self._entry.entry_id}_backfill",
+        )
+
+    async def async_backfill(self) -> None:
+        """Import the hours missing from the long-term statistics.
+
+        The live hours still queued are imported first, so the history never
+        overwrites them and they never overwrite the history.  The gap starts
+        after the newest imported hour (at most ``BACKFILL_MAX_AGE`` ago) and
+        ends with the last complete hour; the partial hours the live
+        statistics dropped are inside it.  It is
+        filled from one ``observations/all/1day`` request, plus one
+        ``observations/hourly/7day`` request if it reaches back further than
+        a day; the 5-minute records win where both cover an hour.
+        """
+        now = dt_util.utcnow()
+        until = now.replace(minute=0, second=0, microsecond=0)
+        oldest = until - timedelta(seconds=BACKFILL_MAX_AGE)
+        self.async_import_completed_hours()
+        last = await async_last_imported_hour(self.hass, self.station_id)
+        # the recorder may not have written the hours just queued yet
+        if self._newest_imported_hour is not None and (
+            last is None or last < self._newest_imported_hour
+        ):
+            last = self._newest_imported_hour
+        since = oldest if last is None else max(oldest, last + timedelta(hours=1))
+        if (until - since).total_seconds() < BACKFILL_MIN_GAP:
+            return
+
+        urls = [WU_HISTORY_DAY_URL]
+        if since < now - timedelta(days=1):
+            urls.insert(0, WU_HISTORY_WEEK_URL)
+        session = self._get_session()
+        metrics = self.request_metrics.get(METRIC_WU_HISTORY)
+        hours: dict[datetime, Any] = {}
+        records = 0
+        for url in urls:
+            try:
+                batch = await fetch_wu_history(
+                    url, self.station_id, self.api_key, session, metrics, BACKFILL_TIMEOUT
+                )
+            except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as exc:
+                _LOGGER.warning(
+                    "History backfill of station %s failed (%s): %s",
+                    self.station_id,
+                    url.rsplit("/observations/", 1)[-1],
+                    exc,
+                )
+                continue
+            records += len(batch)
+            hours.update(hourly_statistics(batch, since, until))
+
+        if hours:
+            async_import_statistics(self.hass, self.station_id, hours)
+        self.last_backfill = {
+            "at": now.isoformat(),
+            "since": since.isoformat(),
+            "until": until.isoformat(),
+            "records": records,
+            "hours_imported": len(hours),
         }
+        _LOGGER.debug(
+            "History backfill of station %s: %s", self.station_id, self.last_backfill
+        )
 
-        data[ATTR_CONDITION] = self._determine_condition(data)
+    @property
+    def data_age_seconds(self) -> int | None:
+        """Return the seconds since the last successful poll."""
+        if self.last_success_at is None:
+            return None
+        return max(0, round((dt_util.utcnow() - self.last_success_at).total_seconds()))
+
+    async def _async_poll_observation(self, budget: RefreshBudget) -> Observation:
+        """Fetch and normalize observation data from the WU API."""
+        session = self._get_session()
+
+        # If api_key is missing (e.g. first run or cleared options), attempt discovery
+        if not self.api_key:
+            _LOGGER.info(
+                "No WU API key set for station %s – running auto-discovery before first fetch.",
+                self.station_id,
+            )
+            if not await self._try_rediscover_api_key(session, budget):
+                raise UpdateFailed(
+                    f"No API key available for station {self.station_id} and "
+                    "auto-discovery failed. Please enter the key manually in the "
+                    "integration options."
+                )
+
+        if not self.observation_breaker.allow():
+            raise UpdateFailed(
+                f"WU API skipped for station {self.station_id}: circuit open after "
+                f"{self.observation_breaker.consecutive_failures} failures, next "
+                f"probe in {self.observation_breaker.retry_in or 0:.0f} s"
+            )
+        try:
+            observations = await self._async_fetch_observations(session, budget)
+        except UpdateFailed as exc:
+            self.observation_breaker.record_failure(str(exc))
+            raise
+        self.observation_breaker.record_success()
+        self.restored = False
+
+        # Most stations upload every 5-10 minutes: a faster poll mostly returns
+        # the observation we already have. Skip enrichment and hand back the
+        # same record, so no listener / recorder write is triggered.
+        raw = observations[0]
+        if self._scheduler is not None:
+            self.update_interval = self._scheduler.next_interval(
+                raw.get("obsTimeUtc"), dt_util.utcnow()
+            )
+        fingerprint = raw.get("obsTimeUtc") or hash(
+            json.dumps(raw, sort_keys=True, default=str)
+        )
+        if self.data is not None and fingerprint == self._last_fingerprint:
+            self.duplicate_polls_suppressed += 1
+            _LOGGER.debug(
+                "Observation for station %s unchanged (%s) – skipping update.",
+                self.station_id,
+                fingerprint,
+            )
+            return self.data
+        self._last_fingerprint = fingerprint
+
+        observation = enrich_observation(raw)
+        if not observation.station_id:
+            observation = replace(observation, station_id=self.station_id)
+        self._async_record_statistics(observation)
+        self._async_update_daily_statistics(observation)
+        self.async_schedule_snapshot_save()
+        return observation
+
+
+class WundergroundForecastCoordinator(DataUpdateCoordinator):
+    """Coordinator for the daily forecast, refreshed independently of observations.
+
+    The forecast changes only a few times an hour upstream, so it runs on its
+    own (per-source) interval instead of riding along with every PWS poll.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        observation: WundergroundPWSCoordinator,
+    ) -> None:
+        """Initialize the forecast coordinator."""
+        self._observation = observation
+        self.city: str = observation.city
+        self.forecast_source: str = observation.forecast_source
+        # 0 = use the per-source default interval
+        self._interval_override: int = entry.options.get(
+            CONF_FORECAST_INTERVAL,
+            entry.data.get(CONF_FORECAST_INTERVAL, DEFAULT_FORECAST_INTERVAL),
+        )
+        self.breakers: dict[str, CircuitBreaker] = {
+            source: CircuitBreaker(source)
+            for source in (
+                FORECAST_SOURCE_WUNDERGROUND,
+                FORECAST_SOURCE_METNO,
+                FORECAST_SOURCE_OPENMETEO,
+            )
+        }
+        # Seconds to wait before racing the next source in auto mode (0 = sequential)
+        self._hedge_delay: float = entry.options.get(
+            CONF_FORECAST_HEDGE_DELAY,
+            entry.data.get(CONF_FORECAST_HEDGE_DELAY, DEFAULT_FORECAST_HEDGE_DELAY),
+        )
+        # Geocoding results survive restarts; loaded lazily on first use
+        self._geocoding_store: Store = Store(
+            hass,
+            STORAGE_VERSION,
+            GEOCODING_STORAGE_KEY.format(entry_id=entry.entry_id),
+        )
+        self._geocoding_cache: GeocodingCache | None = None
+        self.last_budget: RefreshBudget | None = None
+        # The last refresh found no location (no city, no coordinates yet)
+        self.waiting_for_location = False
+        # Shared by every config entry; also holds the HTTP (Expires /
+        # Last-Modified) cache of the forecast responses
+        self._shared_cache: SharedForecastCache = hass.data.setdefault(
+            DOMAIN, {}
+        ).setdefault(DATA_FORECAST_CACHE, SharedForecastCache())
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{observation.station_id}_forecast",
+            update_interval=self._interval_for(self._source_order()[0]),
+        )
+
+    @property
+    def forecast(self) -> list[dict[str, Any]]:
+        """Return the last good daily forecast (empty list if none yet)."""
+        return self.data.forecast if self.data else []
+
+    @property
+    def source_used(self) -> str:
+        """Return the source that delivered the current forecast."""
+        return self.data.source if self.data else ""
+
+    @property
+    def ensemble_sources(self) -> tuple[str, ...]:
+        """Return the sources merged into the current forecast (ensemble mode)."""
+        if self.data and self.data.result:
+            return self.data.result.sources
+        return ()
+
+    @property
+    def has_hourly(self) -> bool:
+        """Return True if the current forecast has an hourly part."""
+        return bool(self.data and self.data.result and self.data.result.has_hourly)
+
+    @property
+    def has_twice_daily(self) -> bool:
+        """Return True if the current forecast has a day / night part."""
+        return bool(
+            self.data and self.data.result and self.data.result.has_twice_daily
+        )
+
+    @property
+    def hourly_forecast(self) -> list[dict[str, Any]]:
+        """Return the hourly forecast from the current hour on.
+
+        Built from the already downloaded payload on the first call after a
+        refresh; the hours that have passed since are cut off here.
+        """
+        if not self.has_hourly:
+            return []
+        hourly = self.data.result.hourly
+        now = dt_util.utcnow().strftime("%Y-%m-%dT%H:00:00+00:00")
+        return hourly[bisect_left(hourly, now, key=itemgetter("datetime")):]
+
+    @property
+    def twice_daily_forecast(self) -> list[dict[str, Any]]:
+        """Return the day / night forecast (empty list if none)."""
+        if not self.has_twice_daily:
+            return []
+        return self.data.result.twice_daily
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session; shared with the observation coordinator."""
+        return self._observation._get_session()
+
+    def _source_order(self) -> list[str]:
+        """Return the sources to try, in priority order."""
+        source = self.forecast_source or FORECAST_SOURCE_AUTO
+        if source in (FORECAST_SOURCE_AUTO, FORECAST_SOURCE_ENSEMBLE):
+            return [
+                FORECAST_SOURCE_WUNDERGROUND,
+                FORECAST_SOURCE_METNO,
+                FORECAST_SOURCE_OPENMETEO,
+            ]
+        return [source]
+
+    def _interval_for(self, source: str) -> timedelta:
+        """Return the refresh interval to use after *source* delivered data."""
+        if self._interval_override:
+            return timedelta(minutes=self._interval_override)
+        return timedelta(
+            minutes=FORECAST_SOURCE_INTERVALS.get(source, DEFAULT_SCAN_INTERVAL)
+        )
+
+    async def _async_update_data(self) -> ForecastData:
+        """Resolve the forecast location and fetch the forecast."""
+        session = self._get_session()
+        budget = self.last_budget = RefreshBudget(FORECAST_REFRESH_BUDGET)
 
         # Determine forecast lat/lon: prefer user-supplied city via geocoding,
         # fall back to WU station coordinates
@@ -278,73 +985,138 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
         forecast_lon: float | None = None
 
         if self.city:
-            try:
-                geo = await fetch_geocoding(self.city, session)
-                if geo:
-                    forecast_lat, forecast_lon = geo
-                    _LOGGER.debug(
-                        "Geocoding '%s' -> lat=%s lon=%s", self.city, forecast_lat, forecast_lon
-                    )
-                else:
-                    _LOGGER.warning("Geocoding found no result for city: %s", self.city)
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.warning("Geocoding error for '%s': %s", self.city, exc)
-
-        if forecast_lat is None or forecast_lon is None:
-            forecast_lat = data.get(ATTR_LAT)
-            forecast_lon = data.get(ATTR_LON)
-
-        if forecast_lat is not None and forecast_lon is not None:
-            self.forecast_data, self.forecast_source_used = (
-                await self._fetch_forecast_with_fallback(
-                    forecast_lat, forecast_lon, session
-                )
+            with budget.stage("geocoding"):
+                geo = await self._async_resolve_city(session, budget)
+            if geo:
+                forecast_lat, forecast_lon = geo
+
+        if (forecast_lat is None or forecast_lon is None) and self._observation.data:
+            forecast_lat = self._observation.data.lat
+            forecast_lon = self._observation.data.lon
+
+        self.waiting_for_location = forecast_lat is None or forecast_lon is None
+        if self.waiting_for_location:
+            # e.g. geocoding failed while the first observation was still
+            # being fetched: retry with the next observation, not in 30 min.
+            # Push-only entries do not poll; the next upload asks for a
+            # refresh, and the forecast interval is the fallback.
+            self.update_interval = (
+                self._observation.update_interval
+                or self._interval_for(self._source_order()[0])
             )
-        else:
-            self.forecast_data = []
-            self.forecast_source_used = ""
+            raise UpdateFailed("No location available for the forecast yet")
+
+        forecast_lat, forecast_lon = snap_to_grid(forecast_lat, forecast_lon)
+        result, source_used = await self._fetch_forecast_with_fallback(
+            forecast_lat, forecast_lon, session, budget
+        )
+        _LOGGER.debug(
+            "Forecast refresh of station %s: %s",
+            self._observation.station_id,
+            budget.as_dict(),
+        )
+        if not result:
+            raise UpdateFailed("All forecast sources failed")
+
+        self.update_interval = self._interval_for(source_used)
+        self._observation.async_schedule_snapshot_save()
+        return ForecastData(forecast=result.daily, source=source_used, result=result)
+
+    async def _async_resolve_city(
+        self, session: aiohttp.ClientSession, budget: RefreshBudget
+    ) -> tuple[float, float] | None:
+        """Return (lat, lon) of the configured city, geocoding only on a cache miss.
 
-        return data
+        The cache is persisted per config entry; entries for any other city
+        (i.e. the city was changed in the options flow) are discarded on load.
+        Transport errors are not cached, so the next refresh retries them.
+        """
+        if self._geocoding_cache is None:
+            self._geocoding_cache = GeocodingCache.from_dict(
+                await self._geocoding_store.async_load()
+            )
+            if self._geocoding_cache.retain_only(self.city):
+                self._geocoding_store.async_delay_save(self._geocoding_cache.as_dict, 10)
+
+        hit, geo = self._geocoding_cache.lookup(self.city)
+        if hit:
+            return geo
+        if not budget.allows("geocoding"):
+            return None
+
+        try:
+            geo = await fetch_geocoding(
+                self.city,
+                session,
+                self._observation.request_metrics.get(METRIC_GEOCODING),
+                budget.timeout(10),
+            )
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Geocoding error for '%s': %s", self.city, exc)
+            return None
+
+        if geo:
+            _LOGGER.debug("Geocoding '%s' -> lat=%s lon=%s", self.city, geo[0], geo[1])
+        else:
+            _LOGGER.warning("Geocoding found no result for city: %s", self.city)
+        self._geocoding_cache.store(self.city, geo)
+        self._geocoding_store.async_delay_save(self._geocoding_cache.as_dict, 10)
+        return geo
 
     async def _fetch_forecast_with_fallback(
         self,
         lat: float,
         lon: float,
         session: aiohttp.ClientSession,
-    ) -> tuple[list[dict[str, Any]], str]:
+        budget: RefreshBudget,
+    ) -> tuple[ForecastResult, str]:
         """Fetch forecast using the configured source, with automatic fallback.
 
-        Returns (forecast_list, source_name_used).
+        Returns (forecast_result, source_name_used).
 
         Fallback sorrendfelhasználó beállításától függően:
           auto         → wunderground → metno → openmeteo
           wunderground → csak WU
           metno        → csak MET.no
           openmeteo    → csak Open-Meteo
+          ensemble     → mindhárom egyszerre, naponként összevonva
         """
         source = self.forecast_source or FORECAST_SOURCE_AUTO
+        order = self._source_order()
 
-        if source == FORECAST_SOURCE_AUTO:
-            order = [
-                FORECAST_SOURCE_WUNDERGROUND,
-                FORECAST_SOURCE_METNO,
-                FORECAST_SOURCE_OPENMETEO,
-            ]
-        else:
-            order = [source]
+        if source == FORECAST_SOURCE_ENSEMBLE:
+            return await self._fetch_forecast_ensemble(lat, lon, order, session, budget)
+
+        if len(order) > 1 and self._hedge_delay > 0:
+            result, src = await self._fetch_forecast_hedged(
+                lat, lon, order, session, budget
+            )
+            if result:
+                _LOGGER.debug(
+                    "Forecast fetched (hedged) from source '%s' for %s (%.4f, %.4f).",
+                    src, self.city or self._observation.station_id, lat, lon,
+                )
+                return result, src
+            order = []
 
         for src in order:
-            result = await self._fetch_single_source(lat, lon, src, session)
+            if not budget.allows(f"forecast_{src}"):
+                _LOGGER.warning(
+                    "Refresh time budget used up, not trying forecast source '%s'",
+                    src,
+                )
+                break
+            result = await self._fetch_single_source(lat, lon, src, session, budget)
             if result:
                 _LOGGER.debug(
                     "Forecast fetched successfully from source '%s' for %s (%.4f, %.4f).",
-                    src, self.city or self.station_id, lat, lon,
+                    src, self.city or self._observation.station_id, lat, lon,
                 )
                 return result, src
             _LOGGER.warning(
                 "Forecast source '%s' returned no data for %s (%.4f, %.4f)%s.",
                 src,
-                self.city or self.station_id,
+                self.city or self._observation.station_id,
                 lat,
                 lon,
                 " – trying next source" if (source == FORECAST_SOURCE_AUTO and src != order[-1]) else "",
@@ -352,9 +1124,120 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
 
         _LOGGER.error(
             "All forecast sources failed for %s (%.4f, %.4f).",
-            self.city or self.station_id, lat, lon,
+            self.city or self._observation.station_id, lat, lon,
+        )
+        return ForecastResult(), ""
+
+    async def _fetch_forecast_hedged(
+        self,
+        lat: float,
+        lon: float,
+        order: list[str],
+        session: aiohttp.ClientSession,
+        budget: RefreshBudget,
+    ) -> tuple[ForecastResult, str]:
+        """Race the sources instead of trying them strictly one after another.
+
+        The next source is started once the running ones have been silent for
+        ``hedge_delay`` seconds, or immediately when a started source fails,
+        but never once a started source holds a usable result.
+        The winner is the first non-empty result *in priority order*: a lower
+        priority answer is only used once every higher priority source has
+        failed.  Losers are cancelled.  Worst case is about one source
+        timeout instead of the sum of all of them.  No further source is
+        started once the refresh budget is used up.
+        """
+        tasks: list[asyncio.Task[ForecastResult]] = []
+
+        def start_next() -> bool:
+            if len(tasks) == len(order):
+                return False
+            src = order[len(tasks)]
+            if not budget.allows(f"forecast_{src}"):
+                return False
+            tasks.append(
+                asyncio.create_task(
+                    self._fetch_single_source(lat, lon, src, session, budget)
+                )
+            )
+            return True
+
+        start_next()
+        try:
+            while True:
+                for src, task in zip(order, tasks):
+                    if not task.done():
+                        break  # a higher priority source is still running
+                    if task.result():
+                        return task.result(), src
+                else:
+                    # every started source has failed
+                    if not start_next():
+                        return ForecastResult(), ""
+                    continue
+
+                # a lower priority source already answered: it is the fallback,
+                # so just wait for the higher priority ones still running
+                answered = any(task.done() and task.result() for task in tasks)
+                more = len(tasks) < len(order) and not answered
+                done, _ = await asyncio.wait(
+                    [task for task in tasks if not task.done()],
+                    timeout=self._hedge_delay if more else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if more and (not done or any(not task.result() for task in done)):
+                    start_next()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _fetch_forecast_ensemble(
+        self,
+        lat: float,
+        lon: float,
+        order: list[str],
+        session: aiohttp.ClientSession,
+        budget: RefreshBudget,
+    ) -> tuple[ForecastResult, str]:
+        """Fetch every source concurrently and merge them day by day.
+
+        Sources that fail (or do not fit in the budget) are left out of the
+        merge; one answering source is enough.  The hourly / twice-daily
+        forecasts are taken from the first member, in *order*, that has one.
+        """
+        started = [src for src in order if budget.allows(f"forecast_{src}")]
+        results = await asyncio.gather(
+            *(
+                self._fetch_single_source(lat, lon, src, session, budget)
+                for src in started
+            )
         )
-        return [], ""
+        members = {src: result for src, result in zip(started, results) if result}
+        if not members:
+            _LOGGER.error(
+                "All forecast sources failed for %s (%.4f, %.4f).",
+                self.city or self._observation.station_id, lat, lon,
+            )
+            return ForecastResult(), ""
+
+        _LOGGER.debug(
+            "Forecast ensemble of %s for %s (%.4f, %.4f).",
+            ", ".join(members), self.city or self._observation.station_id, lat, lon,
+        )
+        hourly = next((r for r in members.values() if r.has_hourly), None)
+        twice_daily = next((r for r in members.values() if r.has_twice_daily), None)
+        merged = ForecastResult(
+            merge_ensemble(
+                {src: result.daily for src, result in members.items()},
+                ENSEMBLE_WEIGHTS,
+                order,
+            ),
+            hourly=(lambda: hourly.hourly) if hourly else None,
+            twice_daily=(lambda: twice_daily.twice_daily) if twice_daily else None,
+            sources=tuple(members),
+        )
+        return merged, FORECAST_SOURCE_ENSEMBLE
 
     async def _fetch_single_source(
         self,
@@ -362,37 +1245,92 @@ class WundergroundPWSCoordinator(DataUpdateCoordinator):
         lon: float,
         source: str,
         session: aiohttp.ClientSession,
-    ) -> list[dict[str, Any]]:
-        """Fetch forecast from a single named source. Returns [] on failure."""
+        budget: RefreshBudget,
+    ) -> ForecastResult:
+        """Fetch forecast from a single named source. Empty result on failure.
+
+        Goes through the domain-wide cache, so entries in the same grid cell
+        share one request per source per TTL.  The source's circuit breaker
+        guards (and counts) only the real upstream calls: a fresh cached
+        result is served even while the breaker is open.
+        """
+        http_cache = self._shared_cache.http_cache
+        breaker = self.breakers.get(source)
+        metrics = self._observation.request_metrics.get(
+            METRIC_FORECAST.format(source=source)
+        )
+        timeout = budget.timeout(FORECAST_SOURCE_TIMEOUTS.get(source, 15))
         try:
             if source == FORECAST_SOURCE_WUNDERGROUND:
-                if not self.api_key:
+                api_key = self._observation.api_key
+                if not api_key:
                     _LOGGER.debug(
                         "Skipping WU forecast: no API key available."
                     )
-                    return []
-                return await fetch_wunderground_forecast(lat, lon, self.api_key, session)
-            if source == FORECAST_SOURCE_METNO:
-                return await fetch_metno_forecast(lat, lon, session)
-            if source == FORECAST_SOURCE_OPENMETEO:
-                return await fetch_open_meteo_forecast(lat, lon, session)
+                    return ForecastResult()
+                fetch = partial(
+                    fetch_wunderground_forecast,
+                    lat,
+                    lon,
+                    api_key,
+                    session,
+                    http_cache,
+                    metrics,
+                    timeout,
+                )
+            elif source == FORECAST_SOURCE_METNO:
+                # bucket MET.no's UTC timesteps by HA's local date
+                fetch = partial(
+                    fetch_metno_forecast,
+                    lat,
+                    lon,
+                    session,
+                    http_cache,
+                    dt_util.get_time_zone(self.hass.config.time_zone),
+                    metrics,
+                    timeout,
+                )
+            elif source == FORECAST_SOURCE_OPENMETEO:
+                fetch = partial(
+                    fetch_open_meteo_forecast,
+                    lat,
+                    lon,
+                    session,
+                    http_cache,
+                    metrics,
+                    timeout,
+                )
+            else:
+                return ForecastResult()
+
+            async def upstream() -> ForecastResult:
+                """Call the source unless its breaker is open; record the outcome."""
+                if not breaker.allow():
+                    _LOGGER.debug(
+                        "Skipping forecast source '%s': circuit open "
+                        "(next probe in %s s)",
+                        source,
+                        breaker.retry_in,
+                    )
+                    return ForecastResult()
+                try:
+                    result = await fetch()
+                except Exception as exc:
+                    breaker.record_failure(f"{type(exc).__name__}: {exc}")
+                    raise
+                if result:
+                    breaker.record_success()
+                else:
+                    # the fetchers log their own errors and answer an empty result
+                    breaker.record_failure("empty forecast")
+                return result
+
+            with budget.stage(f"forecast_{source}"):
+                return await self._shared_cache.async_get(
+                    (source, lat, lon),
+                    self._interval_for(source).total_seconds(),
+                    upstream,
+                )
         except Exception as exc:  # noqa: BLE001
             _LOGGER.warning("Forecast source '%s' raised an error: %s", source, exc)
-        return []
-
-    @staticmethod
-    def _determine_condition(data: dict[str, Any]) -> str:
-        """Determine HA weather condition from observation data."""
-        precip_rate = float(data.get(ATTR_PRECIPITATION_RATE) or 0)
-        uv = float(data.get(ATTR_UV_INDEX) or 0)
-        solar = float(data.get(ATTR_SOLAR_RADIATION) or 0)
-
-        if precip_rate > 0:
-            return "rainy"
-        if solar > 600 and uv > 5:
-            return "sunny"
-        if solar > 200:
-            return "partlycloudy"
-        if solar < 50:
-            return "cloudy"
-        return "partlycloudy"
+            return ForecastResult()
@@ -0,0 +1,82 @@
+"""Diagnostics support for the Wunderground PWS integration.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, CONF_CITY, CONF_PUSH_PASSWORD, DOMAIN
+from .coordinator import WundergroundPWSCoordinator
+
+# The key and the push password are secrets; the coordinates / city locate
+# the user's home
+TO_REDACT = {CONF_API_KEY, CONF_CITY, CONF_PUSH_PASSWORD, "apiKey", "lat", "lon"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: WundergroundPWSCoordinator = hass.data[DOMAIN][entry.entry_id]
+    forecast = coordinator.forecast_coordinator
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "observation": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "upload_period": coordinator.upload_period,
+            "duplicate_polls_suppressed": coordinator.duplicate_polls_suppressed,
+            "last_backfill": coordinator.last_backfill,
+            "daily_statistics": coordinator.daily_statistics.as_dict(),
+            "statistics_hours_imported": coordinator.statistics_hours_imported,
+            "local_push": coordinator.local_push,
+            "push_only": coordinator.push_only,
+            "pushes_received": coordinator.pushes_received,
+            "last_push_at": (
+                coordinator.last_push_at.isoformat()
+                if coordinator.last_push_at
+                else None
+            ),
+            "last_refresh_budget": (
+                coordinator.last_budget.as_dict() if coordinator.last_budget else None
+            ),
+            "data": (
+                async_redact_data(coordinator.data.as_dict(), TO_REDACT)
+                if coordinator.data
+                else None
+            ),
+        },
+        "forecast": {
+            "last_update_success": forecast.last_update_success,
+            "update_interval": (
+                forecast.update_interval.total_seconds()
+                if forecast.update_interval
+                else None
+            ),
+            "source_used": forecast.source_used,
+            "ensemble_sources": list(forecast.ensemble_sources),
+            "days": len(forecast.forecast),
+            "last_refresh_budget": (
+                forecast.last_budget.as_dict() if forecast.last_budget else None
+            ),
+        },
+        "circuit_breakers": {
+            name: breaker.as_dict()
+            for name, breaker in coordinator.circuit_breakers.items()
+        },
+        "request_metrics": coordinator.request_metrics.as_dict(),
+    }
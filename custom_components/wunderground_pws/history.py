@@ -0,0 +1,300 @@
+"""Hourly long-term statistics of the observations, and gap backfill.
+
+Az integracio a sajat megfigyeleseibol oras atlag / min / max ertekeket
+szamol, es a lezart orakat kotegben, kulso statisztikakent irja a HA
+hosszu tavu statisztikai koze (nem kell hozza szenzoronkenti recorder
+allapot-tortenet).
+
+Kieses utan (HA ujrainditas, halozati hiba) az integracio egyetlen
+lekeressel letolti a WU PWS elozmenyeket (``observations/all/1day``, egy
+napnal hosszabb kiesesnel ``observations/hourly/7day`` is), egy kotegben
+metrikus egysegekre alakitja oket, es a hianyzo orak atlag / min / max
+ertekeit egyetlen tomeges muvelettel a HA hosszu tavu statisztikai koze
+irja.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfIrradiance,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfVolumetricFlux,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # cores before 2025.2 only know has_mean
+    StatisticMeanType = None
+
+from .api import Observation
+from .batch import enrich_observations
+from .const import (
+    DOMAIN,
+    ATTR_TEMPERATURE,
+    ATTR_DEW_POINT,
+    ATTR_HUMIDITY,
+    ATTR_PRESSURE,
+    ATTR_WIND_SPEED,
+    ATTR_WIND_GUST,
+    ATTR_PRECIPITATION_RATE,
+    ATTR_SOLAR_RADIATION,
+    ATTR_UV_INDEX,
+)
+
+# Observation fields kept as hourly statistics, with their units
+STATISTICS: dict[str, str | None] = {
+    ATTR_TEMPERATURE: UnitOfTemperature.CELSIUS,
+    ATTR_DEW_POINT: UnitOfTemperature.CELSIUS,
+    ATTR_HUMIDITY: PERCENTAGE,
+    ATTR_PRESSURE: UnitOfPressure.HPA,
+    ATTR_WIND_SPEED: UnitOfSpeed.KILOMETERS_PER_HOUR,
+    ATTR_WIND_GUST: UnitOfSpeed.KILOMETERS_PER_HOUR,
+    ATTR_PRECIPITATION_RATE: UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+    ATTR_SOLAR_RADIATION: UnitOfIrradiance.WATTS_PER_SQUARE_METER,
+    ATTR_UV_INDEX: None,
+}
+
+# imperial field of a current observation ← stem of the history field
+# (the history record has <stem>Avg / <stem>Low / <stem>High)
+_IMPERIAL_STEMS = {
+    "temp": "temp",
+    "dewpt": "dewpt",
+    "heatIndex": "heatindex",
+    "windSpeed": "windspeed",
+    "windGust": "windgust",
+}
+_VARIANTS = ("Avg", "Low", "High")
+# How the recorder should treat the imported means (has_mean is deprecated)
+_MEAN_METADATA: dict[str, Any] = (
+    {"has_mean": True}
+    if StatisticMeanType is None
+    else {"mean_type": StatisticMeanType.ARITHMETIC}
+)
+
+
+def statistic_id(station_id: str, key: str) -> str:
+    """Return the external statistic id of one measurement of a station."""
+    return f"{DOMAIN}:{station_id.lower()}_{key}"
+
+
+def _pick(block: dict[str, Any], stem: str, variant: str) -> Any:
+    """Return ``<stem><variant>``, falling back to the average."""
+    value = block.get(stem + variant)
+    return block.get(stem + "Avg") if value is None else value
+
+
+def history_to_current(record: dict[str, Any], variant: str) -> dict[str, Any]:
+    """Reshape one history record to a current observation.
+
+    *variant* (``Avg`` / ``Low`` / ``High``) selects which of the record's
+    aggregates fills the fields, so ``enrich_observation`` can convert them.
+    """
+    imp = record.get("imperial") or {}
+    pressure_min, pressure_max = imp.get("pressureMin"), imp.get("pressureMax")
+    if variant == "Low" or pressure_max is None:
+        pressure = pressure_min
+    elif variant == "High" or pressure_min is None:
+        pressure = pressure_max
+    else:
+        pressure = (pressure_min + pressure_max) / 2
+    return {
+        "stationID": record.get("stationID"),
+        "obsTimeUtc": record.get("obsTimeUtc"),
+        "obsTimeLocal": record.get("obsTimeLocal"),
+        "lat": record.get("lat"),
+        "lon": record.get("lon"),
+        "humidity": _pick(record, "humidity", variant),
+        "winddir": record.get("winddirAvg"),
+        "solarRadiation": record.get("solarRadiationHigh"),
+        "uv": record.get("uvHigh"),
+        "imperial": {
+            **{field: _pick(imp, stem, variant) for field, stem in _IMPERIAL_STEMS.items()},
+            "pressure": pressure,
+            "precipRate": imp.get("precipRate"),
+            "precipTotal": imp.get("precipTotal"),
+        },
+    }
+
+
+def _hour_of(stamp: str | None) -> datetime | None:
+    """Return the start of the UTC hour of an ``obsTimeUtc`` stamp."""
+    parsed = dt_util.parse_datetime(stamp or "")
+    if parsed is None:
+        return None
+    return dt_util.as_utc(parsed).replace(minute=0, second=0, microsecond=0)
+
+
+def _accumulate(
+    acc: dict[str, list[float]], key: str, value: float, lowest: float, highest: float
+) -> None:
+    """Add one value (and its low / high) to the [sum, count, min, max] of *key*."""
+    current = acc.get(key)
+    if current is None:
+        acc[key] = [value, 1, lowest, highest]
+    else:
+        current[0] += value
+        current[1] += 1
+        current[2] = min(current[2], lowest)
+        current[3] = max(current[3], highest)
+
+
+def _to_statistics(
+    hour: datetime, acc: dict[str, list[float]]
+) -> dict[str, StatisticData]:
+    """Return the ``StatisticData`` of one hour's accumulators."""
+    return {
+        key: StatisticData(
+            start=hour, mean=round(total / count, 2), min=lowest, max=highest
+        )
+        for key, (total, count, lowest, highest) in acc.items()
+    }
+
+
+class HourlyStatistics:
+    """Running hourly mean / min / max of the live observation stream.
+
+    Every new observation is added in O(1); when the first observation of a
+    new hour arrives, the previous hour is closed and queued until the
+    coordinator imports the queue.  An hour that misses observations (the
+    first one after a start, or one in which polls failed) is partial: it
+    is dropped when it closes, and the history backfill imports it instead.
+    """
+
+    def __init__(self) -> None:
+        """Start with no open hour."""
+        self._hour: datetime | None = None
+        self._acc: dict[str, list[float]] = {}
+        self._partial = False
+        # a poll failed and no observation arrived since
+        self._interrupted = False
+        self.completed: dict[datetime, dict[str, StatisticData]] = {}
+
+    def add(self, observation: Observation) -> bool:
+        """Add one observation; late (out-of-order) ones are ignored.
+
+        Returns True when it closes a partial hour, which is then left to
+        the history backfill.
+        """
+        hour = _hour_of(observation.obs_time_utc)
+        if hour is None or (self._hour is not None and hour < self._hour):
+            return False
+        dropped = False
+        if hour != self._hour:
+            if self._hour is not None and self._partial:
+                dropped = True
+            elif self._hour is not None and self._acc:
+                self.completed[self._hour] = _to_statistics(self._hour, self._acc)
+            # the first hour after a start or an outage misses its earlier
+            # observations
+            partial = self._hour is None or self._interrupted
+            self._hour, self._acc, self._partial = hour, {}, partial
+        self._interrupted = False
+        for key in STATISTICS:
+            value = getattr(observation, key)
+            if value is not None:
+                _accumulate(self._acc, key, value, value, value)
+        return dropped
+
+    def interrupt(self) -> None:
+        """Drop the open hour's observations and mark it partial (a poll failed)."""
+        self._acc = {}
+        self._partial = self._interrupted = True
+
+    def pop_completed(self) -> dict[datetime, dict[str, StatisticData]]:
+        """Return and forget the closed hours."""
+        completed, self.completed = self.completed, {}
+        return completed
+
+
+def hourly_statistics(
+    records: list[dict[str, Any]], since: datetime, until: datetime
+) -> dict[datetime, dict[str, StatisticData]]:
+    """Reduce history records to hourly mean / min / max of every ``STATISTICS`` field.
+
+    Every record is converted three times (its average, low and high
+    values) in one batch; an hour's mean is the mean of the averages, its
+    min / max the extremes of the lows / highs.  Only hours starting in
+    [*since*, *until*) are returned.
+    """
+    enriched = enrich_observations(
+        history_to_current(record, variant)
+        for record in records
+        for variant in _VARIANTS
+    )
+    # hour → field → [sum, count, min, max]
+    hours: dict[datetime, dict[str, list[float]]] = {}
+    for i in range(0, len(enriched) - 2, 3):
+        avg, low, high = enriched[i], enriched[i + 1], enriched[i + 2]
+        hour = _hour_of(avg.obs_time_utc)
+        if hour is None or not since <= hour < until:
+            continue
+        acc = hours.setdefault(hour, {})
+        for key in STATISTICS:
+            value = getattr(avg, key)
+            if value is None:
+                continue
+            low_value, high_value = getattr(low, key), getattr(high, key)
+            lowest = value if low_value is None else min(value, low_value)
+            highest = value if high_value is None else max(value, high_value)
+            _accumulate(acc, key, value, lowest, highest)
+
+    return {hour: _to_statistics(hour, acc) for hour, acc in hours.items()}
+
+
+async def async_last_imported_hour(
+    hass: HomeAssistant, station_id: str
+) -> datetime | None:
+    """Return the start of the newest imported hour of a station (None if none)."""
+    sid = statistic_id(station_id, ATTR_TEMPERATURE)
+    last = await get_instance(hass).async_add_executor_job(
+        get_last_statistics, hass, 1, sid, False, {"mean"}
+    )
+    rows = last.get(sid)
+    if not rows:
+        return None
+    start = rows[0]["start"]
+    if isinstance(start, (int, float)):
+        return dt_util.utc_from_timestamp(start)
+    return start
+
+
+@callback
+def async_import_statistics(
+    hass: HomeAssistant,
+    station_id: str,
+    hours: dict[datetime, dict[str, StatisticData]],
+) -> None:
+    """Queue the hourly statistics for the recorder, one bulk insert per field."""
+    ordered = sorted(hours)
+    for key, unit in STATISTICS.items():
+        stats = [hours[hour][key] for hour in ordered if key in hours[hour]]
+        if not stats:
+            continue
+        async_add_external_statistics(
+            hass,
+            StatisticMetaData(
+                **_MEAN_METADATA,
+                has_sum=False,
+                name=f"{station_id} {key}",
+                source=DOMAIN,
+                statistic_id=statistic_id(station_id, key),
+                unit_of_measurement=unit,
+            ),
+            stats,
+        )
@@ -0,0 +1,174 @@
+"""Per-request instrumentation of the upstream HTTP calls.
+
+Minden hivasrol (WU megfigyeles, geokodolas, elorejelzes-forrasok) rogziti a
+valaszidot, a letoltott bajtokat, a JSON dekodolas idejet, a HTTP statuszt
+es a hiba tipusat, vegpontonkent egy-egy gordulo ablakban.  Az eredmeny a
+diagnosztikai letoltesben es a diagnosztikai szenzorokban jelenik meg.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .const import METRICS_WINDOW
+
+METRIC_WU_OBSERVATION = "wu_observation"
+METRIC_WU_KEY_DISCOVERY = "wu_key_discovery"
+METRIC_WU_HISTORY = "wu_history"
+METRIC_GEOCODING = "geocoding"
+METRIC_FORECAST = "forecast_{source}"
+
+
+def _nearest_rank(ordered: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+class RollingHistogram:
+    """The last ``window`` samples of one quantity, with percentiles."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialise an empty window."""
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        """Add a sample, evicting the oldest one when the window is full."""
+        self._samples.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile (None while empty)."""
+        if not self._samples:
+            return None
+        return _nearest_rank(sorted(self._samples), pct)
+
+    def summary(self) -> dict[str, Any]:
+        """Return count, mean, p50 / p95 / p99 and max of the window."""
+        if not self._samples:
+            return {"count": 0}
+        ordered = sorted(self._samples)
+        return {
+            "count": len(ordered),
+            "mean": round(sum(ordered) / len(ordered), 2),
+            "p50": round(_nearest_rank(ordered, 50), 2),
+            "p95": round(_nearest_rank(ordered, 95), 2),
+            "p99": round(_nearest_rank(ordered, 99), 2),
+            "max": round(ordered[-1], 2),
+        }
+
+
+@dataclass(slots=True)
+class RequestSample:
+    """What one request reports while it runs (filled in by the caller)."""
+
+    status: int | None = None
+    size: int | None = None  # bytes received
+    decode_ms: float | None = None
+
+
+class EndpointMetrics:
+    """Rolling statistics of the requests to one upstream endpoint."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialise empty statistics."""
+        self.latency_ms = RollingHistogram(window)
+        self.size_bytes = RollingHistogram(window)
+        self.decode_ms = RollingHistogram(window)
+        self.requests = 0
+        self.statuses: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.last_status: int | None = None
+        self.last_error: str | None = None
+        self.last_latency_ms: float | None = None
+
+    @contextmanager
+    def track(self) -> Iterator[RequestSample]:
+        """Time the request in the ``with`` block and record its outcome.
+
+        Exceptions are counted by class (``CancelledError`` = a hedged loser
+        or shutdown) and re-raised.
+        """
+        sample = RequestSample()
+        start = time.perf_counter()
+        error: str | None = None
+        try:
+            yield sample
+        except asyncio.CancelledError:
+            error = "CancelledError"
+            raise
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self._record(sample, (time.perf_counter() - start) * 1000, error)
+
+    def _record(self, sample: RequestSample, latency_ms: float, error: str | None) -> None:
+        """Add one finished request to the statistics."""
+        self.requests += 1
+        self.latency_ms.add(latency_ms)
+        self.last_latency_ms = round(latency_ms, 2)
+        if sample.size is not None:
+            self.size_bytes.add(sample.size)
+        if sample.decode_ms is not None:
+            self.decode_ms.add(sample.decode_ms)
+        if sample.status is not None:
+            self.statuses[sample.status] += 1
+            self.last_status = sample.status
+        if error is not None:
+            self.errors[error] += 1
+        self.last_error = error
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "latency_ms": self.latency_ms.summary(),
+            "size_bytes": self.size_bytes.summary(),
+            "decode_ms": self.decode_ms.summary(),
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_latency_ms": self.last_latency_ms,
+        }
+
+
+class RequestMetrics:
+    """``EndpointMetrics`` of every upstream of one config entry, by name."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialise an empty registry."""
+        self._window = window
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def get(self, name: str) -> EndpointMetrics:
+        """Return the metrics of endpoint *name*, creating them on first use."""
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = EndpointMetrics(self._window)
+        return metrics
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every endpoint's statistics for diagnostics."""
+        return {name: metrics.as_dict() for name, metrics in self._endpoints.items()}
+
+
+@contextmanager
+def track(metrics: EndpointMetrics | None) -> Iterator[RequestSample]:
+    """``metrics.track()``, or an unrecorded sample if *metrics* is None."""
+    if metrics is None:
+        yield RequestSample()
+        return
+    with metrics.track() as sample:
+        yield sample
@@ -0,0 +1,177 @@
+"""Local ingest of the Weather Underground PWS upload protocol.
+
+Az allomas a szokasos WU feltoltesi protokollal
+(``updateweatherstation.php?ID=...&PASSWORD=...&tempf=...&baromin=...``)
+kozvetlenul a Home Assistantnak kuldheti a meresit.  A keres a WU v2
+megfigyeles alakjara kerul, ugyanazon az ``enrich_observation`` atalakitason
+megy at, mint a felhobol lekerdezett adat, es azonnal frissiti a
+koordinatort; a felho lekerdezes igy csak opcionalis tartalek.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import hmac
+import logging
+from collections.abc import Mapping
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .api import Observation, _safe_float
+from .const import (
+    DOMAIN,
+    DATA_PUSH_STATIONS,
+    PUSH_MISSING_VALUE,
+    PUSH_URL,
+    PUSH_URL_ALT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# imperial field of the WU v2 observation ← upload parameter
+_IMPERIAL_PARAMS = {
+    "temp": "tempf",
+    "dewpt": "dewptf",
+    "windSpeed": "windspeedmph",
+    "windGust": "windgustmph",
+    "pressure": "baromin",
+    "precipRate": "rainin",  # rain of the last hour, i.e. in/h
+    "precipTotal": "dailyrainin",
+}
+# top-level field of the WU v2 observation ← upload parameter
+_TOP_PARAMS = {
+    "humidity": "humidity",
+    "winddir": "winddir",
+    "solarRadiation": "solarradiation",
+    "uv": "UV",
+}
+_UPLOAD_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Answers of the WU upload server, which station firmwares look for
+RESPONSE_SUCCESS = "success\n"
+RESPONSE_INVALID = "INVALIDPASSWORDID|Password or key and/or id are incorrect\n"
+
+
+def _param(params: Mapping[str, str], name: str) -> float | None:
+    """Return a numeric upload parameter; missing / -9999 → None."""
+    value = _safe_float(params.get(name))
+    if value is None or value == PUSH_MISSING_VALUE:
+        return None
+    return value
+
+
+def _heat_index_f(temp_f: float | None, humidity: float | None) -> float | None:
+    """Return the NWS heat index (°F); the temperature itself below 80 °F.
+
+    The upload carries no heat index, while the WU v2 observation does; this
+    is how the WU API derives it.
+    """
+    if temp_f is None or humidity is None or temp_f < 80:
+        return temp_f
+    t, rh = temp_f, humidity
+    return round(
+        -42.379
+        + 2.04901523 * t
+        + 10.14333127 * rh
+        - 0.22475541 * t * rh
+        - 0.00683783 * t * t
+        - 0.05481717 * rh * rh
+        + 0.00122874 * t * t * rh
+        + 0.00085282 * t * rh * rh
+        - 0.00000199 * t * t * rh * rh,
+        1,
+    )
+
+
+def _obs_time_utc(params: Mapping[str, str]) -> str:
+    """Return the upload's ``dateutc`` as WU ``obsTimeUtc``; "now" if absent."""
+    stamp = params.get("dateutc", "now")
+    parsed = None
+    if stamp != "now":
+        try:
+            parsed = dt_util.parse_datetime(stamp.replace(" ", "T") + "+00:00")
+        except ValueError:
+            parsed = None
+    if parsed is None:
+        parsed = dt_util.utcnow()
+    return parsed.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _password_matches(expected: str, given: str) -> bool:
+    """Return True if *given* is the (non-empty) push password."""
+    return bool(expected) and hmac.compare_digest(expected.encode(), given.encode())
+
+
+def upload_to_observation(
+    params: Mapping[str, str], station_id: str, previous: Observation | None
+) -> dict[str, Any]:
+    """Reshape an upload request to a WU v2 observation (imperial units).
+
+    The upload has no location; name, country, coordinates and elevation
+    are kept from the *previous* observation (a cloud poll: the fallback
+    polls, or in push-only mode the one that locates the station at setup).
+    """
+    imperial: dict[str, Any] = {
+        field: _param(params, name) for field, name in _IMPERIAL_PARAMS.items()
+    }
+    observation: dict[str, Any] = {
+        field: _param(params, name) for field, name in _TOP_PARAMS.items()
+    }
+    imperial["heatIndex"] = _heat_index_f(imperial["temp"], observation["humidity"])
+    obs_time_utc = _obs_time_utc(params)
+    obs_time_local = dt_util.as_local(dt_util.parse_datetime(obs_time_utc))
+    if previous is not None and previous.elevation_m is not None:
+        imperial["elev"] = previous.elevation_m / 0.3048
+    observation.update(
+        stationID=station_id,
+        obsTimeUtc=obs_time_utc,
+        obsTimeLocal=obs_time_local.strftime(_UPLOAD_TIME_FORMAT),
+        neighborhood=previous.location_name if previous else None,
+        country=previous.country if previous else None,
+        lat=previous.lat if previous else None,
+        lon=previous.lon if previous else None,
+        imperial=imperial,
+    )
+    return observation
+
+
+class WundergroundUploadView(HomeAssistantView):
+    """Accept WU PWS protocol uploads of the configured stations.
+
+    Stations cannot send HA tokens, so the view is unauthenticated; the
+    station ID must belong to an entry with local push enabled, and
+    ``PASSWORD`` must match the entry's push password, which is mandatory.
+    """
+
+    url = PUSH_URL
+    extra_urls = [PUSH_URL_ALT]
+    name = f"api:{DOMAIN}:upload"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Handle one upload."""
+        params = request.query
+        stations = self.hass.data.get(DOMAIN, {}).get(DATA_PUSH_STATIONS, {})
+        coordinator = stations.get(params.get("ID", "").upper())
+        if coordinator is None or not _password_matches(
+            coordinator.push_password, params.get("PASSWORD", "")
+        ):
+            _LOGGER.debug(
+                "Rejected an upload of station %r from %s",
+                params.get("ID"),
+                request.remote,
+            )
+            return web.Response(text=RESPONSE_INVALID, status=HTTPStatus.UNAUTHORIZED)
+        coordinator.async_push_observation(params)
+        return web.Response(text=RESPONSE_SUCCESS)
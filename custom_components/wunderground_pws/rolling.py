@@ -0,0 +1,137 @@
+"""Streaming daily statistics of the observations (min / max / mean).
+
+Minden uj megfigyeles O(1) idoben frissiti a mert ertekek napi
+statisztikajat: Welford-fele atlag / szoras, valamint minimum es maximum az
+idopontjukkal.  Nincs elozmeny-lekerdezes es nincs plusz API hivas; a
+statisztika helyi ejfelkor nullazodik, es ujrainditas utan a mentett
+allapotbol folytatodik.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .api import Observation
+from .const import ATTR_TEMPERATURE, ATTR_WIND_GUST, ATTR_WIND_SPEED
+
+# Observation fields with daily statistics
+ROLLING_FIELDS = (ATTR_TEMPERATURE, ATTR_WIND_SPEED, ATTR_WIND_GUST)
+
+
+class RunningStatistics:
+    """Welford mean / variance and timestamped extrema of one measurement."""
+
+    __slots__ = ("count", "_mean", "_m2", "min", "min_at", "max", "max_at")
+
+    def __init__(self) -> None:
+        """Start with no samples."""
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared deviations from the mean
+        self.min: float | None = None
+        self.min_at: str | None = None
+        self.max: float | None = None
+        self.max_at: str | None = None
+
+    def add(self, value: float, at: str | None) -> None:
+        """Add one sample, observed at *at* (``obsTimeUtc``)."""
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.min is None or value < self.min:
+            self.min, self.min_at = value, at
+        if self.max is None or value > self.max:
+            self.max, self.max_at = value, at
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples (None while empty)."""
+        return self._mean if self.count else None
+
+    @property
+    def std_dev(self) -> float | None:
+        """Return the population standard deviation (None while empty)."""
+        return math.sqrt(self._m2 / self.count) if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "count": self.count,
+            "mean": self._mean,
+            "m2": self._m2,
+            "min": self.min,
+            "min_at": self.min_at,
+            "max": self.max,
+            "max_at": self.max_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RunningStatistics:
+        """Rebuild the statistics saved by ``as_dict``."""
+        stats = cls()
+        stats.count = data.get("count", 0)
+        stats._mean = data.get("mean", 0.0)
+        stats._m2 = data.get("m2", 0.0)
+        stats.min, stats.min_at = data.get("min"), data.get("min_at")
+        stats.max, stats.max_at = data.get("max"), data.get("max_at")
+        return stats
+
+
+class DailyStatistics:
+    """``RunningStatistics`` of every ``ROLLING_FIELDS`` field for one local day."""
+
+    def __init__(self, day: str | None = None) -> None:
+        """Start an empty day (ISO date, local time)."""
+        self.reset(day)
+
+    def reset(self, day: str | None) -> None:
+        """Start a new, empty *day*."""
+        self.day = day
+        # obsTimeUtc of the newest sample: an observation seen before the
+        # restart (or both pushed and polled) is not counted twice
+        self.last_at: str | None = None
+        self.fields: dict[str, RunningStatistics] = {
+            key: RunningStatistics() for key in ROLLING_FIELDS
+        }
+
+    def add(self, observation: Observation, day: str) -> bool:
+        """Add an observation of local *day*; False if it is not newer.
+
+        An observation of a past day, or one not newer than the last added,
+        is skipped; one of a later day starts that day first.
+        """
+        at = observation.obs_time_utc
+        if self.day is not None and day < self.day:
+            return False
+        if day != self.day:
+            self.reset(day)
+        elif at is not None and self.last_at is not None and at <= self.last_at:
+            return False
+        self.last_at = at or self.last_at
+        for key, stats in self.fields.items():
+            value = getattr(observation, key)
+            if value is not None:
+                stats.add(value, at)
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "day": self.day,
+            "last_at": self.last_at,
+            "fields": {key: stats.as_dict() for key, stats in self.fields.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DailyStatistics:
+        """Rebuild the statistics saved by ``as_dict``."""
+        daily = cls(data.get("day"))
+        daily.last_at = data.get("last_at")
+        for key, saved in (data.get("fields") or {}).items():
+            if key in daily.fields:
+                daily.fields[key] = RunningStatistics.from_dict(saved)
+        return daily
@@ -0,0 +1,99 @@
+"""Adaptive polling for the Wunderground PWS observation coordinator.
+
+Az allomas feltoltesi periodusat az egymast koveto ``obsTimeUtc`` ertekekbol
+becsli, es a kovetkezo lekerdezest kozvetlenul a varhato kovetkezo feltoltes
+utanra idoziti.  Ha az allomas elhallgat, a lekerdezes ritkul; ha ujra aktiv,
+ismet suruebb lesz -- mindig a MIN / MAX_SCAN_INTERVAL hatarokon belul.
+
+Keszito: Aiasz
+Verzio: 1.4.1
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from .const import (
+    ADAPTIVE_POLL_MARGIN,
+    ADAPTIVE_PERIOD_SMOOTHING,
+    ADAPTIVE_PROBE_EVERY,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+
+
+def _parse_obs_time(value: str | None) -> datetime | None:
+    """Parse a WU ``obsTimeUtc`` value (``2024-05-01T12:34:56Z``)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class AdaptivePollScheduler:
+    """Learn a station's upload cadence and time polls just after uploads."""
+
+    def __init__(
+        self,
+        min_interval: timedelta = timedelta(minutes=MIN_SCAN_INTERVAL),
+        max_interval: timedelta = timedelta(minutes=MAX_SCAN_INTERVAL),
+        margin: timedelta = timedelta(seconds=ADAPTIVE_POLL_MARGIN),
+    ) -> None:
+        """Initialise; polls at the minimum interval until a period is learned."""
+        self._min = min_interval
+        self._max = max_interval
+        self._margin = margin
+        self._period: float | None = None
+        self._last_obs: datetime | None = None
+        self._quiet_polls = 0
+        self._uploads_seen = 0
+
+    @property
+    def period(self) -> timedelta | None:
+        """Return the estimated upload period (None until two uploads were seen)."""
+        return timedelta(seconds=self._period) if self._period is not None else None
+
+    def next_interval(self, obs_time_utc: str | None, now: datetime) -> timedelta:
+        """Record a poll result and return the delay until the next poll.
+
+        *now* must be timezone-aware UTC.
+        """
+        obs_time = _parse_obs_time(obs_time_utc)
+        if obs_time is not None and (self._last_obs is None or obs_time > self._last_obs):
+            if self._last_obs is not None:
+                gap = (obs_time - self._last_obs).total_seconds()
+                # A gap longer than the max interval is an outage, not a cadence
+                if gap <= self._max.total_seconds():
+                    if self._period is None:
+                        self._period = gap
+                    else:
+                        self._period += ADAPTIVE_PERIOD_SMOOTHING * (gap - self._period)
+            self._last_obs = obs_time
+            self._quiet_polls = 0
+            self._uploads_seen += 1
+        else:
+            self._quiet_polls += 1
+
+        if self._last_obs is not None and self._period is not None and not self._quiet_polls:
+            period = self._period
+            # Polling once per period only ever sees gaps of one period, so a
+            # station that started uploading faster would go unnoticed; probe
+            # at half the period every now and then.
+            if (
+                self._uploads_seen % ADAPTIVE_PROBE_EVERY == 0
+                and period >= 2 * self._min.total_seconds()
+            ):
+                period /= 2
+            expected = self._last_obs + timedelta(seconds=period) + self._margin
+            if expected > now:
+                return self._clamp(expected - now)
+
+        # Upload overdue (or no usable timestamp): poll again soon, backing
+        # off exponentially while the station stays quiet
+        backoff = max(0, min(self._quiet_polls - 1, 6))
+        return self._clamp(self._min * (2**backoff))
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        """Clamp *interval* to the allowed polling range."""
+        return max(self._min, min(self._max, interval))
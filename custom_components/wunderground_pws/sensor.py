@@ -5,7 +5,9 @@ Verzio: 1.3.0
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -17,18 +19,21 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     DEGREE,
+    EntityCategory,
     PERCENTAGE,
     UnitOfIrradiance,
     UnitOfLength,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfVolumetricFlux,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .breaker import STATE_CLOSED
 from .const import (
     DOMAIN,
     ATTR_TEMPERATURE,
@@ -39,27 +44,44 @@ from .const import (
     ATTR_WIND_SPEED,
     ATTR_WIND_GUST,
     ATTR_WIND_BEARING,
-    ATTR_WIND_COMPASS,
     ATTR_WIND_COMPASS_HU,
     ATTR_HEAT_INDEX,
     ATTR_PRECIPITATION,
     ATTR_PRECIPITATION_RATE,
     ATTR_SOLAR_RADIATION,
     ATTR_UV_INDEX,
-    ATTR_STATION_ID,
-    ATTR_LAST_UPDATED,
     ATTR_CLOUD_BASE,
     ATTR_ABSOLUTE_HUMIDITY,
     ATTR_WIND_CHILL,
 )
 from .coordinator import WundergroundPWSCoordinator
+from .metrics import METRIC_FORECAST, METRIC_WU_OBSERVATION, EndpointMetrics
+from .rolling import RunningStatistics
 
 
 @dataclass(frozen=True)
 class WundergroundSensorEntityDescription(SensorEntityDescription):
     """Describe a Wunderground PWS sensor."""
 
-    data_key: str = ""
+    data_key: str = ""  # attribute of the coordinator's Observation record
+
+
+@dataclass(frozen=True)
+class WundergroundDiagnosticEntityDescription(SensorEntityDescription):
+    """Describe a diagnostic sensor reading the coordinator itself."""
+
+    value_fn: Callable[[WundergroundPWSCoordinator], Any] = lambda _: None
+    attributes_fn: Callable[[WundergroundPWSCoordinator], dict[str, Any] | None] = (
+        lambda _: None
+    )
+
+
+@dataclass(frozen=True)
+class WundergroundDailyEntityDescription(SensorEntityDescription):
+    """Describe a sensor of today's statistics of one measurement."""
+
+    data_key: str = ""  # field of the coordinator's DailyStatistics
+    statistic: str = ""  # "min", "max" or "mean"
 
 
 SENSOR_DESCRIPTIONS: tuple[WundergroundSensorEntityDescription, ...] = (
@@ -195,6 +217,165 @@ SENSOR_DESCRIPTIONS: tuple[WundergroundSensorEntityDescription, ...] = (
     ),
 )
 
+DAILY_DESCRIPTIONS: tuple[WundergroundDailyEntityDescription, ...] = (
+    WundergroundDailyEntityDescription(
+        key="temperature_min_today",
+        data_key=ATTR_TEMPERATURE,
+        statistic="min",
+        name="Napi minimum hőmérséklet",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WundergroundDailyEntityDescription(
+        key="temperature_max_today",
+        data_key=ATTR_TEMPERATURE,
+        statistic="max",
+        name="Napi maximum hőmérséklet",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WundergroundDailyEntityDescription(
+        key="temperature_mean_today",
+        data_key=ATTR_TEMPERATURE,
+        statistic="mean",
+        name="Napi átlaghőmérséklet",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WundergroundDailyEntityDescription(
+        key="wind_gust_max_today",
+        data_key=ATTR_WIND_GUST,
+        statistic="max",
+        name="Napi legnagyobb széllökés",
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WundergroundDailyEntityDescription(
+        key="wind_speed_mean_today",
+        data_key=ATTR_WIND_SPEED,
+        statistic="mean",
+        name="Napi átlagos szélerősség",
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+
+def _round(value: float | None) -> float | None:
+    """Round a millisecond value for display."""
+    return round(value, 1) if value is not None else None
+
+
+def _forecast_metrics(
+    coordinator: WundergroundPWSCoordinator,
+) -> dict[str, EndpointMetrics]:
+    """Return the request metrics of the forecast source(s) currently in use."""
+    forecast = coordinator.forecast_coordinator
+    sources = forecast.ensemble_sources or (
+        (forecast.source_used,) if forecast.source_used else ()
+    )
+    return {
+        source: coordinator.request_metrics.get(METRIC_FORECAST.format(source=source))
+        for source in sources
+    }
+
+
+def _forecast_latency(coordinator: WundergroundPWSCoordinator) -> float | None:
+    """Return the latest request latency of the forecast source in use.
+
+    The members of an ensemble are fetched concurrently, so the slowest one
+    is what the refresh waited for.
+    """
+    latencies = [
+        metrics.last_latency_ms
+        for metrics in _forecast_metrics(coordinator).values()
+        if metrics.last_latency_ms is not None
+    ]
+    return _round(max(latencies)) if latencies else None
+
+
+def _forecast_attributes(coordinator: WundergroundPWSCoordinator) -> dict[str, Any]:
+    """Return the source in use and its request statistics."""
+    endpoints = _forecast_metrics(coordinator)
+    source = coordinator.forecast_coordinator.source_used or None
+    if len(endpoints) == 1 and source in endpoints:
+        return {"source": source, **endpoints[source].as_dict()}
+    return {
+        "source": source,
+        **{name: metrics.as_dict() for name, metrics in endpoints.items()},
+    }
+
+
+DIAGNOSTIC_DESCRIPTIONS: tuple[WundergroundDiagnosticEntityDescription, ...] = (
+    WundergroundDiagnosticEntityDescription(
+        key="duplicate_polls_suppressed",
+        name="Kihagyott ismételt lekérdezések",
+        icon="mdi:content-duplicate",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.duplicate_polls_suppressed,
+    ),
+    WundergroundDiagnosticEntityDescription(
+        key="upload_period",
+        name="Becsült feltöltési időköz",
+        icon="mdi:timer-sync-outline",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.upload_period,
+    ),
+    WundergroundDiagnosticEntityDescription(
+        key="open_circuit_breakers",
+        name="Kikapcsolt adatforrások",
+        icon="mdi:electric-switch",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: sum(
+            breaker.state != STATE_CLOSED
+            for breaker in coordinator.circuit_breakers.values()
+        ),
+        attributes_fn=lambda coordinator: {
+            name: breaker.as_dict()
+            for name, breaker in coordinator.circuit_breakers.items()
+        },
+    ),
+    WundergroundDiagnosticEntityDescription(
+        key="observation_fetch_p95",
+        name="Megfigyelés lekérési idő (p95)",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _round(
+            coordinator.request_metrics.get(METRIC_WU_OBSERVATION).latency_ms.percentile(95)
+        ),
+        attributes_fn=lambda coordinator: coordinator.request_metrics.get(
+            METRIC_WU_OBSERVATION
+        ).as_dict(),
+    ),
+    WundergroundDiagnosticEntityDescription(
+        key="forecast_fetch_latency",
+        name="Előrejelzés lekérési idő",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_forecast_latency,
+        attributes_fn=_forecast_attributes,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -204,10 +385,19 @@ async def async_setup_entry(
     """Set up Wunderground PWS sensor entities."""
     coordinator: WundergroundPWSCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
+    entities: list[SensorEntity] = [
         WundergroundPWSSensor(coordinator, description)
         for description in SENSOR_DESCRIPTIONS
+    ]
+    entities.extend(
+        WundergroundDailySensor(coordinator, description)
+        for description in DAILY_DESCRIPTIONS
     )
+    entities.extend(
+        WundergroundPWSDiagnosticSensor(coordinator, description)
+        for description in DIAGNOSTIC_DESCRIPTIONS
+    )
+    async_add_entities(entities)
 
 
 class WundergroundPWSSensor(CoordinatorEntity, SensorEntity):
@@ -223,7 +413,11 @@ class WundergroundPWSSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        if not coordinator.sensor_statistics:
+            # The coordinator imports hourly statistics itself
+            description = replace(description, state_class=None)
         self.entity_description = description
+        self._get_value = attrgetter(description.data_key)
         self._attr_unique_id = f"{coordinator.station_id}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, coordinator.station_id)},
@@ -238,7 +432,7 @@ class WundergroundPWSSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data is None:
             return None
 
-        return self.coordinator.data.get(self.entity_description.data_key)
+        return self._get_value(self.coordinator.data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -247,11 +441,109 @@ class WundergroundPWSSensor(CoordinatorEntity, SensorEntity):
             return None
 
         attrs: dict[str, Any] = {
-            "station_id": self.coordinator.data.get(ATTR_STATION_ID),
-            "last_updated": self.coordinator.data.get(ATTR_LAST_UPDATED),
+            "station_id": self.coordinator.data.station_id,
+            "last_updated": self.coordinator.data.last_updated,
+            "data_age_seconds": self.coordinator.data_age_seconds,
+            "stale": self.coordinator.stale,
         }
 
         if self.entity_description.data_key == ATTR_WIND_BEARING:
-            attrs["compass"] = self.coordinator.data.get(ATTR_WIND_COMPASS)
+            attrs["compass"] = self.coordinator.data.wind_compass
+
+        snapshot_age = self.coordinator.snapshot_age
+        if snapshot_age is not None:
+            attrs["restored_snapshot_age"] = snapshot_age
 
         return attrs
+
+
+class WundergroundDailySensor(CoordinatorEntity, SensorEntity):
+    """Today's min / max / mean of one measurement, kept by the coordinator."""
+
+    entity_description: WundergroundDailyEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: WundergroundPWSCoordinator,
+        description: WundergroundDailyEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        if not coordinator.sensor_statistics:
+            description = replace(description, state_class=None)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.station_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.station_id)},
+            "name": f"Wunderground PWS {coordinator.station_id}",
+            "manufacturer": "Aiasz",
+            "model": "Wunderground PWS v1.3.0",
+        }
+
+    @property
+    def _statistics(self) -> RunningStatistics:
+        """Return today's statistics of the measurement."""
+        daily = self.coordinator.daily_statistics
+        return daily.fields[self.entity_description.data_key]
+
+    @property
+    def native_value(self) -> float | None:
+        """Return today's min / max / mean (None before the first observation)."""
+        value = getattr(self._statistics, self.entity_description.statistic)
+        return round(value, 1) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the day, the sample count and the time of the extreme."""
+        stats = self._statistics
+        attrs: dict[str, Any] = {
+            "date": self.coordinator.daily_statistics.day,
+            "samples": stats.count,
+        }
+        statistic = self.entity_description.statistic
+        if statistic == "min":
+            attrs["time"] = stats.min_at
+        elif statistic == "max":
+            attrs["time"] = stats.max_at
+        elif stats.std_dev is not None:
+            attrs["std_dev"] = round(stats.std_dev, 2)
+        return attrs
+
+
+class WundergroundPWSDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing coordinator internals (counters, timings)."""
+
+    entity_description: WundergroundDiagnosticEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: WundergroundPWSCoordinator,
+        description: WundergroundDiagnosticEntityDescription,
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.station_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.station_id)},
+            "name": f"Wunderground PWS {coordinator.station_id}",
+            "manufacturer": "Aiasz",
+            "model": "Wunderground PWS v1.3.0",
+        }
+
+    @property
+    def native_value(self) -> Any:
+        """Return the diagnostic value."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the API fails: that is when these matter most."""
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the diagnostic attributes, if any."""
+        return self.entity_description.attributes_fn(self.coordinator)
@@ -5,6 +5,8 @@ Verzio: 1.4.1
 """
 from __future__ import annotations
 
+import json
+from collections.abc import Callable, Hashable
 from typing import Any
 
 from homeassistant.components.weather import (
@@ -19,35 +21,13 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfLength,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import (
-    DOMAIN,
-    ATTR_TEMPERATURE,
-    ATTR_HUMIDITY,
-    ATTR_PRESSURE,
-    ATTR_WIND_SPEED,
-    ATTR_WIND_BEARING,
-    ATTR_PRECIPITATION,
-    ATTR_UV_INDEX,
-    ATTR_CONDITION,
-    ATTR_STATION_ID,
-    ATTR_LAST_UPDATED,
-    ATTR_LOCATION_NAME,
-    ATTR_COUNTRY,
-    ATTR_LAT,
-    ATTR_LON,
-    ATTR_DEW_POINT,
-    ATTR_FEELS_LIKE,
-    ATTR_WIND_COMPASS,
-    ATTR_WIND_COMPASS_HU,
-    ATTR_SOLAR_RADIATION,
-    ATTR_CLOUD_BASE,
-    ATTR_ABSOLUTE_HUMIDITY,
-    ATTR_WIND_CHILL,
-)
+from .const import DOMAIN
+from .api import ForecastResult
 from .coordinator import WundergroundPWSCoordinator
 
 
@@ -70,11 +50,11 @@ class WundergroundPWSWeather(CoordinatorEntity, WeatherEntity):
     _attr_native_pressure_unit = UnitOfPressure.HPA
     _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
     _attr_native_precipitation_unit = UnitOfLength.MILLIMETERS
-    _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
 
     def __init__(self, coordinator: WundergroundPWSCoordinator) -> None:
         """Initialize the weather entity."""
         super().__init__(coordinator)
+        self._forecast_coordinator = coordinator.forecast_coordinator
         self._attr_unique_id = f"{coordinator.station_id}_weather"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, coordinator.station_id)},
@@ -82,62 +62,127 @@ class WundergroundPWSWeather(CoordinatorEntity, WeatherEntity):
             "manufacturer": "Aiasz",
             "model": "Wunderground PWS v1.4.1",
         }
+        # Converted Forecast lists by forecast type: (key, list).  The key is
+        # the content hash of the daily forecast, or the payload generation
+        # (+ hour) for the hourly / twice-daily lists built from it.
+        self._forecast_memo: dict[str, tuple[Hashable, list[Forecast] | None]] = {}
+        forecast_data = self._forecast_coordinator.data
+        self._daily_hash = _content_hash(self._forecast_coordinator.forecast)
+        self._result: ForecastResult | None = (
+            forecast_data.result if forecast_data else None
+        )
+        self._generation = 0
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the separately refreshed forecast as well."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._forecast_coordinator.async_add_listener(self._handle_forecast_update)
+        )
+
+    @callback
+    def _handle_forecast_update(self) -> None:
+        """Push a changed forecast to state and to forecast subscribers.
+
+        The coordinator also notifies on failed refreshes and on refreshes
+        served from the HTTP / shared cache; subscribers only get the forecast
+        types whose content actually changed.  Only types that have
+        subscribers are built, so the hourly / twice-daily lists cost nothing
+        unless something listens.
+        """
+        self.async_write_ha_state()
+        changed: list[str] = []
+        daily_hash = _content_hash(self._forecast_coordinator.forecast)
+        if daily_hash != self._daily_hash:
+            self._daily_hash = daily_hash
+            changed.append("daily")
+        data = self._forecast_coordinator.data
+        result = data.result if data else None
+        if result is not self._result:
+            # a new parsed payload; a cache hit returns the same object
+            self._result = result
+            self._generation += 1
+            changed.extend(("hourly", "twice_daily"))
+        if changed:
+            self.hass.async_create_task(self.async_update_listeners(changed))
+
+    def _memoized(
+        self,
+        forecast_type: str,
+        key: Hashable,
+        build: Callable[[], list[Forecast] | None],
+    ) -> list[Forecast] | None:
+        """Return the converted list of *forecast_type*, rebuilt when *key* changes."""
+        memo = self._forecast_memo.get(forecast_type)
+        if memo is None or memo[0] != key:
+            memo = self._forecast_memo[forecast_type] = (key, build())
+        return memo[1]
+
+    @property
+    def supported_features(self) -> WeatherEntityFeature:
+        """Return the forecast types the current forecast source provides."""
+        features = WeatherEntityFeature.FORECAST_DAILY
+        if self._forecast_coordinator.has_hourly:
+            features |= WeatherEntityFeature.FORECAST_HOURLY
+        if self._forecast_coordinator.has_twice_daily:
+            features |= WeatherEntityFeature.FORECAST_TWICE_DAILY
+        return features
 
     @property
     def condition(self) -> str | None:
         """Return the current weather condition."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_CONDITION)
+        return self.coordinator.data.condition
 
     @property
     def native_temperature(self) -> float | None:
         """Return the temperature."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_TEMPERATURE)
+        return self.coordinator.data.temperature
 
     @property
     def humidity(self) -> float | None:
         """Return the humidity."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_HUMIDITY)
+        return self.coordinator.data.humidity
 
     @property
     def native_pressure(self) -> float | None:
         """Return the pressure."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_PRESSURE)
+        return self.coordinator.data.pressure
 
     @property
     def native_wind_speed(self) -> float | None:
         """Return the wind speed."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_WIND_SPEED)
+        return self.coordinator.data.wind_speed
 
     @property
     def wind_bearing(self) -> float | None:
         """Return the wind bearing."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_WIND_BEARING)
+        return self.coordinator.data.wind_bearing
 
     @property
     def native_precipitation(self) -> float | None:
         """Return the precipitation."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_PRECIPITATION)
+        return self.coordinator.data.precipitation
 
     @property
     def uv_index(self) -> float | None:
         """Return the UV index."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(ATTR_UV_INDEX)
+        return self.coordinator.data.uv_index
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -145,31 +190,60 @@ class WundergroundPWSWeather(CoordinatorEntity, WeatherEntity):
         if self.coordinator.data is None:
             return {}
         return {
-            "station_id": self.coordinator.data.get(ATTR_STATION_ID),
-            "location": self.coordinator.data.get(ATTR_LOCATION_NAME),
-            "country": self.coordinator.data.get(ATTR_COUNTRY),
-            "lat": self.coordinator.data.get(ATTR_LAT),
-            "lon": self.coordinator.data.get(ATTR_LON),
-            "last_updated": self.coordinator.data.get(ATTR_LAST_UPDATED),
-            "dew_point": self.coordinator.data.get(ATTR_DEW_POINT),
-            "feels_like": self.coordinator.data.get(ATTR_FEELS_LIKE),
-            "wind_compass": self.coordinator.data.get(ATTR_WIND_COMPASS),
-            "wind_compass_hu": self.coordinator.data.get(ATTR_WIND_COMPASS_HU),
-            "solar_radiation": self.coordinator.data.get(ATTR_SOLAR_RADIATION),
-            "cloud_base": self.coordinator.data.get(ATTR_CLOUD_BASE),
-            "absolute_humidity": self.coordinator.data.get(ATTR_ABSOLUTE_HUMIDITY),
-            "wind_chill": self.coordinator.data.get(ATTR_WIND_CHILL),
+            "station_id": self.coordinator.data.station_id,
+            "location": self.coordinator.data.location_name,
+            "country": self.coordinator.data.country,
+            "lat": self.coordinator.data.lat,
+            "lon": self.coordinator.data.lon,
+            "last_updated": self.coordinator.data.last_updated,
+            "dew_point": self.coordinator.data.dew_point,
+            "feels_like": self.coordinator.data.feels_like,
+            "wind_compass": self.coordinator.data.wind_compass,
+            "wind_compass_hu": self.coordinator.data.wind_compass_hu,
+            "solar_radiation": self.coordinator.data.solar_radiation,
+            "cloud_base": self.coordinator.data.cloud_base,
+            "absolute_humidity": self.coordinator.data.absolute_humidity,
+            "wind_chill": self.coordinator.data.wind_chill,
             "forecast_city": self.coordinator.city or None,
             "forecast_source": self.coordinator.forecast_source or None,
-            "forecast_source_used": self.coordinator.forecast_source_used or None,
+            "forecast_source_used": self._forecast_coordinator.source_used or None,
+            "forecast_ensemble_sources": (
+                list(self._forecast_coordinator.ensemble_sources) or None
+            ),
+            "forecast_uncertainty": self._forecast_uncertainty(),
+            "restored_snapshot_age": self.coordinator.snapshot_age,
+            "data_age_seconds": self.coordinator.data_age_seconds,
+            "stale": self.coordinator.stale,
         }
 
+    def _forecast_uncertainty(self) -> list[dict[str, Any]] | None:
+        """Return the per-day spread of the ensemble members (ensemble mode only)."""
+        if not self._forecast_coordinator.ensemble_sources:
+            return None
+        return [
+            {
+                "datetime": day["datetime"],
+                "sources": day.get("sources"),
+                **{
+                    name: day[f"{name}_spread"]
+                    for name in ("temperature", "templow", "precipitation", "wind_speed")
+                    if f"{name}_spread" in day
+                },
+            }
+            for day in self._forecast_coordinator.forecast
+        ]
+
     async def async_forecast_daily(self) -> list[Forecast] | None:
-        """Return 7-day daily forecast from Open-Meteo."""
-        if not self.coordinator.forecast_data:
+        """Return the 7-day daily forecast from the forecast coordinator."""
+        return self._memoized("daily", self._daily_hash, self._build_daily)
+
+    def _build_daily(self) -> list[Forecast] | None:
+        """Convert the common-format daily forecast to ``Forecast`` dicts."""
+        forecast = self._forecast_coordinator.forecast
+        if not forecast:
             return None
         result: list[Forecast] = []
-        for day in self.coordinator.forecast_data:
+        for day in forecast:
             result.append(
                 Forecast(
                     datetime=day["datetime"],
@@ -182,3 +256,50 @@ class WundergroundPWSWeather(CoordinatorEntity, WeatherEntity):
                 )
             )
         return result
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast (MET.no / Open-Meteo sources)."""
+        # the hours that have passed are cut off, so the hour is in the key
+        return self._memoized(
+            "hourly",
+            (self._generation, dt_util.utcnow().strftime("%Y-%m-%dT%H")),
+            lambda: _to_forecast(self._forecast_coordinator.hourly_forecast),
+        )
+
+    async def async_forecast_twice_daily(self) -> list[Forecast] | None:
+        """Return the day / night forecast (Wunderground source)."""
+        return self._memoized(
+            "twice_daily",
+            self._generation,
+            lambda: _to_forecast(self._forecast_coordinator.twice_daily_forecast),
+        )
+
+
+def _content_hash(entries: list[dict[str, Any]]) -> int:
+    """Return a hash of the content of a common-format forecast list."""
+    return hash(json.dumps(entries, sort_keys=True, default=str))
+
+
+def _to_forecast(entries: list[dict[str, Any]]) -> list[Forecast] | None:
+    """Convert common-format hourly / day-part entries to ``Forecast`` dicts."""
+    if not entries:
+        return None
+    result: list[Forecast] = []
+    for entry in entries:
+        forecast = Forecast(
+            datetime=entry["datetime"],
+            native_temperature=entry.get("temperature"),
+            native_precipitation=entry.get("precipitation"),
+            condition=entry.get("condition"),
+            cloud_coverage=entry.get("cloud_coverage"),
+            humidity=entry.get("humidity"),
+            wind_bearing=entry.get("wind_bearing"),
+            native_wind_speed=entry.get("wind_speed"),
+        )
+        if "is_daytime" in entry:
+            forecast["is_daytime"] = entry["is_daytime"]
+            forecast["precipitation_probability"] = entry.get(
+                "precipitation_probability"
+            )
+        result.append(forecast)
+    return result
@@ -0,0 +1,175 @@
+"""Equivalence of the batch observation conversion with the scalar one.
+
+``batch.enrich_observations`` must return exactly what
+``api.enrich_observation`` returns for every row, on the pure-Python path
+and on the NumPy path alike; results are compared by ``repr`` so that
+``-0.0`` / ``0.0`` and float representation differences count too.
+
+The package ``__init__`` imports Home Assistant, so the package directory is
+registered as a bare package and only the pure modules are imported.
+"""
+from __future__ import annotations
+
+import importlib
+import random
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+PACKAGE_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "wunderground_pws"
+)
+
+# api.py imports aiohttp (a Home Assistant core dependency)
+pytest.importorskip("aiohttp")
+
+if "wunderground_pws" not in sys.modules:
+    _package = types.ModuleType("wunderground_pws")
+    _package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["wunderground_pws"] = _package
+
+api = importlib.import_module("wunderground_pws.api")
+batch_module = importlib.import_module("wunderground_pws.batch")
+
+_BASE = {
+    "stationID": "IKAPOS12",
+    "obsTimeUtc": "2026-04-07T09:42:08Z",
+    "obsTimeLocal": "2026-04-07 11:42:08",
+    "neighborhood": "Kaposvar",
+    "country": "HU",
+    "lat": 46.36,
+    "lon": 17.8,
+    "humidity": 58.0,
+    "winddir": 247,
+    "uv": 4.0,
+    "solarRadiation": 512.4,
+    "imperial": {
+        "temp": 61.3,
+        "heatIndex": 61.3,
+        "dewpt": 46.4,
+        "windSpeed": 6.9,
+        "windGust": 11.4,
+        "pressure": 29.94,
+        "precipRate": 0.0,
+        "precipTotal": 0.02,
+        "elev": 502.0,
+    },
+}
+
+# Fahrenheit readings whose Celsius value sits on a 0.05 boundary, and
+# precipitation right at a 0.005 mm boundary
+_BOUNDARY_TEMPS = [32.09, 33.17, 41.27, -0.41, 50.0, 32.0]
+_BOUNDARY_INCHES = [0.0125 / 25.4, 0.0375 / 25.4]
+
+
+def _row(**changes: Any) -> dict[str, Any]:
+    """Return the base observation with top-level / imperial *changes*."""
+    imperial = {**_BASE["imperial"], **changes.pop("imperial", {})}
+    return {**_BASE, **changes, "imperial": imperial}
+
+
+def _malformed_rows() -> list[dict[str, Any]]:
+    """Rows with missing, textual, NaN and infinite readings."""
+    nan, inf = float("nan"), float("inf")
+    return [
+        _row(imperial={"temp": None, "dewpt": None, "heatIndex": None}),
+        _row(imperial={"temp": "n/a", "windSpeed": "", "pressure": "29.9"}),
+        _row(imperial={"temp": nan, "dewpt": nan}),
+        _row(imperial={"windSpeed": nan, "windGust": inf, "precipRate": nan}),
+        _row(imperial={"temp": inf, "pressure": -inf}),
+        _row(humidity=None, winddir=None, uv=None, solarRadiation=None),
+        _row(humidity="n/a", winddir="SW", uv=nan, solarRadiation="x"),
+        _row(lat="n/a", lon=None),
+        _row(winddir=-11.25, humidity=0),
+        _row(winddir=348.75, humidity=100),
+        {**_row(), "imperial": None},
+        {"stationID": "IEMPTY1"},
+        {},
+    ]
+
+
+def _boundary_rows() -> list[dict[str, Any]]:
+    """Rows whose converted values sit on a rounding boundary."""
+    rows = [
+        _row(imperial={"temp": temp, "dewpt": temp, "heatIndex": temp})
+        for temp in _BOUNDARY_TEMPS
+    ]
+    rows += [
+        _row(imperial={"precipRate": inches, "precipTotal": inches})
+        for inches in _BOUNDARY_INCHES
+    ]
+    # wind chill thresholds: 10 °C and 4.8 km/h
+    rows += [
+        _row(imperial={"temp": 50.0, "windSpeed": 10.0}),
+        _row(imperial={"temp": 49.9, "windSpeed": 4.8 / 1.609344}),
+        _row(imperial={"temp": 20.0, "windSpeed": 2.983}),
+    ]
+    # dew point above the temperature (no cloud base)
+    rows.append(_row(imperial={"temp": 40.0, "dewpt": 41.0}))
+    return rows
+
+
+def _random_rows(count: int, seed: int) -> list[dict[str, Any]]:
+    """Return *count* rows with random readings."""
+    rng = random.Random(seed)
+    return [
+        _row(
+            humidity=round(rng.uniform(5, 100)),
+            winddir=rng.randrange(360),
+            uv=rng.choice((0.0, round(rng.uniform(0, 11), 1))),
+            solarRadiation=round(rng.uniform(0, 1100), 1),
+            imperial={
+                "temp": round(rng.uniform(-20, 105), rng.choice((0, 1, 2))),
+                "dewpt": round(rng.uniform(-30, 80), 1),
+                "heatIndex": round(rng.uniform(-20, 110), 1),
+                "windSpeed": round(rng.uniform(0, 40), 1),
+                "windGust": round(rng.uniform(0, 60), 1),
+                "pressure": round(rng.uniform(28.5, 31.0), 2),
+                "precipRate": rng.choice((0, 0, round(rng.uniform(0, 2), 2))),
+                "precipTotal": round(rng.uniform(0, 3), 2),
+            },
+        )
+        for _ in range(count)
+    ]
+
+
+def _rows() -> list[dict[str, Any]]:
+    """Return enough rows for the NumPy path, edge cases included."""
+    rows = _malformed_rows() + _boundary_rows() + _random_rows(500, seed=1)
+    assert len(rows) >= batch_module._NUMPY_MIN_BATCH
+    return rows
+
+
+def _assert_equivalent(rows: list[dict[str, Any]]) -> None:
+    """Assert the batch result equals the scalar one, row by row."""
+    result = batch_module.enrich_observations(rows)
+    assert len(result) == len(rows)
+    for row, observation in zip(rows, result):
+        assert repr(observation) == repr(api.enrich_observation(row)), row
+
+
+def test_pure_python_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without NumPy the columnar pure-Python path matches the scalar code."""
+    monkeypatch.setattr(batch_module, "np", None)
+    _assert_equivalent(_rows())
+
+
+def test_small_batch() -> None:
+    """Batches below the NumPy threshold match the scalar code."""
+    _assert_equivalent(_malformed_rows() + _boundary_rows())
+
+
+def test_numpy_path() -> None:
+    """The NumPy path matches the scalar code, boundary rows included."""
+    pytest.importorskip("numpy")
+    if batch_module.np is None:
+        pytest.skip("batch was imported without NumPy")
+    _assert_equivalent(_rows())
+
+
+def test_empty_batch() -> None:
+    """An empty batch gives an empty list."""
+    assert batch_module.enrich_observations([]) == []